@@ -56,6 +56,13 @@ export class ValidationService {
           this.logger.error('Found errors with invalid taskId:', invalidErrors);
         }
 
+        // A valid file can still carry warnings (e.g. references the Python service
+        // could not resolve); they are stored with the seeding errors
+        const warnings = this.toTaskErrors(
+          data.taskId,
+          (data.result.errors ?? []) as PythonValidationError[],
+        );
+
         // Execute operations in a transaction to ensure consistency
         await this.prismaService.$transaction(async (tx) => {
           // First update the task
@@ -70,9 +77,9 @@ export class ValidationService {
           });
 
           // Only create task errors if there are any
-          if (errors.length > 0) {
+          if (errors.length + warnings.length > 0) {
             await tx.taskError.createMany({
-              data: errors,
+              data: [...warnings, ...errors],
             });
           }
         });
@@ -82,16 +89,10 @@ export class ValidationService {
         );
 
         // Convert Python validation errors to TaskError format
-        const validationErrors = (
-          data.result.errors as PythonValidationError[]
-        ).map((error, index: number) => ({
-          taskId: data.taskId,
-          row: error.row || index + 1,
-          column: error.column || null,
-          message: error.message || JSON.stringify(error),
-          severity: (error.severity as TaskSeverity) || TaskSeverity.ERROR,
-          createdAt: new Date(),
-        }));
+        const validationErrors = this.toTaskErrors(
+          data.taskId,
+          data.result.errors as PythonValidationError[],
+        );
 
         // Execute operations in a transaction to ensure consistency
         await this.prismaService.$transaction(async (tx) => {
@@ -124,6 +125,17 @@ export class ValidationService {
     }
   }
 
+  private toTaskErrors(taskId: string, errors: PythonValidationError[]) {
+    return errors.map((error, index: number) => ({
+      taskId,
+      row: error.row || index + 1,
+      column: error.column || null,
+      message: error.message || JSON.stringify(error),
+      severity: (error.severity as TaskSeverity) || TaskSeverity.ERROR,
+      createdAt: new Date(),
+    }));
+  }
+
   // GET /status -> list of tasks
   // @GetUser() user: User
   async getAllTasks(
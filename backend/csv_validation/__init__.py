@@ -0,0 +1,25 @@
+from .engine import (
+    DUPLICATE_ROW_MESSAGE,
+    DUPLICATE_ROWS_LISTED,
+    DUPLICATE_VALUE_MESSAGE,
+    Issue,
+    ValidationPlan,
+    canonical_strings,
+    compile_plan,
+    compile_plans,
+    duplicate_issues,
+    row_issues,
+)
+
+__all__ = [
+    "DUPLICATE_ROW_MESSAGE",
+    "DUPLICATE_ROWS_LISTED",
+    "DUPLICATE_VALUE_MESSAGE",
+    "Issue",
+    "ValidationPlan",
+    "canonical_strings",
+    "compile_plan",
+    "compile_plans",
+    "duplicate_issues",
+    "row_issues",
+]
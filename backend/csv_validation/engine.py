@@ -0,0 +1,291 @@
+"""
+Declarative CSV validation engine shared by the python-service consumer and the Django
+data-parser.
+
+Each service describes its CSV categories as config dicts (expected_columns,
+required_columns, format_checks, ...). compile_plan turns one config into a
+ValidationPlan: the ordered list of checks that config actually uses, each a vectorized
+pass over whole columns. Checks report neutral Issue tuples; each service turns them into
+its own error format.
+"""
+
+from collections import namedtuple
+
+import pandas as pd
+
+# row is 1-based; 0 means the issue concerns the whole file or column
+Issue = namedtuple("Issue", ["row", "column", "message"])
+
+EMAIL_PATTERN = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
+UUID_HEX_PATTERN = r"^[0-9a-fA-F]{32}$"
+VALID_BOOLEANS = [True, False, 1, 0, "True", "False", "1", "0"]
+
+# Row numbers listed per duplicate issue; further rows are only counted
+DUPLICATE_ROWS_LISTED = 20
+DUPLICATE_VALUE_MESSAGE = "Duplicate value '{value}' at rows {rows}"
+DUPLICATE_ROW_MESSAGE = "Duplicate row at {rows}"
+
+
+# --- Helpers ---
+
+
+def string_values(series):
+    """Series of the str cells only; every other cell (NaN, numbers, bools) becomes NaN."""
+    try:
+        # .str ops on object columns return NaN for non-str cells
+        return series.where(series.str.len().notna())
+    except AttributeError:
+        # No .str accessor: the column holds no strings at all
+        return pd.Series(pd.NA, index=series.index, dtype="object")
+
+
+def canonical_strings(series):
+    """
+    Values as strings, with empty cells left as NaN. pandas infers dtypes per file (and per
+    chunk), so 7, 7.0 and "7" must be compared as the same text.
+    """
+    present = series.notna()
+    text = series.astype(str)
+    if pd.api.types.is_float_dtype(series):
+        integral = present & (series % 1 == 0)
+        text[integral] = series[integral].astype("int64").astype(str)
+    return text.where(present)
+
+
+def row_issues(series, mask, column, message):
+    """One Issue per row where `mask` is True. `message` may reference the cell as {value}."""
+    invalid = series[mask.fillna(False).astype(bool)]
+    return [
+        Issue(idx + 1, column, message.format(value=value))
+        for idx, value in zip(invalid.index.tolist(), invalid.tolist())
+    ]
+
+
+def duplicate_groups(keys):
+    """
+    {key: (row indexes, count)} for every key occurring more than once, from a single
+    groupby over the repeated keys. Empty keys are left to the required-columns check.
+    """
+    repeated = keys[keys.duplicated(keep=False)].dropna()
+    if repeated.empty:
+        return {}
+    rows = repeated.index.to_series().groupby(repeated, sort=False).agg(list)
+    return {
+        key: (group_rows[:DUPLICATE_ROWS_LISTED], len(group_rows))
+        for key, group_rows in rows.items()
+    }
+
+
+def duplicate_issues(groups, column, message):
+    """One Issue per duplicate group; `message` gets {value} and the {rows} listing."""
+    issues = []
+    for key, (rows, count) in groups.items():
+        listed = ", ".join(str(row + 1) for row in rows)
+        if count > len(rows):
+            listed += f" and {count - len(rows)} more"
+        issues.append(Issue(int(rows[0]) + 1, column, message.format(value=key, rows=listed)))
+    issues.sort(key=lambda issue: issue.row)
+    return issues
+
+
+# --- Checks: each takes the frame and its config entry ---
+
+
+def check_headers(df, expected_columns):
+    actual_columns = df.columns.tolist()
+    missing = [col for col in expected_columns if col not in actual_columns]
+    extra = [col for col in actual_columns if col not in expected_columns]
+    issues = []
+    if missing:
+        issues.append(Issue(0, None, f"Missing columns: {', '.join(missing)}"))
+    if extra:
+        issues.append(Issue(0, None, f"Extra columns: {', '.join(extra)}"))
+    return issues
+
+
+def check_empty(df, required_columns):
+    issues = []
+    for col in required_columns:
+        if col not in df.columns:
+            continue
+        missing = df[col].isnull() | (df[col].astype(str).str.strip() == "")
+        issues.extend(row_issues(df[col], missing, col, "Missing value"))
+    return issues
+
+
+def check_formats(df, format_checks):
+    issues = []
+    for col, format_type in format_checks.items():
+        if col not in df.columns:
+            continue
+        series = df[col]
+        if format_type == "email":
+            valid = string_values(series).str.strip().str.match(EMAIL_PATTERN)
+            invalid = ~valid.fillna(False).astype(bool)
+            issues.extend(row_issues(series, invalid, col, "Invalid email format"))
+
+        elif format_type == "uuid":
+            # Same normalization uuid.UUID applies before parsing the hex digits
+            hex_digits = (
+                series.astype(str)
+                .str.replace("urn:", "", regex=False)
+                .str.replace("uuid:", "", regex=False)
+                .str.strip("{}")
+                .str.replace("-", "", regex=False)
+            )
+            invalid = ~hex_digits.str.match(UUID_HEX_PATTERN).fillna(False).astype(bool)
+            issues.extend(row_issues(series, invalid, col, "Invalid UUID {value}"))
+
+        elif format_type == "boolean":
+            invalid = ~series.isin(VALID_BOOLEANS)
+            issues.extend(row_issues(series, invalid, col, "Invalid boolean: '{value}'"))
+
+        elif str(format_type).lower() == "string":
+            invalid = string_values(series).isna()
+            issues.extend(row_issues(series, invalid, col, "Invalid string: '{value}'"))
+    return issues
+
+
+def check_data_types(df, type_checks):
+    issues = []
+    for col, expected_type in type_checks.items():
+        if col not in df.columns:
+            continue
+        if expected_type == "numeric" and not pd.api.types.is_numeric_dtype(df[col]):
+            issues.append(Issue(0, None, f"Column '{col}' must be numeric"))
+        elif expected_type == "string" and not pd.api.types.is_string_dtype(df[col]):
+            issues.append(Issue(0, None, f"Column '{col}' must be a string"))
+    return issues
+
+
+def check_value_ranges(df, value_ranges):
+    issues = []
+    for col, allowed_values in value_ranges.items():
+        if col not in df.columns:
+            continue
+        invalid = ~df[col].isin(allowed_values)
+        issues.extend(row_issues(df[col], invalid, col, "Invalid value '{value}'"))
+    return issues
+
+
+def check_lengths(df, length_checks):
+    issues = []
+    for col, max_length in length_checks.items():
+        if col not in df.columns:
+            continue
+        # Numeric cells (e.g. phone numbers) are measured as their text form
+        lengths = df[col].astype("string").str.len()
+        message = f"Value too long: '{{value}}' (max {max_length} chars)"
+        issues.extend(row_issues(df[col], lengths > max_length, col, message))
+    return issues
+
+
+NUMERICAL_CONSTRAINTS = {
+    # constraint -> (violation mask over the numeric values, message)
+    "positive_integer": (
+        lambda values: values <= 0,
+        "Invalid value: '{value}' (must be a non negative integer)",
+    ),
+    "non_negative_integer": (
+        lambda values: (values < 0) | (values % 1 != 0),
+        "Invalid value: '{value}' (must be a non negative integer)",
+    ),
+}
+
+
+def check_numerical_constraints(df, numerical_checks):
+    issues = []
+    for col, constraint in numerical_checks.items():
+        if col not in df.columns:
+            continue
+        series = df[col]
+        values = pd.to_numeric(series, errors="coerce")
+        # Cells that are present but do not parse (blank cells are check_empty's concern)
+        not_numeric = values.isna() & (series.astype("string").str.strip() != "").fillna(False)
+        if not_numeric.any():
+            message = f"Invalid value: '{{value}}' (column '{col}' must be numeric)"
+            issues.extend(row_issues(series, not_numeric, col, message))
+        if constraint in NUMERICAL_CONSTRAINTS:
+            violates, message = NUMERICAL_CONSTRAINTS[constraint]
+            issues.extend(row_issues(series, values.notna() & violates(values), col, message))
+    return issues
+
+
+def check_unique(df, unique_columns):
+    issues = []
+    for col in unique_columns:
+        if col not in df.columns:
+            continue
+        groups = duplicate_groups(canonical_strings(df[col]))
+        issues.extend(duplicate_issues(groups, col, DUPLICATE_VALUE_MESSAGE))
+    return issues
+
+
+def check_duplicate_rows(df):
+    # Rows are compared through a 64-bit hash of their contents as text, like the streamed
+    # chunks in python-service
+    rows = df.apply(canonical_strings)
+    groups = duplicate_groups(pd.util.hash_pandas_object(rows, index=False))
+    return duplicate_issues(groups, "All", DUPLICATE_ROW_MESSAGE)
+
+
+# --- Plans ---
+
+# Per-row checks in execution order, keyed by the config entry that enables them. They
+# judge every row on its own, so they can also run chunk by chunk.
+ROW_CHECKS = [
+    ("required_columns", check_empty),
+    ("format_checks", check_formats),
+    ("type_checks", check_data_types),
+    ("value_ranges", check_value_ranges),
+    ("length_checks", check_lengths),
+    ("numerical_checks", check_numerical_constraints),
+]
+
+
+class ValidationPlan:
+    """
+    The checks one config needs, compiled once. Checks whose config entry is missing or
+    empty are dropped up front. The header check short-circuits everything else, and `run`
+    stops early once `max_issues` issues have been found.
+    """
+
+    def __init__(self, config):
+        self.expected_columns = config["expected_columns"]
+        self.row_steps = [
+            (check, config[key]) for key, check in ROW_CHECKS if config.get(key)
+        ]
+        self.unique_columns = config.get("unique_columns", [])
+
+    def check_header(self, df):
+        return check_headers(df, self.expected_columns)
+
+    def check_rows(self, df, max_issues=None):
+        issues = []
+        for check, spec in self.row_steps:
+            issues.extend(check(df, spec))
+            if max_issues is not None and len(issues) >= max_issues:
+                break
+        return issues
+
+    def check_file(self, df):
+        """Checks that compare rows with each other (uniqueness, duplicate rows)."""
+        return check_unique(df, self.unique_columns) + check_duplicate_rows(df)
+
+    def run(self, df, max_issues=None):
+        issues = self.check_header(df)
+        if issues:
+            return issues
+        issues = self.check_rows(df, max_issues)
+        if max_issues is None or len(issues) < max_issues:
+            issues.extend(self.check_file(df))
+        return issues
+
+
+def compile_plan(config):
+    return ValidationPlan(config)
+
+
+def compile_plans(configs):
+    """{category: ValidationPlan} for a service's CONFIGS."""
+    return {category: compile_plan(config) for category, config in configs.items()}
@@ -1,3 +1,4 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import HttpResponseForbidden
 from decouple import config
 
@@ -6,13 +7,27 @@ class RestrictAPIMiddleware:
     API_KEY = config("PARSER_API_KEY")
     PROTECTED_PATH = "/api/validate-csv/"
 
+    # Async-capable, so Django does not push every request through a thread under ASGI
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.reject(request) or self.get_response(request)
+
+    async def __acall__(self, request):
+        return self.reject(request) or await self.get_response(request)
+
+    def reject(self, request):
         # Check if request path starts with the protected path
         if request.path.startswith(self.PROTECTED_PATH):
             if request.headers.get("PARSER-API-KEY") != self.API_KEY:
 
                 return HttpResponseForbidden("Invalid or missing API key", self.API_KEY, request.headers.get('PARSER_API_KEY'))
-        return self.get_response(request)
+        return None
@@ -0,0 +1,183 @@
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+from .utils.csv_validator import validate_csv, CONFIGS
+
+
+class ValidationPoolSaturatedError(Exception):
+    """Raised when every worker is busy and the pending queue is full."""
+
+
+def _init_worker() -> None:
+    # Workers are owned by the server process; let it decide when they stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+
+# An upload's contents, or the path of the temporary file it spilled to
+Source = Union[bytes, str]
+
+
+def run_validation(source: Source, category: str) -> dict:
+    """Worker process entry point."""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    return validate_csv(source, CONFIGS[category])
+
+
+def _discard(source: Source) -> None:
+    if isinstance(source, str):
+        with suppress(FileNotFoundError):
+            os.unlink(source)
+
+
+@dataclass(slots=True)
+class ValidationTask:
+    """A background validation; payload() is what the task endpoints return."""
+
+    task_id: str
+    category: str
+    future: asyncio.Future
+    finished_at: Optional[float] = None
+
+    @property
+    def status(self) -> str:
+        if not self.future.done():
+            return "pending"
+        return "failed" if self.future.exception() is not None else "done"
+
+    def payload(self) -> dict:
+        payload = {"taskId": self.task_id, "category": self.category, "status": self.status}
+        if self.status == "done":
+            payload.update(self.future.result())
+        elif self.status == "failed":
+            payload["error"] = str(self.future.exception()) or "Validation worker failed"
+        return payload
+
+
+class ValidationPool:
+    """
+    Process pool for CSV validation with admission control.
+
+    pandas work would otherwise block the ASGI event loop (or hold a WSGI thread for the
+    whole parse). Uploads run in `max_workers` spawned processes instead; up to `max_pending`
+    further uploads may wait for a free worker, anything beyond that is rejected with
+    ValidationPoolSaturatedError. A slot is held until the worker is done with the upload,
+    even if the client stopped waiting for it. Uploads that spilled to disk are passed by
+    path and their file is deleted when the slot is released (or the upload is rejected).
+
+    Background tasks need the long-lived event loop of an ASGI server; they are kept for
+    `task_ttl` seconds after they finish so clients can collect the result, and live in this
+    process only.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, task_ttl: float):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.task_ttl = task_ttl
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Slots are released from the executor's callback thread
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._tasks: Dict[str, ValidationTask] = {}
+
+    def _start(self) -> None:
+        # spawn, not fork: the parent runs the event loop and asgiref's thread pools
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        logging.info(
+            f"Validation pool started with {self.max_workers} workers "
+            f"and {self.max_pending} pending slots"
+        )
+
+    async def validate(self, source: Source, category: str) -> dict:
+        self._admit(source)
+        return await self._run(source, category)
+
+    def submit(self, source: Source, category: str) -> ValidationTask:
+        """Validate in the background; the result is collected later with get()."""
+        self._expire()
+        self._admit(source)
+        task = ValidationTask(
+            task_id=str(uuid.uuid4()),
+            category=category,
+            future=asyncio.ensure_future(self._run(source, category)),
+        )
+        task.future.add_done_callback(lambda _: self._finish(task))
+        self._tasks[task.task_id] = task
+        return task
+
+    def get(self, task_id: str) -> Optional[ValidationTask]:
+        self._expire()
+        return self._tasks.get(task_id)
+
+    def _admit(self, source: Source) -> None:
+        # Slots are taken synchronously so back-to-back submissions cannot overshoot
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_pending:
+                _discard(source)
+                raise ValidationPoolSaturatedError(
+                    f"All {self.max_workers} validation workers are busy "
+                    f"and {self.max_pending} uploads are already waiting"
+                )
+            if self._executor is None:
+                self._start()
+            self._in_flight += 1
+
+    def _release(self, source: Source) -> None:
+        _discard(source)
+        with self._lock:
+            self._in_flight -= 1
+
+    async def _run(self, source: Source, category: str) -> dict:
+        executor = self._executor
+        try:
+            try:
+                future = executor.submit(run_validation, source, category)
+            except BaseException:
+                self._release(source)
+                raise
+            future.add_done_callback(lambda _: self._release(source))
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); the executor is unusable from now on
+            if executor is self._executor:
+                logging.error("Validation worker died, restarting the pool")
+                self._restart()
+            raise
+
+    def _finish(self, task: ValidationTask) -> None:
+        task.finished_at = time.monotonic()
+        if task.future.exception() is not None:
+            logging.error(f"Validation task {task.task_id} failed: {task.future.exception()!r}")
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.task_ttl
+        expired = [
+            task_id
+            for task_id, task in self._tasks.items()
+            if task.finished_at is not None and task.finished_at < cutoff
+        ]
+        for task_id in expired:
+            del self._tasks[task_id]
+
+    def _restart(self) -> None:
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._start()
@@ -0,0 +1,75 @@
+import io
+import os
+import tempfile
+from contextlib import suppress
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+
+
+class SpilledUploadedFile(UploadedFile):
+    """
+    An upload that outgrew CSV_UPLOAD_SPOOL_SIZE and lives in a named temporary file. The
+    file is deleted on close unless release() handed it over to someone else.
+    """
+
+    released = False
+
+    def temporary_file_path(self):
+        return self.file.name
+
+    def release(self):
+        """Keep the file on close; the caller now owns its path and must delete it."""
+        self.released = True
+        return self.file.name
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            if not self.released:
+                with suppress(FileNotFoundError):
+                    os.unlink(self.file.name)
+
+
+class SpooledFileUploadHandler(FileUploadHandler):
+    """
+    Buffers each uploaded file in memory up to CSV_UPLOAD_SPOOL_SIZE bytes, so typical
+    uploads never touch the disk. Larger ones spill to a named temporary file, which the
+    validation workers can read by path instead of receiving the contents.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file = io.BytesIO()
+        self.spilled = False
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self.spilled and start + len(raw_data) > settings.CSV_UPLOAD_SPOOL_SIZE:
+            spill = tempfile.NamedTemporaryFile(
+                suffix=".upload", dir=settings.FILE_UPLOAD_TEMP_DIR, delete=False
+            )
+            spill.write(self.file.getvalue())
+            self.file = spill
+            self.spilled = True
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        self.file.seek(0)
+        file_class = SpilledUploadedFile if self.spilled else UploadedFile
+        return file_class(
+            file=self.file,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra,
+        )
+
+    def upload_interrupted(self):
+        if hasattr(self, "file"):
+            self.file.close()
+            if self.spilled:
+                with suppress(FileNotFoundError):
+                    os.unlink(self.file.name)
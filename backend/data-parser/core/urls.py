@@ -1,20 +1,25 @@
 from django.urls import path
-from .views import (
-    validate_classroom_csv_view,
-    validate_course_csv_view,
-    validate_department_csv_view,
-    validate_sgcourse_csv_view,
-    validate_student_csv_view,
-    validate_studentgroup_csv_view,
-    validate_teacher_csv_view,
-)
+from .views import validate_csv_view, validation_task_stream_view, validation_task_view
+
+# URL segment -> CONFIGS key
+CATEGORIES = {
+    "department": "DEPARTMENT",
+    "teacher": "TEACHER",
+    "course": "COURSE",
+    "student": "STUDENT",
+    "studentGroup": "STUDENTGROUP",
+    "classroom": "CLASSROOM",
+    "sgcourse": "SGCOURSE",
+}
 
 urlpatterns = [
-    path("department/", validate_department_csv_view, name="validate_csv"),
-    path("teacher/", validate_teacher_csv_view, name="validate_csv"),
-    path("course/", validate_course_csv_view, name="validate_csv"),
-    path("student/", validate_student_csv_view, name="validate_csv"),
-    path("studentGroup/", validate_studentgroup_csv_view, name="validate_csv"),
-    path("classroom/", validate_classroom_csv_view, name="validate_csv"),
-    path("sgcourse/", validate_sgcourse_csv_view, name="validate_csv"),
+    path(f"{segment}/", validate_csv_view, {"category": category}, name="validate_csv")
+    for segment, category in CATEGORIES.items()
+] + [
+    path("tasks/<uuid:task_id>/", validation_task_view, name="validation_task"),
+    path(
+        "tasks/<uuid:task_id>/stream/",
+        validation_task_stream_view,
+        name="validation_task_stream",
+    ),
 ]
@@ -1,224 +1,57 @@
 # 1: Import libraries
+import sys
+from pathlib import Path
+
 import pandas as pd
-import numpy as np
-import re
 
+# Shared validation engine: backend/csv_validation, copied next to manage.py in the image
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from csv_validation import compile_plan
 
-# 2: Function to read CSV file
-def read_csv(file_path, delimiter=",", encoding="utf-8"):
+
+# 2: Function to read CSV file, from a path or an open file object
+def read_csv(source, delimiter=",", encoding="utf-8"):
     try:
-        df = pd.read_csv(file_path, delimiter=delimiter, encoding=encoding)
+        df = pd.read_csv(source, delimiter=delimiter, encoding=encoding)
         return df, []
     except Exception as e:
         return None, [f"Failed to read CSV: {str(e)}"]
 
 
-# 3: Function to check headers
-def check_headers(df, expected_columns):
-    actual_columns = df.columns.tolist()
-    missing = [col for col in expected_columns if col not in actual_columns]
-    extra = [col for col in actual_columns if col not in expected_columns]
-    errors = []
-    if missing:
-        errors.append(f"Missing columns: {', '.join(missing)}")
-    if extra:
-        errors.append(f"Extra columns: {', '.join(extra)}")
-    return errors
-
-
-def check_data_types(df, type_checks):
-    errors = []
-    for col, expected_type in type_checks.items():
-        if col not in df.columns:
-            continue
-        if expected_type == "numeric":
-            if not pd.api.types.is_numeric_dtype(df[col]):
-                errors.append(f"Column '{col}' must be numeric")
-        elif expected_type == "string":
-            if not pd.api.types.is_string_dtype(df[col]):
-                errors.append(f"Column '{col}' must be a string")
-    return errors
-
-
-# 4: Function to check for empty values
-def check_empty(df, required_columns):
-    errors = []
-    for col in required_columns:
-        if col not in df.columns:
-            continue
-        # missing = df[df[col].isnull()]
-        missing = df[df[col].isnull() | (df[col].astype(str).str.strip() == "")]
-        for idx in missing.index:
-            errors.append(f"Missing value in row {idx+1}, column '{col}'")
-    return errors
-
-
-# 5: Helper function to validate email format
-def validate_email(email):
-    if pd.isnull(email) or not isinstance(email, str):
-        return False
-    email = email.strip()
-    pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-    return bool(re.match(pattern, email))
-
-
-# 6: Function to check format-specific validations
-# def check_formats(df, format_checks):
-#     errors = []
-#     for col, format_type in format_checks.items():
-#         if col not in df.columns:
-#             continue
-#         if format_type == "email":
-#             invalid = df[~df[col].apply(validate_email)]
-#             for idx, row in invalid.iterrows():
-#                 errors.append(f"Invalid email format in row {idx+1}: '{row[col]}'")
-#         if format_type == 'boolean':
-#             invalid = df[~df[col].apply(lambda x: isinstance(x, bool))]
-#             for idx, row in invalid.iterrows():
-#                 errors.append(f"Invalid boolean format in row {idx+1}: '{row[col]}'")
-#     return errors
-import uuid
-
-
-def check_formats(df, format_checks):
-    errors = []
-    for col, format_type in format_checks.items():
-        if col not in df.columns:
-            continue
-        if format_type == "email":
-            invalid = df[~df[col].apply(validate_email)]
-            for idx, row in invalid.iterrows():
-                errors.append(f"Invalid email format in row {idx+1}: '{row[col]}'")
-        elif format_type == "uuid":
-
-            def validate_uuid(value):
-                try:
-                    uuid.UUID(str(value))
-                    return True
-                except ValueError:
-                    return False
+# 3: Engine issues as this service's error strings
+def format_issue(issue):
+    if issue.row == 0:
+        return issue.message
+    return f"Row {issue.row}, column '{issue.column}': {issue.message}"
 
-            invalid = df[~df[col].apply(validate_uuid)]
-            for idx, row in invalid.iterrows():
-                errors.append(
-                    f"Invalid UUID in row {idx+1}, column '{col}': '{row[col]}'"
-                )
-        elif format_type == "boolean":
-            valid_bools = [True, False, 1, 0, "True", "False", "1", "0"]
-            invalid = df[~df[col].isin(valid_bools)]
-            for idx, row in invalid.iterrows():
-                errors.append(
-                    f"Invalid boolean in row {idx+1}, column '{col}': '{row[col]}'"
-                )
-    return errors
 
-
-# 7: Function to check unique constraints
-def check_unique(df, unique_columns):
-    errors = []
-    for col in unique_columns:
-        if col not in df.columns:
-            continue
-        duplicates = df[df.duplicated(subset=[col], keep=False)]
-        if not duplicates.empty:
-            dup_values = duplicates[col].unique()
-            for val in dup_values:
-                rows = duplicates[duplicates[col] == val].index.tolist()
-                errors.append(
-                    f"Duplicate value '{val}' in column '{col}' at rows {', '.join(map(str, [r+1 for r in rows]))}"
-                )
-    return errors
-
-
-# 8: Function to check value ranges
-def check_value_ranges(df, value_ranges):
-    errors = []
-    for col, allowed_values in value_ranges.items():
-        if col not in df.columns:
-            continue
-        invalid = df[~df[col].isin(allowed_values)]
-        for idx, row in invalid.iterrows():
-            errors.append(f"Invalid value '{row[col]}' in row {idx+1}, column '{col}'")
-    return errors
-
-
-# 9: Function to check string lengths
-def check_lengths(df, length_checks):
-    errors = []
-    for col, max_length in length_checks.items():
-        if col not in df.columns:
-            continue
-        too_long = df[df[col].str.len() > max_length]
-        for idx, row in too_long.iterrows():
-            errors.append(
-                f"Value too long in row {idx+1}, column '{col}': '{row[col]}' (max {max_length} chars)"
-            )
-    return errors
-
-
-# 10: Function to check numerical constraints
-def check_numerical_constraints(df, numerical_checks):
-    errors = []
-    for col, constraint in numerical_checks.items():
-        if col not in df.columns:
-            continue
-        # First, ensure the column is numeric
-        if not pd.api.types.is_numeric_dtype(df[col]):
-            errors.append(f"Column '{col}' must be numeric")
-            continue
-        # Then, apply the constraint
-        if constraint == "positive_integer":
-            invalid = df[df[col] <= 0]  # Changed to <= 0 to exclude zero
-            for idx, row in invalid.iterrows():
-                errors.append(
-                    f"Invalid value in row {idx+1}, column '{col}': '{row[col]}' (must be a non negative integer)"
-                )
-    return errors
+def parse(df) -> list[dict]:
+    return df.to_dict(orient="records")
 
 
-# 11: Function to check for duplicate rows
-def check_duplicate_rows(df):
-    duplicates = df[df.duplicated(keep=False)]
-    if not duplicates.empty:
-        errors = []
-        for idx in duplicates.index:
-            errors.append(f"Duplicate row at {idx+1}")
-        return errors
-    return []
+# Compiled plans, keyed by config identity (the configs are module constants)
+_plans = {}
 
 
-def parse(df) -> list[dict]:
-    return df.to_dict(orient="records")
+def plan_for(config):
+    plan = _plans.get(id(config))
+    if plan is None:
+        plan = _plans[id(config)] = compile_plan(config)
+    return plan
 
 
-# 12: Pipeline function to validate CSV
-def validate_csv(file_path, config):
+# 4: Pipeline function to validate CSV
+def validate_csv(source, config):
     df, read_errors = read_csv(
-        file_path,
+        source,
         delimiter=config.get("delimiter", ","),
         encoding=config.get("encoding", "utf-8"),
     )
     if df is None:
         return {"success": False, "errors": read_errors}
 
-    errors = read_errors
-
-    # Check headers first
-    header_errors = check_headers(df, config["expected_columns"])
-    errors.extend(header_errors)
-
-    # Proceed with other checks only if headers are correct
-    if not header_errors:
-        errors.extend(check_empty(df, config.get("required_columns", [])))
-        errors.extend(check_formats(df, config.get("format_checks", {})))
-        errors.extend(check_data_types(df, config.get("type_checks", {})))
-        errors.extend(check_unique(df, config.get("unique_columns", [])))
-        errors.extend(check_value_ranges(df, config.get("value_ranges", {})))
-        errors.extend(check_lengths(df, config.get("length_checks", {})))
-        errors.extend(
-            check_numerical_constraints(df, config.get("numerical_checks", {}))
-        )
-        errors.extend(check_duplicate_rows(df))
+    # Headers are checked first; the other checks only run if they are correct
+    errors = [format_issue(issue) for issue in plan_for(config).run(df)]
 
     success = len(errors) == 0
     data = []
@@ -1,128 +1,90 @@
+import asyncio
 import json
-from django.http import JsonResponse
-from django.views.decorators.csrf import csrf_exempt
-from .utils.csv_validator import validate_csv, CONFIGS
-import tempfile
 
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from .pool import ValidationPool, ValidationPoolSaturatedError
+from .uploads import SpilledUploadedFile
 
-@csrf_exempt
-def validate(csv_file, config):
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as temp_file:
-        for chunk in csv_file.chunks():
-            temp_file.write(chunk)
-        temp_file_path = temp_file.name
+# Seconds between status lines while a streamed task is still running
+STREAM_HEARTBEAT = 15
 
-    # Run validation
-    result = validate_csv(temp_file_path, config)
+validation_pool = ValidationPool(
+    max_workers=settings.CSV_WORKERS,
+    max_pending=settings.CSV_MAX_PENDING,
+    task_ttl=settings.CSV_TASK_TTL,
+)
 
-    # Clean up temporary file
-    import os
 
-    os.unlink(temp_file_path)
-
-    return JsonResponse(result)
-
-
-@csrf_exempt
-def validate_teacher_csv_view(request):
+async def validate_csv_view(request, category):
     if request.method != "POST":
         return JsonResponse({"error": "Only POST requests are allowed"}, status=405)
 
     # Check for required fields
     if "csv_file" not in request.FILES:
         return JsonResponse({"error": "Missing csv_file "}, status=400)
-    # Extract file and config
-    csv_file = request.FILES["csv_file"]
-    config = CONFIGS["TEACHER"]
-
-    return validate(csv_file, config)
-
 
-@csrf_exempt
-def validate_department_csv_view(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Only POST requests are allowed"}, status=405)
-
-    # Check for required fields
-    if "csv_file" not in request.FILES:
-        return JsonResponse({"error": "Missing csv_file "}, status=400)
-    # Extract file and config
+    # core.uploads.SpooledFileUploadHandler has buffered the upload: small ones are sent to
+    # the worker as bytes, spilled ones by path and the pool deletes the file afterwards
     csv_file = request.FILES["csv_file"]
-    config = CONFIGS["DEPARTMENT"]
-
-    return validate(csv_file, config)
-
-
-@csrf_exempt
-def validate_course_csv_view(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Only POST requests are allowed"}, status=405)
-
-    # Check for required fields
-    if "csv_file" not in request.FILES:
-        return JsonResponse({"error": "Missing csv_file "}, status=400)
-    # Extract file and config
-    csv_file = request.FILES["csv_file"]
-    config = CONFIGS["COURSE"]
-
-    return validate(csv_file, config)
-
-
-@csrf_exempt
-def validate_student_csv_view(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Only POST requests are allowed"}, status=405)
-
-    # Check for required fields
-    if "csv_file" not in request.FILES:
-        return JsonResponse({"error": "Missing csv_file "}, status=400)
-    # Extract file and config
-    csv_file = request.FILES["csv_file"]
-    config = CONFIGS["STUDENT"]
-
-    return validate(csv_file, config)
+    if isinstance(csv_file, SpilledUploadedFile):
+        source = csv_file.release()
+    else:
+        source = csv_file.read()
+
+    try:
+        # Large files are validated in the background and the client polls or streams the
+        # result. That needs the ASGI server's event loop: under WSGI every request runs in a
+        # loop of its own that is gone once the response is sent, so they are awaited too
+        background = isinstance(request, ASGIRequest)
+        if background and csv_file.size > settings.CSV_ASYNC_THRESHOLD:
+            task = validation_pool.submit(source, category)
+            payload = task.payload()
+            payload["statusUrl"] = reverse("validation_task", args=[task.task_id])
+            payload["streamUrl"] = reverse("validation_task_stream", args=[task.task_id])
+            return JsonResponse(payload, status=202)
+
+        result = await validation_pool.validate(source, category)
+    except ValidationPoolSaturatedError as e:
+        return JsonResponse(
+            {"error": str(e)}, status=429, headers={"Retry-After": str(STREAM_HEARTBEAT)}
+        )
 
+    return JsonResponse(result)
 
-@csrf_exempt
-def validate_classroom_csv_view(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Only POST requests are allowed"}, status=405)
 
-    # Check for required fields
-    if "csv_file" not in request.FILES:
-        return JsonResponse({"error": "Missing csv_file "}, status=400)
-    # Extract file and config
-    csv_file = request.FILES["csv_file"]
-    config = CONFIGS["CLASSROOM"]
+async def validation_task_view(request, task_id):
+    if request.method != "GET":
+        return JsonResponse({"error": "Only GET requests are allowed"}, status=405)
 
-    return validate(csv_file, config)
+    task = validation_pool.get(str(task_id))
+    if task is None:
+        return JsonResponse({"error": "Unknown or expired task"}, status=404)
 
+    return JsonResponse(task.payload())
 
-@csrf_exempt
-def validate_studentgroup_csv_view(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Only POST requests are allowed"}, status=405)
 
-    # Check for required fields
-    if "csv_file" not in request.FILES:
-        return JsonResponse({"error": "Missing csv_file "}, status=400)
-    # Extract file and config
-    csv_file = request.FILES["csv_file"]
-    config = CONFIGS["STUDENTGROUP"]
+async def validation_task_stream_view(request, task_id):
+    if request.method != "GET":
+        return JsonResponse({"error": "Only GET requests are allowed"}, status=405)
 
-    return validate(csv_file, config)
+    task = validation_pool.get(str(task_id))
+    if task is None:
+        return JsonResponse({"error": "Unknown or expired task"}, status=404)
 
+    # Newline-delimited JSON: a status line every STREAM_HEARTBEAT seconds while the task
+    # runs, then the final payload
+    async def lines():
+        while not task.future.done():
+            yield json.dumps(task.payload()) + "\n"
+            await asyncio.wait([task.future], timeout=STREAM_HEARTBEAT)
+        yield json.dumps(task.payload(), cls=DjangoJSONEncoder) + "\n"
 
-@csrf_exempt
-def validate_sgcourse_csv_view(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Only POST requests are allowed"}, status=405)
+    return StreamingHttpResponse(lines(), content_type="application/x-ndjson")
 
-    # Check for required fields
-    if "csv_file" not in request.FILES:
-        return JsonResponse({"error": "Missing csv_file "}, status=400)
-    # Extract file and config
-    csv_file = request.FILES["csv_file"]
-    config = CONFIGS["SGCOURSE"]
 
-    return validate(csv_file, config)
+# csrf_exempt only wraps sync views before Django 5.0, so async views are marked directly
+validate_csv_view.csrf_exempt = True
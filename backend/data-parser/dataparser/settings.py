@@ -70,6 +70,20 @@ ALLOWED_HOSTS = [
 
 ROOT_URLCONF = "dataparser.urls"
 
+# Uploads are buffered in memory up to CSV_UPLOAD_SPOOL_SIZE bytes and only spill to a
+# temporary file beyond that, which validation workers read by path (see core.uploads)
+FILE_UPLOAD_HANDLERS = ["core.uploads.SpooledFileUploadHandler"]
+CSV_UPLOAD_SPOOL_SIZE = config("CSV_UPLOAD_SPOOL_SIZE", default=10 * 1024 * 1024, cast=int)
+
+# Validation runs in CSV_WORKERS processes with CSV_MAX_PENDING further uploads queued.
+# Uploads larger than CSV_ASYNC_THRESHOLD bytes get a task ID straight away; finished
+# tasks are kept for CSV_TASK_TTL seconds. Tasks live in the server process, so serve
+# dataparser.asgi with a single worker process
+CSV_WORKERS = config("CSV_WORKERS", default=2, cast=int)
+CSV_MAX_PENDING = config("CSV_MAX_PENDING", default=8, cast=int)
+CSV_ASYNC_THRESHOLD = config("CSV_ASYNC_THRESHOLD", default=1024 * 1024, cast=int)
+CSV_TASK_TTL = config("CSV_TASK_TTL", default=600, cast=int)
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -1,14 +1,35 @@
 import base64
 import pandas as pd
-import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
 
 import os
 import pika
 import json
-from io import StringIO
+from io import BytesIO, StringIO
 from pydantic import BaseModel
 from typing import List, Optional, Literal
 
+# Shared validation engine: backend/csv_validation, copied next to main.py in the image
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from csv_validation import (
+    DUPLICATE_ROW_MESSAGE,
+    DUPLICATE_ROWS_LISTED,
+    DUPLICATE_VALUE_MESSAGE,
+    canonical_strings,
+    compile_plans,
+    duplicate_issues,
+    row_issues,
+)
+
+try:
+    import pyarrow as pa
+except ImportError:  # Arrow results are optional
+    pa = None
+
 
 """
     row!: number;
@@ -29,9 +50,9 @@ class ErrorType(BaseModel):
 
 
 # 2: Function to read CSV file
-def read_csv(file, taskId, delimiter=",", encoding="utf-8"):
+def read_csv(file, taskId, delimiter=",", encoding="utf-8", **kwargs):
     try:
-        df = pd.read_csv(file, delimiter=delimiter, encoding=encoding)
+        df = pd.read_csv(file, delimiter=delimiter, encoding=encoding, **kwargs)
         return df, []
     except Exception as e:
         err = ErrorType(
@@ -44,295 +65,18 @@ def read_csv(file, taskId, delimiter=",", encoding="utf-8"):
         return None, [err]
 
 
-# 3: Function to check headers
-def check_headers(
-    df,
-    taskId,
-    expected_columns,
-):
-    actual_columns = df.columns.tolist()
-    missing = [col for col in expected_columns if col not in actual_columns]
-    extra = [col for col in actual_columns if col not in expected_columns]
-    errors = []
-    if missing:
-        err = ErrorType(
-            row=0,
-            column=None,
-            message=f"Missing columns: {', '.join(missing)}",
-            taskId=taskId,
-            severity="ERROR",
-        )
-        errors.append(err)
-    if extra:
-        err = ErrorType(
-            row=0,
-            column=None,
-            message=f"Extra columns: {', '.join(extra)}",
+# 3: Checks run through the shared validation engine; its issues become ErrorType models
+def to_errors(issues, taskId, severity="ERROR"):
+    return [
+        ErrorType.model_construct(
+            row=issue.row,
+            column=issue.column,
+            message=issue.message,
             taskId=taskId,
-            severity="ERROR",
+            severity=severity,
         )
-        errors.append(err)
-    return errors
-
-
-def check_data_types(df, taskId, type_checks):
-    errors = []
-    for col, expected_type in type_checks.items():
-        if col not in df.columns:
-            continue
-        if expected_type == "numeric":
-            if not pd.api.types.is_numeric_dtype(df[col]):
-                err = ErrorType(
-                    row=0,
-                    column=None,
-                    message=f"Column '{col}' must be numeric",
-                    taskId=taskId,
-                    severity="ERROR",
-                )
-                errors.append(err)
-        elif expected_type == "string":
-            if not pd.api.types.is_string_dtype(df[col]):
-                err = ErrorType(
-                    row=0,
-                    column=None,
-                    message=f"Column '{col}' must be a string",
-                    taskId=taskId,
-                    severity="ERROR",
-                )
-                errors.append(err)
-    return errors
-
-
-# 4: Function to check for empty values
-def check_empty(df, taskId, required_columns):
-    errors = []
-    for col in required_columns:
-        if col not in df.columns:
-            continue
-        # missing = df[df[col].isnull()]
-        missing = df[df[col].isnull() | (df[col].astype(str).str.strip() == "")]
-        for idx in missing.index:
-            err = ErrorType(
-                row=idx + 1,
-                column=col,
-                message="Missing value",
-                taskId=taskId,
-                severity="ERROR",
-            )
-            errors.append(err)
-    return errors
-
-
-# 5: Helper function to validate email format
-def validate_email(email):
-    if pd.isnull(email) or not isinstance(email, str):
-        return False
-    email = email.strip()
-    pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-    return bool(re.match(pattern, email))
-
-
-# 6: Function to check format-specific validations
-# def check_formats(df,taskId, format_checks):
-#     errors = []
-#     for col, format_type in format_checks.items():
-#         if col not in df.columns:
-#             continue
-#         if format_type == "email":
-#             invalid = df[~df[col].apply(validate_email)]
-#             for idx, row in invalid.iterrows():
-#                 errors.append(f"Invalid email format in row {idx+1}: '{row[col]}'")
-#         if format_type == 'boolean':
-#             invalid = df[~df[col].apply(lambda x: isinstance(x, bool))]
-#             for idx, row in invalid.iterrows():
-#                 errors.append(f"Invalid boolean format in row {idx+1}: '{row[col]}'")
-#     return errors
-import uuid
-
-
-def valid_string(value):
-    return isinstance(value, str)
-
-
-def check_formats(df, taskId, format_checks):
-    errors = []
-    for col, format_type in format_checks.items():
-        if col not in df.columns:
-            continue
-        if format_type == "email":
-            invalid = df[~df[col].apply(validate_email)]
-            for idx, row in invalid.iterrows():
-                err = ErrorType(
-                    row=idx + 1,
-                    column=col,
-                    message=f"Invalid email format",
-                    taskId=taskId,
-                    severity="ERROR",
-                )
-                errors.append(err)
-
-        elif format_type == "uuid":
-
-            def validate_uuid(value):
-                try:
-                    uuid.UUID(str(value))
-                    return True
-                except ValueError:
-                    return False
-
-            invalid = df[~df[col].apply(validate_uuid)]
-            for idx, row in invalid.iterrows():
-                err = ErrorType(
-                    row=idx + 1,
-                    column=col,
-                    message=f"Invalid UUID {row[col]}",
-                    taskId=taskId,
-                    severity="ERROR",
-                )
-                errors.append(err)
-
-        elif format_type == "boolean":
-            valid_bools = [True, False, 1, 0, "True", "False", "1", "0"]
-            invalid = df[~df[col].isin(valid_bools)]
-            for idx, row in invalid.iterrows():
-                err = ErrorType(
-                    row=idx + 1,
-                    column=col,
-                    message=f"Invalid boolean: '{row[col]}'",
-                    taskId=taskId,
-                    severity="ERROR",
-                )
-                errors.append(err)
-
-        elif str(format_type).lower() == "string":
-
-            invalid = df[~df[col].apply(valid_string)]
-            for idx, row in invalid.iterrows():
-                err = ErrorType(
-                    row=idx + 1,
-                    column=col,
-                    message=f"Invalid string: '{row[col]}'",
-                    taskId=taskId,
-                    severity="ERROR",
-                )
-                errors.append(err)
-    return errors
-
-
-# 7: Function to check unique constraints
-def check_unique(df, taskId, unique_columns):
-    errors = []
-    for col in unique_columns:
-        if col not in df.columns:
-            continue
-        duplicates = df[df.duplicated(subset=[col], keep=False)]
-        if not duplicates.empty:
-            dup_values = duplicates[col].unique()
-            for val in dup_values:
-                rows = duplicates[duplicates[col] == val].index.tolist()
-                err = ErrorType(
-                    row=rows[0] + 1,
-                    column=col,
-                    message=f"Duplicate value '{val}' at rows {', '.join(map(str, [r+1 for r in rows]))}",
-                    taskId=taskId,
-                    severity="ERROR",
-                )
-                errors.append(err)
-
-    return errors
-
-
-# 8: Function to check value ranges
-def check_value_ranges(df, taskId, value_ranges):
-    errors = []
-    for col, allowed_values in value_ranges.items():
-        if col not in df.columns:
-            continue
-        invalid = df[~df[col].isin(allowed_values)]
-        for idx, row in invalid.iterrows():
-            err = ErrorType(
-                row=idx + 1,
-                column=col,
-                message=f"Invalid value '{row[col]}'",
-                taskId=taskId,
-                severity="ERROR",
-            )
-            errors.append(err)
-
-    return errors
-
-
-# 9: Function to check string lengths
-def check_lengths(df, taskId, length_checks):
-    errors = []
-    for col, max_length in length_checks.items():
-        if col not in df.columns:
-            continue
-        too_long = df[df[col].str.len() > max_length]
-        for idx, row in too_long.iterrows():
-            err = ErrorType(
-                row=idx + 1,
-                column=col,
-                message=f"Value too long: '{row[col]}' (max {max_length} chars)",
-                taskId=taskId,
-                severity="ERROR",
-            )
-            errors.append(err)
-
-    return errors
-
-
-# 10: Function to check numerical constraints
-def check_numerical_constraints(df, taskId, numerical_checks):
-    errors = []
-    for col, constraint in numerical_checks.items():
-        if col not in df.columns:
-            continue
-        # First, ensure the column is numeric
-        if not pd.api.types.is_numeric_dtype(df[col]):
-            err = ErrorType(
-                row=0,
-                column=col,
-                message=f"Column '{col}' must be numeric",
-                taskId=taskId,
-                severity="ERROR",
-            )
-            errors.append(err)
-
-            continue
-        # Then, apply the constraint
-        if constraint == "positive_integer":
-            invalid = df[df[col] <= 0]  # Changed to <= 0 to exclude zero
-            for idx, row in invalid.iterrows():
-                err = ErrorType(
-                    row=idx + 1,
-                    column=col,
-                    message=f"Invalid value: '{row[col]}' (must be a non negative integer)",
-                    taskId=taskId,
-                    severity="ERROR",
-                )
-                errors.append(err)
-
-    return errors
-
-
-# 11: Function to check for duplicate rows
-def check_duplicate_rows(df, taskId):
-    duplicates = df[df.duplicated(keep=False)]
-    if not duplicates.empty:
-        errors = []
-        for idx in duplicates.index:
-            err = ErrorType(
-                row=idx + 1,
-                column="All",
-                message=f"Duplicate row at {idx+1}",
-                taskId=taskId,
-                severity="ERROR",
-            )
-            errors.append(err)
-
-        return errors
-    return []
+        for issue in issues
+    ]
 
 
 def edit_ids(df: pd.DataFrame, editable_comlumns, prefix=""):
@@ -344,15 +88,9 @@ def edit_ids(df: pd.DataFrame, editable_comlumns, prefix=""):
         if column not in df.columns:
             continue
 
-        # Debug: Show original values
-        print(f"🔍 Column '{column}' original values: {df[column].tolist()}")
-
         # Apply prefix
         df[column] = prefix + df[column].astype(str)
 
-        # Debug: Show transformed values
-        print(f"🔍 Column '{column}' after prefix: {df[column].tolist()}")
-
     return errors
 
 
@@ -362,8 +100,100 @@ def parse(df) -> list[dict]:
     return df.where(pd.notnull(df), None).to_dict(orient="records")
 
 
-# 12: Pipeline function to validate CSV
-def validate_csv_file(file_path, taskId, category, campus_id):
+def format_rows(df, result_format="records"):
+    """
+    Rows of a valid file in the requested result format: "records" (list of dicts, the
+    default), "columns" (dict of column lists, no repeated keys) or "arrow" (Arrow IPC
+    stream bytes; requires pyarrow).
+    """
+    if result_format == "columns":
+        return df.astype(object).where(pd.notnull(df), None).to_dict(orient="list")
+    if result_format == "arrow":
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    return parse(df)
+
+
+# 4: Cross-file references
+class ReferenceIndex:
+    """
+    Primary keys of the files that passed validation, per campus and category, so that
+    foreign-key columns of later files can be checked against them. A category counts as
+    known for a campus once one of its files has validated; references into categories
+    that are not known yet are not checked.
+
+    The index only sees files validated by this service since it started, not rows created
+    in the UI or imported earlier, so a miss is a warning and never fails a file; the
+    core's foreign keys stay authoritative. At most `max_entries` (campus, category) entries
+    are kept, each for `ttl` seconds after its last recorded file.
+    """
+
+    def __init__(self, max_entries=256, ttl=3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._keys = OrderedDict()  # (campus, category) -> (keys, recorded_at), oldest first
+        self._lock = threading.Lock()
+
+    def record(self, campus_id, category, keys):
+        with self._lock:
+            entry = (campus_id, category)
+            known, _ = self._keys.pop(entry, (set(), None))
+            known.update(keys)
+            self._keys[entry] = (known, time.monotonic())
+            while len(self._keys) > self.max_entries:
+                self._keys.popitem(last=False)
+
+    def find_missing(self, campus_id, category, keys):
+        """The `keys` not recorded for (campus, category), or None if it is not known."""
+        with self._lock:
+            self._expire()
+            known, _ = self._keys.get((campus_id, category), (None, None))
+            if known is None:
+                return None
+            return [key for key in keys if key not in known]
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.ttl
+        while self._keys and next(iter(self._keys.values()))[1] < cutoff:
+            self._keys.popitem(last=False)
+
+
+def reference_keys(series):
+    """Non-empty key values as strings, so 7, 7.0 and "7" compare equal across files."""
+    return canonical_strings(series).dropna()
+
+
+def check_references(df, taskId, config, campus_id, references):
+    """Warnings for foreign keys missing from the files validated so far."""
+    warnings = []
+    for col, category in config.get("foreign_keys", {}).items():
+        if col not in df.columns:
+            continue
+        keys = reference_keys(df[col])
+        missing = references.find_missing(campus_id, category, keys.unique().tolist())
+        if not missing:
+            continue
+        message = (
+            f"Unknown {category.lower()} '{{value}}': not in any recently validated "
+            f"{category} file; it must already exist"
+        )
+        issues = row_issues(keys, keys.isin(missing), col, message)
+        warnings.extend(to_errors(issues, taskId, severity="WARNING"))
+    return warnings
+
+
+def record_references(category, campus_id, keys, references):
+    if category in REFERENCED_CATEGORIES:
+        references.record(campus_id, category, keys)
+
+
+# 13: Pipeline function to validate CSV
+def validate_csv_file(
+    file_path, taskId, category, campus_id, result_format="records", references=None
+):
     config = CONFIGS[category]
     file = StringIO(file_path)
     df, read_errors = read_csv(
@@ -373,34 +203,37 @@ def validate_csv_file(file_path, taskId, category, campus_id):
         encoding=config.get("encoding", "utf-8"),
     )
     if df is None:
-        return {"success": False, "errors": read_errors, "data": [], "type": category}
+        return {
+            "success": False,
+            "errors": [error.model_dump() for error in read_errors],
+            "data": [],
+            "type": category,
+        }
 
     errors = read_errors
+    warnings = []
 
     # Check headers first
-    header_errors = check_headers(df, taskId, config["expected_columns"])
+    plan = PLANS[category]
+    header_errors = to_errors(plan.check_header(df), taskId)
     errors.extend(header_errors)
 
     # Proceed with other checks only if headers are correct
     if not header_errors:
-        errors.extend(check_empty(df, taskId, config.get("required_columns", [])))
-        errors.extend(check_formats(df, taskId, config.get("format_checks", {})))
-        errors.extend(check_data_types(df, taskId, config.get("type_checks", {})))
-        errors.extend(check_unique(df, taskId, config.get("unique_columns", [])))
-        errors.extend(check_value_ranges(df, taskId, config.get("value_ranges", {})))
-        errors.extend(check_lengths(df, taskId, config.get("length_checks", {})))
-        errors.extend(
-            check_numerical_constraints(df, taskId, config.get("numerical_checks", {}))
-        )
-        errors.extend(check_duplicate_rows(df, taskId))
-        errors.extend(edit_ids(df, ID_COLUMNS, campus_id))
+        errors.extend(to_errors(plan.check_rows(df) + plan.check_file(df), taskId))
+        if references is not None:
+            warnings = check_references(df, taskId, config, campus_id, references)
     success = len(errors) == 0
     data = []
     if success:
-        data = parse(df)
+        if references is not None and "primary_key" in config:
+            keys = reference_keys(df[config["primary_key"]])
+            record_references(category, campus_id, keys, references)
+        errors.extend(edit_ids(df, ID_COLUMNS, campus_id))
+        data = format_rows(df, result_format)
     return {
         "success": success,
-        "errors": [error.dict() for error in errors],
+        "errors": [error.dict() for error in errors + warnings],
         "data": data,
         "type": category,
     }
@@ -408,6 +241,157 @@ def validate_csv_file(file_path, taskId, category, campus_id):
     # return {"success": success, "errors": errors, "data": data, "type": category}
 
 
+# 14: Streaming validation for files too large to hold as one DataFrame
+class CrossChunkState:
+    """
+    Uniqueness and duplicate-row bookkeeping that spans the chunks of one file. Only the
+    first row number of every key is kept (row contents are reduced to a 64-bit hash),
+    plus the row lists of keys that turned out to be duplicated.
+    """
+
+    def __init__(self, unique_columns):
+        self.first_rows = {col: {} for col in unique_columns}
+        self.duplicates = {col: {} for col in unique_columns}
+        self.first_row_hashes = {}
+        self.duplicate_rows = {}
+
+    @staticmethod
+    def _track(keys, first_rows, duplicates):
+        # Only keys repeated inside the chunk or already seen need per-row work
+        repeated = keys.duplicated(keep=False) | keys.isin(list(first_rows))
+        for idx, key in zip(keys.index[repeated].tolist(), keys[repeated].tolist()):
+            first = first_rows.setdefault(key, idx)
+            if first != idx:
+                rows, count = duplicates.get(key, ([first], 1))
+                if len(rows) < DUPLICATE_ROWS_LISTED:
+                    rows.append(idx)
+                duplicates[key] = (rows, count + 1)
+        first_rows.update(zip(keys[~repeated].tolist(), keys.index[~repeated].tolist()))
+
+    def update(self, df):
+        # Each chunk gets its own dtypes, so keys and rows are compared as text
+        df = df.apply(canonical_strings)
+        for col, first_rows in self.first_rows.items():
+            if col in df.columns:
+                # Empty cells are reported by check_empty, not as duplicates of each other
+                self._track(df[col].dropna(), first_rows, self.duplicates[col])
+        row_hashes = pd.util.hash_pandas_object(df, index=False)
+        self._track(row_hashes, self.first_row_hashes, self.duplicate_rows)
+
+    def errors(self, taskId):
+        errors = []
+        for col, duplicates in self.duplicates.items():
+            errors.extend(duplicate_issues(duplicates, col, DUPLICATE_VALUE_MESSAGE))
+        errors.extend(duplicate_issues(self.duplicate_rows, "All", DUPLICATE_ROW_MESSAGE))
+        return to_errors(errors, taskId)
+
+
+def validate_csv_stream(
+    file_bytes,
+    taskId,
+    category,
+    campus_id,
+    chunk_size,
+    batch_size,
+    result_format="records",
+    references=None,
+):
+    """
+    Validate `file_bytes` `chunk_size` rows at a time and yield results shaped like
+    validate_csv_file's. A file with errors yields a single failed result. A valid file is
+    read a second time and yielded as successive batches of at most `batch_size` rows,
+    each tagged with "batch": {"index", "last"}, so no complete copy of the rows is ever
+    held in memory. With `batch_size` 0 its rows are yielded as one untagged result.
+    """
+    config = CONFIGS[category]
+    read_options = {
+        "delimiter": config.get("delimiter", ","),
+        "encoding": config.get("encoding", "utf-8"),
+    }
+
+    header, errors = read_csv(BytesIO(file_bytes), taskId, nrows=0, **read_options)
+    if header is None:
+        yield {
+            "success": False,
+            "errors": [error.model_dump() for error in errors],
+            "data": [],
+            "type": category,
+        }
+        return
+
+    plan = PLANS[category]
+    errors.extend(to_errors(plan.check_header(header), taskId))
+    primary_key = config.get("primary_key") if references is not None else None
+    primary_keys = set()
+    warnings = []
+    if not errors:
+        state = CrossChunkState(plan.unique_columns)
+        type_errors = {}  # dtype is inferred per chunk; report each column once
+        try:
+            for chunk in pd.read_csv(BytesIO(file_bytes), chunksize=chunk_size, **read_options):
+                chunk_errors = to_errors(plan.check_rows(chunk), taskId)
+                if references is not None:
+                    warnings += check_references(chunk, taskId, config, campus_id, references)
+                for err in chunk_errors:
+                    if err.row == 0:
+                        type_errors.setdefault(err.message, err)
+                    else:
+                        errors.append(err)
+                state.update(chunk)
+                if primary_key is not None and category in REFERENCED_CATEGORIES:
+                    primary_keys.update(reference_keys(chunk[primary_key]).tolist())
+        except Exception as e:
+            errors.append(
+                ErrorType(
+                    row=0,
+                    column=None,
+                    message=f"Failed to read CSV: {str(e)}",
+                    taskId=taskId,
+                    severity="ERROR",
+                )
+            )
+        errors = list(type_errors.values()) + errors + state.errors(taskId)
+
+    warnings = [warning.model_dump() for warning in warnings]
+    if errors:
+        yield {
+            "success": False,
+            "errors": [error.model_dump() for error in errors] + warnings,
+            "data": [],
+            "type": category,
+        }
+        return
+
+    if primary_key is not None:
+        record_references(category, campus_id, primary_keys, references)
+    if not batch_size:
+        df = pd.read_csv(BytesIO(file_bytes), **read_options)
+        edit_ids(df, ID_COLUMNS, campus_id)
+        yield {
+            "success": True,
+            "errors": warnings,
+            "data": format_rows(df, result_format),
+            "type": category,
+        }
+        return
+    batches = pd.read_csv(BytesIO(file_bytes), chunksize=batch_size, **read_options)
+    batch = next(batches, None)
+    index = 0
+    while batch is not None:
+        next_batch = next(batches, None)
+        edit_ids(batch, ID_COLUMNS, campus_id)
+        yield {
+            "success": True,
+            # Warnings travel with the first batch only
+            "errors": warnings if index == 0 else [],
+            "data": format_rows(batch, result_format),
+            "type": category,
+            "batch": {"index": index, "last": next_batch is None},
+        }
+        batch = next_batch
+        index += 1
+
+
 # edit required fields (id fields, foreign or otherwise, need to be edited by adding campusId to make them unique.)
 
 ID_COLUMNS = [
@@ -427,6 +411,7 @@ DEPARTMENT_CONFIG = {
         "name",
     ],
     "required_columns": ["deptId", "name"],
+    "primary_key": "deptId",
     "unique_columns": ["deptId", "name"],
     "length_checks": {
         "name": 100  # Adjust max length based on your schema constraints
@@ -452,6 +437,8 @@ COURSE_CONFIG = {
         "sessionsPerWeek",
     ],
     "unique_columns": ["courseId", "code"],
+    "primary_key": "courseId",
+    "foreign_keys": {"departmentId": "DEPARTMENT"},
     "length_checks": {
         "name": 100,
         "code": 20,
@@ -483,6 +470,8 @@ TEACHER_CONFIG = {
         "departmentId",
     ],
     "unique_columns": ["teacherId", "email"],
+    "primary_key": "teacherId",
+    "foreign_keys": {"departmentId": "DEPARTMENT"},
     "format_checks": {
         "email": "email",
         "needWheelchairAccessibleRoom": "boolean",
@@ -501,6 +490,8 @@ STUDENTGROUP_CONFIG = {
     ],
     "required_columns": ["studentGroupId", "name", "size", "departmentId"],
     "unique_columns": ["studentGroupId", "name"],
+    "primary_key": "studentGroupId",
+    "foreign_keys": {"departmentId": "DEPARTMENT"},
     "length_checks": {"name": 100},
     "numerical_checks": {"size": "non_negative_integer"},
     "format_checks": {
@@ -529,6 +520,7 @@ CLASSROOM_CONFIG = {
         "floor",
     ],
     "unique_columns": ["classroomId", "name"],
+    "primary_key": "classroomId",
     "length_checks": {"name": 100},
     "type_checks": {"capacity": "numeric", "name": "string"},
     "numerical_checks": {
@@ -561,6 +553,8 @@ STUDENT_CONFIG = {
         "studentGroupId",
     ],
     "unique_columns": ["studentId", "email"],
+    "primary_key": "studentId",
+    "foreign_keys": {"studentGroupId": "STUDENTGROUP"},
     "length_checks": {"firstName": 50, "lastName": 50, "phone": 20},
     "value_ranges": {"role": ["STUDENT"]},
     "format_checks": {"email": "email", "needWheelchairAccessibleRoom": "boolean"},
@@ -569,6 +563,11 @@ STUDENT_CONFIG = {
 SGCOURSE_CONFIG = {
     "expected_columns": ["studentGroupId", "courseId", "teacherId"],
     "required_columns": ["studentGroupId", "courseId", "teacherId"],
+    "foreign_keys": {
+        "studentGroupId": "STUDENTGROUP",
+        "courseId": "COURSE",
+        "teacherId": "TEACHER",
+    },
     # "format_checks": {"studentGroupId": "uuid", "courseId": "uuid", "teacherId": "uuid"},
     # Note: Each combination of studentGroupId + courseId + teacherId should be unique
 }
@@ -584,6 +583,13 @@ CONFIGS = {
     "SGCOURSE": SGCOURSE_CONFIG,
 }
 
+PLANS = compile_plans(CONFIGS)
+
+# Categories whose primary keys other categories reference
+REFERENCED_CATEGORIES = {
+    category for config in CONFIGS.values() for category in config.get("foreign_keys", {}).values()
+}
+
 # consumer.py
 import os
 import json
@@ -591,18 +597,152 @@ import base64
 import pika
 
 import dotenv
+import gzip
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing.managers import BaseManager
 
 dotenv.load_dotenv()
 
+# Rows per chunk when validating; 0 validates the whole file as one DataFrame
+CSV_CHUNK_SIZE = int(os.getenv("CSV_CHUNK_SIZE", "50000"))
+# Rows per published result message for valid files in chunked mode; 0 publishes all rows
+# in one message. Batches are tagged "batch": {"index", "last"}, which the core's result
+# handler does not aggregate yet, so only enable this for consumers that do
+RESULT_BATCH_SIZE = int(os.getenv("RESULT_BATCH_SIZE", "0"))
+# Validation worker processes; 0 validates inline on the consumer thread
+CSV_WORKERS = int(os.getenv("CSV_WORKERS", "2"))
+# Unacked requests the broker hands this consumer at once; defaults to one per worker
+CSV_PREFETCH = int(os.getenv("CSV_PREFETCH", str(max(CSV_WORKERS, 1))))
+# Bounds of the index of validated primary keys (see ReferenceIndex): how many
+# (campus, category) entries it holds, and how many seconds an entry lives after its last file
+REFERENCE_INDEX_MAX_ENTRIES = int(os.getenv("REFERENCE_INDEX_MAX_ENTRIES", "256"))
+REFERENCE_INDEX_TTL = float(os.getenv("REFERENCE_INDEX_TTL", "3600"))
+
+
+# Payload compression, negotiated per request (see request_transport)
+try:
+    import zstandard
+except ImportError:  # zstd is optional; gzip is always available
+    zstandard = None
+
+COMPRESSIONS = {"gzip": (gzip.compress, gzip.decompress)}
+if zstandard is not None:
+    COMPRESSIONS["zstd"] = (
+        lambda data: zstandard.ZstdCompressor().compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data),
+    )
+
+RESULT_FORMATS = ["records", "columns"] + (["arrow"] if pa is not None else [])
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def decompress(body, content_encoding):
+    if not content_encoding or content_encoding == "identity":
+        return body
+    if content_encoding not in COMPRESSIONS:
+        raise ValueError(f"Unsupported content encoding '{content_encoding}'")
+    return COMPRESSIONS[content_encoding][1](body)
+
+
+def request_transport(content_type, content_encoding, headers, body):
+    """
+    Decode a validation request into (data, file_bytes, transport).
+
+    Requests are either the JSON envelope the core emits ({"data": {..., "fileData":
+    base64}}) or, with content type text/csv, the raw CSV bytes with the other fields in
+    headers, which avoids base64's 33% overhead. Either may be compressed, as stated by
+    content_encoding. Headers negotiate the result transport:
+    "x-accept-encoding" lists encodings the requester can read (first supported wins) and
+    "x-result-format" picks how rows are returned (see format_rows). Requests without them
+    get plain JSON records, as before.
+    """
+    headers = headers or {}
+    body = decompress(body, content_encoding)
+    if content_type == "text/csv":
+        data = {key: headers.get(key) for key in ("taskId", "category", "adminId", "campusId")}
+        file_bytes = body
+    else:
+        data = json.loads(body).get("data")
+        file_data_encoded = data.get("fileData")
+        file_bytes = base64.b64decode(file_data_encoded) if file_data_encoded else None
+
+    accepted = [
+        encoding.strip() for encoding in str(headers.get("x-accept-encoding", "")).split(",")
+    ]
+    result_format = headers.get("x-result-format", "records")
+    if result_format not in RESULT_FORMATS:
+        print(f"[!] Unsupported result format '{result_format}', falling back to records")
+        result_format = "records"
+    transport = {
+        "encoding": next((encoding for encoding in accepted if encoding in COMPRESSIONS), None),
+        "result_format": result_format,
+    }
+    return data, file_bytes, transport
+
+
+class ResultPublisher:
+    """
+    Long-lived publisher for validation results. Keeps one connection and one channel in
+    publisher-confirm mode and reopens them when the broker drops them, instead of paying a
+    TCP and AMQP handshake for every result.
+    """
+
+    def __init__(self, url, queue="csv_validation_response", max_attempts=3):
+        self.url = url
+        self.queue = queue
+        self.max_attempts = max_attempts
+        self._connection = None
+        self._channel = None
+
+    def _ensure_channel(self):
+        if self._connection is None or self._connection.is_closed:
+            self._channel = None
+            self._connection = pika.BlockingConnection(pika.URLParameters(self.url))
+        if self._channel is None or self._channel.is_closed:
+            self._channel = self._connection.channel()
+            self._channel.queue_declare(queue=self.queue, durable=True)
+            self._channel.confirm_delivery()
+        # Service heartbeats the idle connection may owe; raises if the broker dropped it
+        self._connection.process_data_events(time_limit=0)
+        return self._channel
+
+    def publish(self, body, **properties):
+        """
+        Publish `body` over the shared channel. With confirms on, basic_publish returns
+        only once the broker has taken the message; failures reconnect and retry.
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                self._ensure_channel().basic_publish(
+                    exchange="",
+                    routing_key=self.queue,
+                    body=body,
+                    properties=pika.BasicProperties(delivery_mode=2, **properties),
+                )
+                return
+            except pika.exceptions.AMQPError as e:
+                print(f"Publish attempt {attempt} failed: {e!r}")
+                self.close()
+                if attempt == self.max_attempts:
+                    raise
+                time.sleep(attempt)
+
+    def close(self):
+        connection, self._connection, self._channel = self._connection, None, None
+        if connection is not None and connection.is_open:
+            try:
+                connection.close()
+            except pika.exceptions.AMQPError:
+                pass
+
 
-def publish_result(task_id, result, admin_id, campus_id):
-    connection = pika.BlockingConnection(pika.URLParameters(os.getenv("RABBITMQ_URL")))
-    channel = connection.channel()
-    routing_key = "csv_validation_response"
+publisher = ResultPublisher(os.getenv("RABBITMQ_URL"))
 
-    # Declare exchange and queue
-    channel.queue_declare(queue="csv_validation_response", durable=True)
 
+def publish_result(task_id, result, admin_id, campus_id, encoding=None):
     # Wrapped payload
     message = {
         "pattern": "csv_validation_response",
@@ -613,54 +753,186 @@ def publish_result(task_id, result, admin_id, campus_id):
             "campusId": campus_id,
         },
     }
+    properties = {"content_type": "application/json"}
+    if isinstance(result["data"], bytes):
+        # Arrow rows travel as the raw body; everything else rides in a header
+        body = result["data"]
+        message["data"]["result"] = {**result, "data": None}
+        properties = {
+            "content_type": ARROW_CONTENT_TYPE,
+            "headers": {"x-message": json.dumps(message)},
+        }
+    else:
+        body = json.dumps(message).encode("utf-8")
+    if encoding is not None:
+        body = COMPRESSIONS[encoding][0](body)
+        properties["content_encoding"] = encoding
+
+    publisher.publish(body, **properties)
+    print(
+        f"Published event '{publisher.queue}' for task {task_id}: "
+        f"success={result['success']}, {len(result['errors'])} errors, "
+        f"{len(body)} bytes, batch={result.get('batch')}"
+    )
 
-    try:
-        channel.basic_publish(
-            exchange="",
-            routing_key=routing_key,
-            body=json.dumps(message),
-            properties=pika.BasicProperties(delivery_mode=2),
+
+class ReferenceIndexManager(BaseManager):
+    """Serves one ReferenceIndex to all validation worker processes."""
+
+
+ReferenceIndexManager.register("ReferenceIndex", ReferenceIndex)
+
+# Replaced by a proxy to the shared index in worker processes
+references = ReferenceIndex(REFERENCE_INDEX_MAX_ENTRIES, REFERENCE_INDEX_TTL)
+
+
+def _init_worker(shared_references):
+    global references
+    references = shared_references
+
+
+def process_message(body, content_type=None, content_encoding=None, headers=None):
+    """Validate one request and publish its result(s). Runs in a worker process when enabled."""
+    data, file_bytes, transport = request_transport(content_type, content_encoding, headers, body)
+    task_id = data.get("taskId")
+    category = data.get("category")
+    admin_id = data.get("adminId")
+    campus_id = data.get("campusId")
+
+    print(f"🔍 DEBUG: Received campus_id='{campus_id}' for category='{category}'")
+
+    if not task_id or not file_bytes or not category:
+        raise ValueError("Invalid message format")
+    result_format = transport["result_format"]
+    if CSV_CHUNK_SIZE > 0:
+        results = validate_csv_stream(
+            file_bytes,
+            task_id,
+            category,
+            campus_id,
+            CSV_CHUNK_SIZE,
+            RESULT_BATCH_SIZE,
+            result_format,
+            references,
         )
-        print(f"Published event '{routing_key}' to exchange  with payload: {message}")
-    except Exception as e:
-        print(f"Error publishing event: {e}")
-    finally:
-        connection.close()
+    else:
+        results = [
+            validate_csv_file(
+                file_bytes.decode("utf-8"),
+                task_id,
+                category,
+                campus_id,
+                result_format,
+                references,
+            )
+        ]
+
+    for result in results:
+        publish_result(task_id, result, admin_id, campus_id, transport["encoding"])
+
+
+class ValidationWorkers:
+    """
+    Runs process_message in `size` worker processes so one large file does not hold up
+    the others. Each worker publishes through its own ResultPublisher; the request is
+    acked on the consumer thread, which owns the channel, only once its result is published.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._executor = None
+        self._manager = None
+        self._references = None
+
+    def start(self):
+        # spawn, not fork: the parent holds the consumer's open AMQP socket
+        context = multiprocessing.get_context("spawn")
+        if self._manager is None:
+            # Workers validate different files, so they share one index of validated keys
+            self._manager = ReferenceIndexManager(ctx=context)
+            self._manager.start()
+            self._references = self._manager.ReferenceIndex(
+                REFERENCE_INDEX_MAX_ENTRIES, REFERENCE_INDEX_TTL
+            )
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.size,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._references,),
+        )
+        print(f"[*] Started {self.size} validation workers")
 
+    def submit(self, ch, method, *args):
+        executor = self._executor
+        future = executor.submit(process_message, *args)
+        future.add_done_callback(partial(self._on_done, ch, method, executor))
 
-def on_message(ch, method, properties, body):
-    print("[x] Received message")
-    try:
-        payload = json.loads(body)
-        print("payload: ", payload)
-        data = payload.get("data")
-        task_id = data.get("taskId")
-        file_data_encoded = data.get("fileData")
-        category = data.get("category")
-        admin_id = data.get("adminId")
-        campus_id = data.get("campusId")
+    def _on_done(self, ch, method, executor, future):
+        # Runs on the executor's management thread; pika channels are not thread-safe
+        try:
+            ch.connection.add_callback_threadsafe(
+                partial(self._settle, ch, method, executor, future)
+            )
+        except Exception as e:
+            # Connection gone: the broker redelivers the unacked request
+            print(f"[!] Could not settle message {method.delivery_tag}: {e}")
 
-        print(f"🔍 DEBUG: Received campus_id='{campus_id}' for category='{category}'")
+    def _settle(self, ch, method, executor, future):
+        try:
+            future.result()
+        except BrokenProcessPool:
+            if executor is self._executor:
+                print("[!] Validation worker died, restarting workers")
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.start()
+            reject(ch, method)
+            return
+        except Exception as e:
+            print(f"[!] Error processing message: {e}")
+            reject(ch, method)
+            return
+        ch.basic_ack(delivery_tag=method.delivery_tag)
 
-        if not task_id or not file_data_encoded or not category:
-            raise ValueError("Invalid message format")
-        file_data = base64.b64decode(file_data_encoded).decode("utf-8")
-        result = validate_csv_file(file_data, task_id, category, campus_id)
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
 
-        publish_result(task_id, result, admin_id, campus_id)
 
+workers = ValidationWorkers(CSV_WORKERS) if CSV_WORKERS > 0 else None
+
+
+def reject(ch, method):
+    # The result was not published: requeue once, a request that fails twice is dropped
+    ch.basic_nack(delivery_tag=method.delivery_tag, requeue=not method.redelivered)
+
+
+def on_message(ch, method, properties, body):
+    print("[x] Received message")
+    # Plain values only: they are pickled to the worker processes
+    args = (body, properties.content_type, properties.content_encoding, properties.headers)
+    if workers is not None:
+        workers.submit(ch, method, *args)
+        return
+
+    try:
+        process_message(*args)
     except Exception as e:
 
         print(f"[!] Error processing message: {e}")
+        reject(ch, method)
+        return
 
     ch.basic_ack(delivery_tag=method.delivery_tag)
 
 
-import time
-
-
 def start_consumer():
     print("[*] Starting consumer service...")
+    if workers is not None:
+        workers.start()
     for i in range(10):  # retry up to 10 times
         try:
             print(f"Attempt {i + 1}: Connecting to RabbitMQ...")
@@ -669,6 +941,7 @@ def start_consumer():
             )
             channel = connection.channel()
             channel.queue_declare(queue="csv_validation_request", durable=True)
+            channel.basic_qos(prefetch_count=CSV_PREFETCH)
             print("connection successful", connection.is_open)
             channel.basic_consume(
                 queue="csv_validation_request", on_message_callback=on_message
@@ -685,6 +958,9 @@ def start_consumer():
             time.sleep(5)
     else:
         print("Failed to connect to RabbitMQ after multiple attempts.")
+    if workers is not None:
+        workers.shutdown()
+    publisher.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+"""
+Chunked validation must report the same errors as whole-file validation, even when pandas
+infers a different dtype for a column in each chunk
+"""
+from main import validate_csv_file, validate_csv_stream
+
+HEADER = "courseId,name,code,departmentId,description,sessionType,sessionsPerWeek\n"
+
+
+def error_keys(errors):
+    return sorted((error["row"], error["column"], error["message"]) for error in errors)
+
+
+def validate_both(csv, chunk_size=2):
+    whole = validate_csv_file(csv, "t", "COURSE", "c-")
+    streamed = list(validate_csv_stream(csv.encode(), "t", "COURSE", "c-", chunk_size, 10))
+    assert len(streamed) == 1
+    return whole["errors"], streamed[0]["errors"]
+
+
+def test_duplicate_row_across_chunks_with_mixed_dtypes():
+    # The second chunk's sessionsPerWeek holds a letter, so it is read as text there
+    csv = HEADER + (
+        "c1,Math,M1,d1,,LECTURE,3\n"
+        "c2,Physics,P1,d1,,LECTURE,2\n"
+        "c1,Math,M1,d1,,LECTURE,3\n"
+        "c4,Chemistry,C4,d1,,LECTURE,x\n"
+    )
+    whole, streamed = validate_both(csv)
+    assert error_keys(streamed) == error_keys(whole)
+    assert (1, "All", "Duplicate row at 1, 3") in error_keys(streamed)
+
+
+def test_duplicate_value_across_chunks_with_mixed_dtypes():
+    # code is numeric in the first chunk and text in the second
+    csv = HEADER + (
+        "c1,Math,7,d1,,LECTURE,3\n"
+        "c2,Physics,8,d1,,LECTURE,2\n"
+        "c3,Biology,B3,d1,,LECTURE,1\n"
+        "c4,Chemistry,7,d1,,LECTURE,4\n"
+    )
+    whole, streamed = validate_both(csv)
+    assert error_keys(streamed) == error_keys(whole)
+    assert (1, "code", "Duplicate value '7' at rows 1, 4") in error_keys(streamed)
+
+
+if __name__ == "__main__":
+    test_duplicate_row_across_chunks_with_mixed_dtypes()
+    test_duplicate_value_across_chunks_with_mixed_dtypes()
+    print("Chunked validation matches whole-file validation")
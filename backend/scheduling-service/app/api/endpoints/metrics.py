@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Service metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(registry.render(), media_type=registry.CONTENT_TYPE)
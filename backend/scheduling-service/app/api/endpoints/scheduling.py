@@ -1,156 +1,249 @@
 import time
 import asyncio
 import logging
-from fastapi import APIRouter
-from app.services.GeneticScheduler import GeneticScheduler
-from app.services.SchedulingConstraintRegistry import SchedulingConstraintRegistry
-from app.services.Fitness import ScheduleFitnessEvaluator
-from app.models import ScheduleApiRequest, ScheduledItem
-from typing import List, Dict, Any
+from fastapi import APIRouter, Query
+from app.services.GeneticScheduler import OptimizationMode, PopulationSizing, StagnationStrategy
+from app.services.ProblemCache import CompiledProblem, ProblemCache, compute_problem_key
+from app.services.SchedulingPool import (
+    SchedulingJob,
+    SchedulingPool,
+    SchedulingPoolSaturatedError,
+    SchedulingPoolShutdownError,
+)
+from app.services.Profiling import profile_store
+from app.core.config import settings
+from app.core.responses import CompactJSONResponse
+from app.core.metrics import (
+    ACTIVE_JOBS,
+    GA_EVALUATIONS_PER_SECOND,
+    GA_GENERATIONS,
+    GA_RUN_DURATION,
+    PROBLEM_CACHE_LOOKUPS,
+    QUEUED_JOBS,
+    SCHEDULING_JOBS,
+)
+from app.services.FitnessReport import FitnessReport
+from app.models import (
+    ScheduleApiRequest,
+    ScheduleBatchEvaluationRequest,
+    ScheduleEvaluationRequest,
+    ScheduleProblemData,
+)
+from typing import List, Dict, Any, Tuple
 
 router = APIRouter(prefix="/scheduler")
 
+# Days used by both schedule generation and evaluation
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
 
-@router.post("/", status_code=201)
-async def generate_schedule(request: ScheduleApiRequest):
-    logging.info(f"Received Schedule Request with {len(request.constraints)} constraints")
+# Compiled problems are reused while the static problem data (everything except the schedule
+# and run options) is unchanged, for both generation and evaluation
+problem_cache = ProblemCache(maxsize=settings.PROBLEM_CACHE_SIZE)
+
+
+def _get_compiled_problem(problem: ScheduleProblemData | ScheduleApiRequest) -> CompiledProblem:
+    """Return the cached compiled problem for this request, compiling it on a cache miss."""
+    compiled_problem, hit = problem_cache.get_or_compile(
+        compute_problem_key(problem, DAYS),
+        lambda: CompiledProblem(
+            teachers=problem.teachers,
+            rooms=problem.rooms,
+            student_groups=problem.studentGroups,
+            courses=problem.courses,
+            timeslots=problem.timeslots,
+            days=DAYS,
+            constraints=problem.constraints,
+        ),
+    )
+    PROBLEM_CACHE_LOOKUPS.inc(result="hit" if hit else "miss")
+    return compiled_problem
+
+
+def _update_job_gauges(pool: SchedulingPool) -> None:
+    ACTIVE_JOBS.set(pool.active)
+    QUEUED_JOBS.set(pool.pending)
+
+
+# GA runs go to worker processes; started and drained by the app lifespan (see app.main)
+scheduling_pool = SchedulingPool(
+    max_workers=settings.SCHEDULER_WORKERS,
+    max_pending=settings.SCHEDULER_MAX_PENDING,
+    problem_cache_size=settings.PROBLEM_CACHE_SIZE,
+    on_change=_update_job_gauges,
+)
 
-    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+
+@router.post("/", status_code=201, response_class=CompactJSONResponse)
+async def generate_schedule(
+    request: ScheduleApiRequest,
+    include_violations: bool = Query(
+        False, description="Include every constraint violation of the best schedule in the report"
+    ),
+):
+    logging.info(f"Received Schedule Request with {len(request.constraints)} constraints")
 
     # Get time limit from request (default to 180 seconds, max 300 seconds)
-    time_limit = getattr(request, 'timeLimit', 180)
-    if time_limit and time_limit > 300:
+    time_limit = request.timeLimit
+    if time_limit is None:
+        time_limit = 180
+    elif time_limit > 300:
         time_limit = 300
         logging.info(f"Time limit clamped to maximum of 300 seconds")
-    elif time_limit and time_limit < 1:
+    elif time_limit < 1:
         time_limit = 180
         logging.info(f"Time limit set to default of 180 seconds (minimum)")
     
     logging.info(f"Using time limit: {time_limit} seconds")
 
-    logging.info("Initializing scheduler...")
-    scheduler = GeneticScheduler(
+    job = SchedulingJob(
+        problem_key=compute_problem_key(request, DAYS),
         courses=request.courses,
         teachers=request.teachers,
         rooms=request.rooms,
         student_groups=request.studentGroups,
         constraints=request.constraints,
         timeslots=request.timeslots,
-        days=days,
-        population_size=100,
+        days=DAYS,
+        population_size=settings.SCHEDULER_POPULATION_SIZE,
+        population_sizing=PopulationSizing(settings.SCHEDULER_POPULATION_SIZING),
+        stagnation_strategy=StagnationStrategy(settings.SCHEDULER_STAGNATION_STRATEGY),
+        optimization_mode=OptimizationMode(
+            request.optimizationMode or settings.SCHEDULER_OPTIMIZATION_MODE
+        ),
         time_limit=time_limit,
+        seed=request.seed,
+        profile=request.profile or settings.SCHEDULER_PROFILING,
     )
 
-    logging.info("Running scheduler...")
     start_time = time.time()
-    loop = asyncio.get_running_loop()
-    best_schedule, best_fitness, report = await loop.run_in_executor(None, scheduler.run)
+    try:
+        result = await scheduling_pool.submit(job)
+    except (SchedulingPoolSaturatedError, SchedulingPoolShutdownError) as e:
+        saturated = isinstance(e, SchedulingPoolSaturatedError)
+        logging.warning(f"Rejected schedule request: {e}")
+        SCHEDULING_JOBS.inc(status="rejected")
+        return CompactJSONResponse(
+            status_code=429 if saturated else 503,
+            content={"status": "error", "message": str(e), "data": None},
+            # A waiting job holds its slot for at most its time limit
+            headers={"Retry-After": str(time_limit)} if saturated else None,
+        )
+    except Exception:
+        SCHEDULING_JOBS.inc(status="error")
+        raise
     end_time = time.time()
-    logging.info(f"Scheduler finished running in {end_time - start_time} seconds")
-    if report:
-        report.print_detailed_report()
+    logging.info(
+        f"Scheduler finished running with seed {result.seed} and population size "
+        f"{result.population_size} in {end_time - start_time} seconds"
+    )
+
+    SCHEDULING_JOBS.inc(status="success")
+    PROBLEM_CACHE_LOOKUPS.inc(result="hit" if result.problem_cache_hit else "miss")
+    GA_RUN_DURATION.observe(result.run_duration)
+    GA_GENERATIONS.observe(result.generations_completed)
+    if result.run_duration > 0:
+        GA_EVALUATIONS_PER_SECOND.observe(result.evaluations_count / result.run_duration)
+    if result.validator_profile is not None:
+        profile_store.record_run(result.validator_profile, result.phase_profile)
 
     logging.info("Scheduler finished running.")
+    data = {
+        "best_schedule": result.best_schedule,
+        "best_fitness": result.best_fitness,
+        "report": result.report.to_dict(include_violations) if result.report else None,
+        "time_taken": end_time - start_time,
+        "seed": result.seed,
+    }
+    if result.pareto_front:
+        # Lowest scalar fitness first; the full front can hold many schedules
+        data["pareto_front_size"] = len(result.pareto_front)
+        data["pareto_front"] = [
+            {
+                "objectives": solution.objectives,
+                "fitness": solution.fitness,
+                "schedule": solution.schedule,
+            }
+            for solution in result.pareto_front[: settings.PARETO_FRONT_LIMIT]
+        ]
+
+    # Returned directly so the (potentially large) payload skips jsonable_encoder
+    return CompactJSONResponse(
+        status_code=201,
+        content={
+            "status": "success",
+            "message": "Schedule generated successfully.",
+            "data": data,
+        },
+    )
+
+
+@router.get("/metrics", status_code=200)
+async def get_scheduler_metrics():
+    """
+    Aggregated per-validator and per-GA-phase timings of profiled scheduling runs.
+
+    Runs are profiled when the request sets `profile` or SCHEDULER_PROFILING is enabled.
+    """
     return {
         "status": "success",
-        "message": "Schedule generated successfully.",
-        "data": {
-            "best_schedule": best_schedule,
-            "best_fitness": best_fitness,
-            "report": report,
-            "time_taken": end_time - start_time,
+        "message": "Scheduler metrics retrieved successfully.",
+        "data": profile_store.snapshot(),
+    }
+
+
+def _summarize_report(fitness_report: FitnessReport) -> Dict[str, Any]:
+    """Format a fitness report for the frontend."""
+    # Format violations as simple strings for frontend
+    violation_descriptions = [violation.description for violation in fitness_report.violations]
+
+    # Create summary by category
+    category_summaries = {}
+    for category, violations in fitness_report.violation_summary.items():
+        if violations:
+            category_summaries[category.value] = {
+                "count": len(violations),
+                "total_penalty": fitness_report.soft_constraint_scores.get(category, 0)
+                or fitness_report.hard_constraint_scores.get(category, 0),
+                "violations": [
+                    v.description for v in violations[:5]
+                ],  # Limit to 5 per category
+            }
+
+    return {
+        "summary": {
+            "is_feasible": fitness_report.is_feasible,
+            "total_hard_violations": fitness_report.total_hard_violations,
+            "total_soft_penalty": fitness_report.total_soft_penalty,
+            "total_violations": len(fitness_report.violations),
+            "evaluation_time": fitness_report.evaluation_time,
         },
+        "violations": violation_descriptions,
+        "categories": category_summaries,
+        "fitness_vector": fitness_report.fitness_vector,
     }
 
 
 @router.post("/evaluate", status_code=200)
-async def evaluate_schedule(request: Dict[str, Any]):
+async def evaluate_schedule(request: ScheduleEvaluationRequest):
     """
     Evaluate an existing schedule and return detailed fitness report.
     """
-    logging.info(
-        f"Received evaluation request for schedule with {len(request.get('schedule', []))} sessions"
-    )
+    logging.info(f"Received evaluation request for schedule with {len(request.schedule)} sessions")
 
-    try:
-        # Extract data from request
-        schedule_data = request.get("schedule", [])
-        teachers = request.get("teachers", [])
-        rooms = request.get("rooms", [])
-        student_groups = request.get("studentGroups", [])
-        courses = request.get("courses", [])
-        constraints = request.get("constraints", [])
-        timeslots = request.get("timeslots", [])
-
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-
-        # Convert schedule data to ScheduledItem objects
-        scheduled_items = []
-        for item in schedule_data:
-            scheduled_item = ScheduledItem(
-                courseId=item["courseId"],
-                courseName=item["courseName"],
-                teacherId=item["teacherId"],
-                classroomId=item["classroomId"],
-                studentGroupIds=item["studentGroupIds"],
-                day=item["day"],
-                timeslot=item["timeslot"],
-                sessionType=item.get("sessionType", "LECTURE"),
-            )
-            scheduled_items.append(scheduled_item)
-
-        # Set up constraint registry
-        constraint_registry = SchedulingConstraintRegistry(constraints)
-
-        # Create fitness evaluator
-        evaluator = ScheduleFitnessEvaluator(
-            teachers=teachers,
-            rooms=rooms,
-            student_groups=student_groups,
-            courses=courses,
-            timeslots=timeslots,
-            days=days,
-            constraint_registry=constraint_registry,
-        )
+    def evaluate() -> FitnessReport:
+        evaluator = _get_compiled_problem(request).fitness_evaluator
+        return evaluator.evaluate(request.schedule)
 
-        # Evaluate the schedule
-        start_time = time.time()
-        fitness_report = evaluator.evaluate(scheduled_items)
-        end_time = time.time()
-
-        # Format violations as simple strings for frontend
-        violation_descriptions = []
-        for violation in fitness_report.violations:
-            violation_descriptions.append(violation.description)
-
-        # Create summary by category
-        category_summaries = {}
-        for category, violations in fitness_report.violation_summary.items():
-            if violations:
-                category_summaries[category.value] = {
-                    "count": len(violations),
-                    "total_penalty": fitness_report.soft_constraint_scores.get(category, 0)
-                    or fitness_report.hard_constraint_scores.get(category, 0),
-                    "violations": [
-                        v.description for v in violations[:5]
-                    ],  # Limit to 5 per category
-                }
+    try:
+        # Compilation and evaluation run in a thread so the event loop keeps serving
+        # other requests (metrics, health checks) meanwhile
+        loop = asyncio.get_running_loop()
+        fitness_report = await loop.run_in_executor(None, evaluate)
 
         return {
             "status": "success",
             "message": "Schedule evaluated successfully.",
-            "data": {
-                "summary": {
-                    "is_feasible": fitness_report.is_feasible,
-                    "total_hard_violations": fitness_report.total_hard_violations,
-                    "total_soft_penalty": fitness_report.total_soft_penalty,
-                    "total_violations": len(fitness_report.violations),
-                    "evaluation_time": end_time - start_time,
-                },
-                "violations": violation_descriptions,
-                "categories": category_summaries,
-                "fitness_vector": fitness_report.fitness_vector,
-            },
+            "data": _summarize_report(fitness_report),
         }
 
     except Exception as e:
@@ -160,3 +253,47 @@ async def evaluate_schedule(request: Dict[str, Any]):
             "message": f"Failed to evaluate schedule: {str(e)}",
             "data": None,
         }
+
+
+@router.post("/evaluate/batch", status_code=200)
+async def evaluate_schedules(request: ScheduleBatchEvaluationRequest):
+    """
+    Evaluate several candidate schedules against the same data in one call.
+
+    Results are returned in request order, together with the index of the best candidate.
+    """
+    logging.info(f"Received batch evaluation request for {len(request.schedules)} schedules")
+
+    def evaluate_all() -> Tuple[List[FitnessReport], float]:
+        evaluator = _get_compiled_problem(request).fitness_evaluator
+        reports = [evaluator.evaluate(schedule) for schedule in request.schedules]
+        return reports, evaluator.penalty_manager.min_hard_penalty
+
+    try:
+        # Compilation happens in the thread too, like evaluate_schedule
+        loop = asyncio.get_running_loop()
+        fitness_reports, hard_penalty_weight = await loop.run_in_executor(None, evaluate_all)
+
+        scores = [
+            report.total_hard_violations * hard_penalty_weight + report.total_soft_penalty
+            for report in fitness_reports
+        ]
+        return {
+            "status": "success",
+            "message": "Schedules evaluated successfully.",
+            "data": {
+                "best_index": scores.index(min(scores)),
+                "results": [
+                    {"index": i, "fitness": score, **_summarize_report(report)}
+                    for i, (score, report) in enumerate(zip(scores, fitness_reports))
+                ],
+            },
+        }
+
+    except Exception as e:
+        logging.error(f"Error evaluating schedules: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to evaluate schedules: {str(e)}",
+            "data": None,
+        }
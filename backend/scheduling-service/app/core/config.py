@@ -5,5 +5,29 @@ class Settings(BaseSettings):
 	APP_ENV: str = os.getenv("APP_ENV", "development")
 	APP_NAME: str = "Scheduling Service API"
 	SENTRY_DSN: str = os.getenv("SENTRY_DSN", "")
+	# Sentry sampling. Capacity trends come from /api/metrics, so tracing only needs a sample
+	SENTRY_TRACES_SAMPLE_RATE: float = float(os.getenv("SENTRY_TRACES_SAMPLE_RATE", "0.05"))
+	SENTRY_PROFILES_SAMPLE_RATE: float = float(os.getenv("SENTRY_PROFILES_SAMPLE_RATE", "0.0"))
+	# Profile every scheduling run (per-validator and per-GA-phase timings, see /api/scheduler/metrics)
+	SCHEDULER_PROFILING: bool = os.getenv("SCHEDULER_PROFILING", "false").lower() == "true"
+	# Number of compiled problems (validators, penalty bounds, domains) kept in memory
+	PROBLEM_CACHE_SIZE: int = int(os.getenv("PROBLEM_CACHE_SIZE", "8"))
+	# Gzip responses larger than this many bytes for clients that accept it (0 disables gzip)
+	GZIP_MINIMUM_SIZE: int = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+	# Worker processes running GA jobs, and how many more jobs may wait for a free worker
+	# before new requests are rejected with 429
+	SCHEDULER_WORKERS: int = int(os.getenv("SCHEDULER_WORKERS", "2"))
+	SCHEDULER_MAX_PENDING: int = int(os.getenv("SCHEDULER_MAX_PENDING", "4"))
+	# GA population sizing: "fixed" uses SCHEDULER_POPULATION_SIZE, "auto" calibrates the size
+	# to the problem and time limit, "adaptive" also resizes during the run
+	SCHEDULER_POPULATION_SIZING: str = os.getenv("SCHEDULER_POPULATION_SIZING", "fixed")
+	SCHEDULER_POPULATION_SIZE: int = int(os.getenv("SCHEDULER_POPULATION_SIZE", "100"))
+	# What the GA does after prolonged stagnation: "restart" re-seeds around the elites and keeps
+	# searching until the time limit, "early_stop" returns the best solution found so far
+	SCHEDULER_STAGNATION_STRATEGY: str = os.getenv("SCHEDULER_STAGNATION_STRATEGY", "early_stop")
+	# Default GA optimization mode ("scalar" or "nsga2") and how many Pareto-front schedules
+	# an NSGA-II run returns
+	SCHEDULER_OPTIMIZATION_MODE: str = os.getenv("SCHEDULER_OPTIMIZATION_MODE", "scalar")
+	PARETO_FRONT_LIMIT: int = int(os.getenv("PARETO_FRONT_LIMIT", "10"))
 
 settings = Settings()
@@ -0,0 +1,28 @@
+"""
+orjson-backed response class for large payloads.
+
+Endpoints return a CompactJSONResponse directly so FastAPI skips `jsonable_encoder`;
+content must then consist of plain containers, scalars, dataclasses, enums, numpy values
+or pydantic models (dumped through `model_dump`).
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class CompactJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
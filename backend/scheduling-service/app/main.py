@@ -2,18 +2,25 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 import sentry_sdk
 import logging
+import signal
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.endpoints import healthcheck
+from app.api.endpoints import metrics
 from app.api.endpoints import scheduling
+from app.core.config import settings
+from app.core.metrics import REQUEST_LATENCY
 
 try:
     sentry_sdk.init(
         dsn="https://ec5ad676078d626f9095cd8395d34341@o4507213915422720.ingest.de.sentry.io/4509336235737168",
         send_default_pii=True,
         enable_tracing=True,
-        traces_sample_rate=1.0,
-        profiles_sample_rate=1.0,
+        traces_sample_rate=settings.SENTRY_TRACES_SAMPLE_RATE,
+        profiles_sample_rate=settings.SENTRY_PROFILES_SAMPLE_RATE,
         profile_lifecycle="trace",
     )
 except Exception as e:
@@ -21,7 +28,64 @@ except Exception as e:
     logging.warning("Proceeding without SENTRY...")
 
 
-app = FastAPI(title="Scheduling Service", description="A service for scheduling events")
+def _drain_on_sigterm() -> None:
+    """
+    Stop admitting scheduling jobs as soon as SIGTERM arrives (new requests get 503), then
+    hand the signal on to the server, which waits for in-flight requests before shutdown.
+    """
+    previous_handler = signal.getsignal(signal.SIGTERM)
+
+    def handle_sigterm(signum, frame):
+        scheduling.scheduling_pool.begin_shutdown()
+        if callable(previous_handler):
+            previous_handler(signum, frame)
+        elif previous_handler == signal.SIG_DFL:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.raise_signal(signal.SIGTERM)
+
+    try:
+        signal.signal(signal.SIGTERM, handle_sigterm)
+    except ValueError:
+        # Not running in the main thread (e.g. under a test client)
+        logging.warning("Could not install SIGTERM handler; scheduling pool will drain on shutdown")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    scheduling.scheduling_pool.start()
+    await scheduling.scheduling_pool.warm_up()
+    _drain_on_sigterm()
+    yield
+    # Jobs admitted before shutdown run to completion before the workers exit
+    scheduling.scheduling_pool.shutdown(wait=True)
+
+
+app = FastAPI(
+    title="Scheduling Service", description="A service for scheduling events", lifespan=lifespan
+)
+
+if settings.GZIP_MINIMUM_SIZE > 0:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    start_time = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        # Label by route template, not the raw URL, to keep the series count bounded
+        route = request.scope.get("route")
+        REQUEST_LATENCY.observe(
+            time.perf_counter() - start_time,
+            method=request.method,
+            path=getattr(route, "path", "unmatched"),
+            status=status,
+        )
+
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -43,3 +107,4 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 app.include_router(healthcheck.router, prefix="/api", tags=["healthcheck"])
 app.include_router(scheduling.router, prefix="/api", tags=["scheduler"])
+app.include_router(metrics.router, prefix="/api", tags=["metrics"])
@@ -13,7 +13,11 @@ from .student_group import StudentGroup
 from .scheduled_item import ScheduledItem
 from .constraint import Constraint
 from .schedule_request import ScheduleApiRequest
-from .evaluation_request import ScheduleEvaluationRequest
+from .evaluation_request import (
+    ScheduleProblemData,
+    ScheduleEvaluationRequest,
+    ScheduleBatchEvaluationRequest,
+)
 
 __all__ = [
     "Timeslot",
@@ -24,5 +28,7 @@ __all__ = [
     "ScheduledItem",
     "Constraint",
     "ScheduleApiRequest",
+    "ScheduleProblemData",
     "ScheduleEvaluationRequest",
+    "ScheduleBatchEvaluationRequest",
 ]
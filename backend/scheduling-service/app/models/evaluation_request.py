@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, List
 from .teacher import Teacher
 from .classroom import Classroom
 from .course import Course
@@ -8,18 +8,62 @@ from .timeslot import Timeslot
 from .constraint import Constraint
 from .scheduled_item import ScheduledItem
 
+# Evaluated schedules may omit sessionType; it has always defaulted to a lecture
+DEFAULT_SESSION_TYPE = "LECTURE"
 
-class ScheduleEvaluationRequest(BaseModel):
+
+def _default_session_types(items: Any) -> Any:
+    if not isinstance(items, list):
+        return items
+    return [
+        {"sessionType": DEFAULT_SESSION_TYPE, **item} if isinstance(item, dict) else item
+        for item in items
+    ]
+
+
+class ScheduleProblemData(BaseModel):
     """
-    Request model for evaluating an existing schedule.
-    
-    Contains all necessary data to perform a fitness evaluation
-    including the schedule items and supporting data.
+    Static problem data shared by evaluation requests.
+
+    Everything needed to build a fitness evaluator, independent of the
+    schedule(s) being evaluated.
     """
-    schedule: List[ScheduledItem]
     teachers: List[Teacher]
     rooms: List[Classroom]
     studentGroups: List[StudentGroup]
     courses: List[Course]
     timeslots: List[Timeslot]
-    constraints: List[Constraint] 
\ No newline at end of file
+    constraints: List[Constraint]
+
+
+class ScheduleEvaluationRequest(ScheduleProblemData):
+    """
+    Request model for evaluating an existing schedule.
+    
+    Contains all necessary data to perform a fitness evaluation
+    including the schedule items and supporting data.
+    """
+    schedule: List[ScheduledItem]
+
+    @field_validator("schedule", mode="before")
+    @classmethod
+    def default_session_type(cls, schedule: Any) -> Any:
+        return _default_session_types(schedule)
+
+
+class ScheduleBatchEvaluationRequest(ScheduleProblemData):
+    """
+    Request model for evaluating several candidate schedules against the same data.
+
+    Used to compare alternatives in a single call.
+    """
+    schedules: List[List[ScheduledItem]] = Field(
+        ..., description="Candidate schedules to evaluate", min_length=1
+    )
+
+    @field_validator("schedules", mode="before")
+    @classmethod
+    def default_session_types(cls, schedules: Any) -> Any:
+        if not isinstance(schedules, list):
+            return schedules
+        return [_default_session_types(schedule) for schedule in schedules]
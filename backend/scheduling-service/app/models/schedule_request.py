@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from .course import Course
 from .teacher import Teacher
@@ -22,4 +22,15 @@ class ScheduleApiRequest(BaseModel):
     rooms: List[Classroom] = Field(..., description="List of available classrooms")
     timeslots: List[Timeslot] = Field(..., description="List of available timeslots")
     constraints: List[Constraint] = Field(..., description="List of scheduling constraints")
-    timeLimit: Optional[int] = Field(None, description="Time limit in seconds for schedule generation (max 300)") 
\ No newline at end of file
+    timeLimit: Optional[int] = Field(None, description="Time limit in seconds for schedule generation (max 300)")
+    seed: Optional[int] = Field(
+        None, description="Random seed for a reproducible run. A random seed is used when omitted", ge=0
+    )
+    profile: bool = Field(
+        False, description="Collect per-validator and per-GA-phase timings for this run"
+    )
+    optimizationMode: Optional[Literal["scalar", "nsga2"]] = Field(
+        None,
+        description="'nsga2' optimizes the objectives separately and also returns a Pareto "
+        "front of schedules. Defaults to the service configuration",
+    ) 
\ No newline at end of file
@@ -1,8 +1,9 @@
-# For profiling the fitness evaluator
-import time  # TODO: Remove
+import copy
+import time
 
 from app.services.FitnessReport import FitnessReport, ConstraintViolation
 from app.services.PenaltyManager import PenaltyManager
+from app.services.Profiling import Profiler
 from app.services.SchedulingConstraintRegistry import SchedulingConstraintRegistry
 from app.services.constraints.ConstraintFactory import ConstraintValidatorFactory
 from app.services.constraints.BaseConstraint import ConstraintContext
@@ -43,6 +44,7 @@ class ScheduleFitnessEvaluator:
         days: List[str],
         constraint_registry: SchedulingConstraintRegistry,
         penalty_manager: Optional[PenaltyManager] = None,
+        profiler: Optional[Profiler] = None,
     ):
         self.teachers = teachers
         self.rooms = rooms
@@ -52,6 +54,9 @@ class ScheduleFitnessEvaluator:
         self.days = days
         self.constraint_registry = constraint_registry
 
+        # Opt-in per-validator instrumentation (cumulative across evaluations)
+        self.profiler = profiler
+
         # Initialize penalty manager with constraint registry
         self.penalty_manager = penalty_manager or PenaltyManager(
             num_courses=len(courses),
@@ -81,6 +86,17 @@ class ScheduleFitnessEvaluator:
             constraint_registry
         )
 
+    def with_profiler(self, profiler: Profiler) -> "ScheduleFitnessEvaluator":
+        """
+        Shallow copy of this evaluator that records into `profiler`.
+
+        Validators, maps and the penalty manager are shared, so this is cheap and leaves
+        a cached evaluator untouched.
+        """
+        profiled = copy.copy(self)
+        profiled.profiler = profiler
+        return profiled
+
     def _calculate_ects_threshold(self) -> float:
         """Calculate dynamic ECTS threshold based on course distribution (top 20%)."""
         ects_values = [
@@ -94,7 +110,7 @@ class ScheduleFitnessEvaluator:
         """
         Evaluate a complete schedule using class-based constraint validators.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         violations: List[ConstraintViolation] = []
 
         # Create context once for the entire schedule evaluation
@@ -108,6 +124,9 @@ class ScheduleFitnessEvaluator:
             timeslot_order=self.timeslot_order,
         )
 
+        if self.profiler is not None:
+            return self._evaluate_profiled(schedule, context, start_time)
+
         # Evaluate each scheduled item with gene-level validators
         for gene_index, scheduled_item in enumerate(schedule):
             # Update context for current gene
@@ -124,18 +143,51 @@ class ScheduleFitnessEvaluator:
             violations.extend(schedule_violations)
 
         # Compile results
-        evaluation_time = time.time() - start_time
+        evaluation_time = time.perf_counter() - start_time
         return self._compile_fitness_report(violations, evaluation_time)
 
+    def _evaluate_profiled(
+        self, schedule: List[ScheduledItem], context: ConstraintContext, start_time: float
+    ) -> FitnessReport:
+        """
+        Same as evaluate(), but times every validator call. The per-evaluation breakdown is
+        attached to the report and merged into the cumulative profiler.
+        """
+        violations: List[ConstraintViolation] = []
+        evaluation_profile = Profiler()
+        perf_counter = time.perf_counter
+
+        for gene_index, scheduled_item in enumerate(schedule):
+            context.update_current_gene(scheduled_item, gene_index)
+            for validator in self.gene_validators:
+                validator_start = perf_counter()
+                item_violations = validator.validate(context)
+                evaluation_profile.record(
+                    type(validator).__name__, perf_counter() - validator_start, len(item_violations)
+                )
+                violations.extend(item_violations)
+
+        for validator in self.schedule_validators:
+            validator_start = perf_counter()
+            schedule_violations = validator.validate(context)
+            evaluation_profile.record(
+                type(validator).__name__, perf_counter() - validator_start, len(schedule_violations)
+            )
+            violations.extend(schedule_violations)
+
+        self.profiler.merge(evaluation_profile)
+
+        evaluation_time = perf_counter() - start_time
+        report = self._compile_fitness_report(violations, evaluation_time)
+        report.validator_profile = evaluation_profile.snapshot()
+        return report
+
     def _compile_fitness_report(
         self, violations: List[ConstraintViolation], evaluation_time: float
     ) -> FitnessReport:
         """Compile violations into a comprehensive fitness report."""
 
         # Categorize violations
-        violation_summary: Dict[
-            SchedulingConstraintCategory, List[ConstraintViolation]
-        ] = {}
         hard_constraint_scores: Dict[SchedulingConstraintCategory, int] = {}
         soft_constraint_scores: Dict[SchedulingConstraintCategory, float] = {}
 
@@ -143,11 +195,6 @@ class ScheduleFitnessEvaluator:
         total_soft_penalty = 0.0
 
         for violation in violations:
-            # Add to summary
-            if violation.constraint_category not in violation_summary:
-                violation_summary[violation.constraint_category] = []
-            violation_summary[violation.constraint_category].append(violation)
-
             # Update scores
             if violation.constraint_type == SchedulingConstraintType.HARD:
                 hard_constraint_scores[violation.constraint_category] = (
@@ -180,7 +227,6 @@ class ScheduleFitnessEvaluator:
             hard_constraint_scores=hard_constraint_scores,
             soft_constraint_scores=soft_constraint_scores,
             violations=violations,
-            violation_summary=violation_summary,
             is_feasible=(total_hard_violations == 0),
             fitness_vector=fitness_vector,
             evaluation_time=evaluation_time,
@@ -1,29 +1,56 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from app.models import ScheduledItem
 from app.services.SchedulingConstraint import SchedulingConstraintCategory, SchedulingConstraintType
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintViolation:
-    """Represents a specific constraint violation with detailed information."""
+    """
+    Represents a specific constraint violation with detailed information.
+
+    Violations reference genes by their index in the evaluated chromosome instead of
+    holding on to the ScheduledItem objects, so reports stay small and do not keep
+    whole populations alive.
+    """
 
     constraint_category: SchedulingConstraintCategory
     constraint_type: SchedulingConstraintType
     severity: float  # How severe this violation is (for soft constraints, this could be the penalty)
-    scheduled_item: ScheduledItem
+    gene_index: int  # Index of the offending gene in the evaluated chromosome
     description: str
-    conflicting_item: Optional[ScheduledItem] = None  # For conflicts with other items
+    conflicting_gene_index: Optional[int] = None  # For conflicts with other genes
+
+    def get_scheduled_item(self, schedule: List[ScheduledItem]) -> ScheduledItem:
+        """Resolve the offending gene against the schedule that was evaluated."""
+        return schedule[self.gene_index]
+
+    def get_conflicting_item(self, schedule: List[ScheduledItem]) -> Optional[ScheduledItem]:
+        """Resolve the conflicting gene (if any) against the schedule that was evaluated."""
+        if self.conflicting_gene_index is None:
+            return None
+        return schedule[self.conflicting_gene_index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact, JSON-ready form. Genes are referenced by index, not copied."""
+        return {
+            "category": self.constraint_category.value,
+            "type": self.constraint_type.value,
+            "severity": self.severity,
+            "gene_index": self.gene_index,
+            "conflicting_gene_index": self.conflicting_gene_index,
+            "description": self.description,
+        }
 
     def __str__(self) -> str:
         base = f"{self.constraint_category.value}: {self.description}"
-        if self.conflicting_item:
-            base += f" (conflicts with {self.conflicting_item.courseName})"
+        if self.conflicting_gene_index is not None:
+            base += f" (conflicts with gene #{self.conflicting_gene_index})"
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class FitnessReport:
     """Comprehensive fitness evaluation results."""
 
@@ -37,7 +64,6 @@ class FitnessReport:
 
     # Qualitative feedback
     violations: List[ConstraintViolation]
-    violation_summary: Dict[SchedulingConstraintCategory, List[ConstraintViolation]]
 
     # Overall metrics
     is_feasible: bool  # True if no hard constraint violations
@@ -46,9 +72,52 @@ class FitnessReport:
     ]  # [hard_violations, soft_penalty, category1, category2, ...]
     evaluation_time: float
 
+    # Opt-in profiling data, only set when profiling is enabled. validator_profile covers this
+    # evaluation, or the whole run for the report returned by GeneticScheduler.run, which
+    # also carries the GA phase timings.
+    validator_profile: Optional[Dict[str, Dict[str, float]]] = None
+    phase_profile: Optional[Dict[str, Dict[str, float]]] = None
+
+    @property
+    def violation_summary(self) -> Dict[SchedulingConstraintCategory, List[ConstraintViolation]]:
+        """Violations grouped by category. Derived on demand from `violations`."""
+        summary: Dict[SchedulingConstraintCategory, List[ConstraintViolation]] = {}
+        for violation in self.violations:
+            summary.setdefault(violation.constraint_category, []).append(violation)
+        return summary
+
+    def to_dict(self, include_violations: bool = False) -> Dict[str, Any]:
+        """
+        Compact, JSON-ready form of the report.
+
+        Category scores are keyed by category name. Individual violations are large for
+        poor schedules, so they are only included on request; the count is always present.
+        """
+        data: Dict[str, Any] = {
+            "is_feasible": self.is_feasible,
+            "total_hard_violations": self.total_hard_violations,
+            "total_soft_penalty": self.total_soft_penalty,
+            "hard_constraint_scores": {
+                category.value: score for category, score in self.hard_constraint_scores.items()
+            },
+            "soft_constraint_scores": {
+                category.value: score for category, score in self.soft_constraint_scores.items()
+            },
+            "fitness_vector": self.fitness_vector,
+            "evaluation_time": self.evaluation_time,
+            "violation_count": len(self.violations),
+        }
+        if include_violations:
+            data["violations"] = [violation.to_dict() for violation in self.violations]
+        if self.validator_profile is not None:
+            data["validator_profile"] = self.validator_profile
+        if self.phase_profile is not None:
+            data["phase_profile"] = self.phase_profile
+        return data
+
     def get_violation_count_by_category(self, category: SchedulingConstraintCategory) -> int:
         """Get count of violations for a specific category."""
-        return len(self.violation_summary.get(category, []))
+        return sum(1 for v in self.violations if v.constraint_category == category)
 
     def get_violations_by_type(
         self, constraint_type: SchedulingConstraintType
@@ -64,6 +133,19 @@ class FitnessReport:
         print(f"Soft Penalty: {self.total_soft_penalty:.2f}")
         print(f"Evaluation Time: {self.evaluation_time:.4f}s")
 
+        if self.validator_profile:
+            print(f"\nValidator Timing:")
+            for name, stats in self.validator_profile.items():
+                print(
+                    f"  {name}: {stats['total_time'] * 1000:.2f}ms over {stats['calls']} calls, "
+                    f"{stats['violations']} violations"
+                )
+
+        if self.phase_profile:
+            print(f"\nGA Phase Timing:")
+            for name, stats in self.phase_profile.items():
+                print(f"  {name}: {stats['total_time']:.3f}s over {stats['calls']} calls")
+
         if self.hard_constraint_scores:
             print(f"\nHard Constraint Breakdown:")
             for category, count in self.hard_constraint_scores.items():
@@ -7,9 +7,20 @@ from app.models import (
     Timeslot,
     Constraint,
 )
-from app.services.Fitness import ScheduleFitnessEvaluator, FitnessReport
-from app.services.SchedulingConstraintRegistry import SchedulingConstraintRegistry
-from typing import List, Tuple, Optional
+from app.services.Fitness import FitnessReport
+from app.services.MultiObjective import (
+    DEFAULT_OBJECTIVES,
+    OBJECTIVES,
+    ParetoSolution,
+    non_dominated_ranks,
+    objective_matrix,
+    select_survivors,
+)
+from app.services.ProblemCache import CompiledProblem
+from app.services.Profiling import Profiler
+from contextlib import nullcontext
+from enum import Enum
+from typing import Dict, List, Sequence, Tuple, Optional
 import random
 import time
 import numpy as np
@@ -30,11 +41,66 @@ STAGNATION_THRESHOLD = 50  # Generations without improvement to trigger adaptati
 EARLY_STOP_THRESHOLD = 150  # Generations of stagnation before early stopping
 MUTATION_BOOST_FACTOR = 3.0  # How much to increase mutation rate during stagnation
 
+# --- Restart Parameters (StagnationStrategy.RESTART) ---
+RESTART_PERTURBED_FRACTION = 0.5  # Share of re-seeded individuals derived from the best solution
+RESTART_PERTURBATION_RATE = 0.3  # Probability of reassigning each gene of a perturbed copy
+
+# --- Time Budget Parameters ---
+DEADLINE_RESERVE_FRACTION = 0.05  # Share of the time limit kept for the final report/response
+MIN_DEADLINE_RESERVE_SECONDS = 0.5
+GENERATION_COST_SMOOTHING = 0.3  # Weight of the latest generation in the moving cost average
+
+# --- Population Sizing Parameters (PopulationSizing.AUTO / ADAPTIVE) ---
+MIN_AUTO_POPULATION_SIZE = 20
+MAX_AUTO_POPULATION_SIZE = 200
+AUTO_TARGET_GENERATIONS = 300  # Generations the chosen size should fit into the time budget
+CALIBRATION_SAMPLE_SIZE = 5  # Chromosomes evaluated to measure throughput
+CALIBRATION_BUDGET_FRACTION = 0.02  # Calibration stops early after this share of the time limit
+TOURNAMENT_SIZE_FRACTION = 0.03  # Tournament size grows with the population for selection pressure
+MAX_TOURNAMENT_SIZE = 7
+POPULATION_ADAPT_INTERVAL = 20  # Generations between resize decisions (ADAPTIVE only)
+POPULATION_RESIZE_FACTOR = 1.25
+LOW_DIVERSITY = 0.05  # Grow below this (when stagnating), shrink above the high mark
+HIGH_DIVERSITY = 0.5
+
+# --- Genotype Diversity Parameters ---
+DIVERSITY_SAMPLE_PAIRS = 256  # Chromosome pairs sampled for the mean Hamming distance
+
 # --- Diversity-Guided Mutation Parameters ---
 MIN_HEURISTIC_PROBABILITY = 0.1  # Minimum probability for heuristic mutation (exploration)
 MAX_HEURISTIC_PROBABILITY = 0.9  # Maximum probability for heuristic mutation (exploitation)
 
 
+class ReportRetention(Enum):
+    """How many detailed fitness reports the scheduler keeps while evolving."""
+
+    NONE = "none"  # Keep no reports; use get_best_solution_report() after the run
+    BEST = "best"  # Keep only the report of the best solution found so far
+    FULL = "full"  # Keep every report of the current generation (debugging only)
+
+
+class OptimizationMode(Enum):
+    """How chromosomes are compared."""
+
+    SCALAR = "scalar"  # Weighted sum of hard violations and soft penalty
+    NSGA2 = "nsga2"  # Pareto ranking + crowding over the selected objectives (see MultiObjective)
+
+
+class StagnationStrategy(Enum):
+    """What the scheduler does after EARLY_STOP_THRESHOLD generations without improvement."""
+
+    EARLY_STOP = "early_stop"  # Return the best solution found so far
+    RESTART = "restart"  # Keep the elites, re-seed the rest and continue until the time limit
+
+
+class PopulationSizing(Enum):
+    """How the scheduler chooses its population size."""
+
+    FIXED = "fixed"  # Use population_size as given
+    AUTO = "auto"  # Calibrate throughput at the start of the run and size for the time budget
+    ADAPTIVE = "adaptive"  # AUTO, then grow/shrink during the run based on diversity
+
+
 class GeneticScheduler:
     def __init__(
         self,
@@ -49,7 +115,15 @@ class GeneticScheduler:
         gene_mutation_rate: float = GENE_MUTATION_RATE,
         chromosome_mutation_rate: float = CHROMOSOME_MUTATION_RATE,
         use_detailed_fitness: bool = True,
-        time_limit: int = MAX_DURATION_SECONDS,
+        time_limit: float = MAX_DURATION_SECONDS,
+        report_retention: ReportRetention = ReportRetention.BEST,
+        seed: Optional[int] = None,
+        profile: bool = False,
+        compiled_problem: Optional[CompiledProblem] = None,
+        population_sizing: PopulationSizing = PopulationSizing.FIXED,
+        stagnation_strategy: StagnationStrategy = StagnationStrategy.EARLY_STOP,
+        optimization_mode: OptimizationMode = OptimizationMode.SCALAR,
+        objectives: Sequence[str] = DEFAULT_OBJECTIVES,
     ):
         self.courses = courses
         self.teachers = teachers
@@ -57,35 +131,72 @@ class GeneticScheduler:
         self.student_groups = student_groups
         self.timeslots = timeslots
         self.days = days
+        # With AUTO/ADAPTIVE sizing population_size only seeds the initial population and is
+        # replaced by the calibrated size (see _calibrate_population_size)
         self.population_size = population_size
+        self.population_sizing = PopulationSizing(population_sizing)
+        self.tournament_size = SELECTION_TOURNAMENT_SIZE
+        self.stagnation_strategy = StagnationStrategy(stagnation_strategy)
+
+        # NSGA-II mode: selection and survival use Pareto ranks over `objectives`, while the
+        # scalar fitness still tracks the returned best solution, stagnation and feasibility
+        self.optimization_mode = OptimizationMode(optimization_mode)
+        unknown_objectives = [name for name in objectives if name not in OBJECTIVES]
+        if unknown_objectives:
+            raise ValueError(f"Unknown objectives: {unknown_objectives}")
+        if self.optimization_mode == OptimizationMode.NSGA2 and not use_detailed_fitness:
+            raise ValueError("NSGA-II mode needs detailed fitness reports")
+        self.objectives = tuple(objectives)
+        self.generation_objectives: Optional[np.ndarray] = None
+        # Survivors of the last NSGA-II generation: (chromosomes, scalar scores, objectives)
+        self._nsga2_archive: Optional[
+            Tuple[List[List[ScheduledItem]], List[float], np.ndarray]
+        ] = None
+        self.pareto_front: List[ParetoSolution] = []
         self.gene_mutation_rate = gene_mutation_rate
         self.chromosome_mutation_rate = chromosome_mutation_rate
         self.use_detailed_fitness = use_detailed_fitness
         self.time_limit = time_limit
-
-        # Initialize the constraint registry
-        self.constraint_registry = SchedulingConstraintRegistry(constraints)
-        self.constraint_registry.print_summary()
-
-        # Create maps for faster lookups (keeping existing functionality)
-        self.teacher_map = {teacher.teacherId: teacher for teacher in teachers}
-        self.room_map = {room.classroomId: room for room in rooms}
-        self.course_map = {course.courseId: course for course in courses}
-        self.student_group_map = {sg.studentGroupId: sg for sg in student_groups}
-        self.timeslot_map = {ts.code: ts for ts in timeslots}
-
-        # Initialize the new fitness evaluator with constraint registry
-        self.fitness_evaluator = ScheduleFitnessEvaluator(
-            teachers,
-            rooms,
-            student_groups,
-            courses,
-            timeslots,
-            days,
-            constraint_registry=self.constraint_registry,
+        # Time kept free at the end of the budget for the final report and serialization,
+        # never more than half the budget
+        self.deadline_reserve = min(
+            max(MIN_DEADLINE_RESERVE_SECONDS, DEADLINE_RESERVE_FRACTION * time_limit),
+            0.5 * time_limit,
         )
+        self.report_retention = ReportRetention(report_retention)
+
+        # Per-instance random state so runs are reproducible and concurrent jobs don't share
+        # the global generators. A seed is drawn when none is given so it can still be reported.
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.np_rng = np.random.default_rng(self.seed)
+
+        # Static problem setup (constraint registry, penalty bounds, validators, lookup maps,
+        # room/timeslot domains). Callers can pass a cached CompiledProblem to skip it.
+        self.problem = compiled_problem or CompiledProblem(
+            teachers, rooms, student_groups, courses, timeslots, days, constraints
+        )
+        self.constraint_registry = self.problem.constraint_registry
 
-        # For storing detailed fitness reports during evolution
+        # Create maps for faster lookups (keeping existing functionality)
+        self.teacher_map = self.problem.teacher_map
+        self.room_map = self.problem.room_map
+        self.course_map = self.problem.course_map
+        self.student_group_map = self.problem.student_group_map
+        self.timeslot_map = self.problem.timeslot_map
+
+        # Opt-in instrumentation: per-validator timings (inside the evaluator) and per-phase
+        # timings of the GA loop (selection, crossover, mutation, evaluation)
+        self.validator_profiler = Profiler() if profile else None
+        self.phase_profiler = Profiler() if profile else None
+        self._no_profile = nullcontext()
+
+        # The shared evaluator is stateless; profiling gets a private copy with its own profiler
+        self.fitness_evaluator = self.problem.fitness_evaluator
+        if self.validator_profiler is not None:
+            self.fitness_evaluator = self.fitness_evaluator.with_profiler(self.validator_profiler)
+
+        # Detailed reports of the latest generation, only populated with ReportRetention.FULL
         self.last_generation_reports: List[FitnessReport] = []
 
         # Adaptive algorithm tracking
@@ -96,32 +207,73 @@ class GeneticScheduler:
 
         # Diversity-guided mutation tracking
         self.heuristic_mutation_probability = 0.9  # Start with balanced approach
-        self.fitness_diversity_history = []
+        self.diversity_history = []
+
+        # Run statistics, reset at the start of every run (used by benchmarks and metrics)
+        self.generations_completed = 0
+        self.evaluations_count = 0
+        self.time_to_feasible: Optional[float] = None
+        self.duplicates_replaced = 0
+        self.restarts = 0
+        self.run_duration = 0.0
 
     def run(
         self, generations: int = MAX_GENERATIONS
     ) -> Tuple[Optional[List[ScheduledItem]], float, Optional[FitnessReport]]:
+        # Initialization counts against the time budget as well
+        start_time = time.perf_counter()
+        self.generations_completed = 0
+        self.evaluations_count = 0
+        self.time_to_feasible = None
+        self.duplicates_replaced = 0
+        self.restarts = 0
+        self._nsga2_archive = None
+        self.pareto_front = []
         population = self.initialize_population()
+        deadline = start_time + self.time_limit - self.deadline_reserve
+        if self.population_sizing != PopulationSizing.FIXED:
+            population = self._calibrate_population_size(population, deadline)
+        encoded_population = self._replace_duplicates(population)
         best_solution_overall = None
         best_fitness_overall = float("inf")
         best_report_overall = None
 
-        start_time = time.time()
+        # Moving average of the wall time of one generation (evolve + evaluate), used to
+        # decide whether another generation still fits before the deadline
+        generation_cost: Optional[float] = None
+        last_checkpoint = start_time
         generation = 0
+        archived = True
 
         while generation < generations:
-            # Evaluate population with detailed fitness
-            fitness_scores, fitness_reports = self._evaluate_population(population)
-            self.last_generation_reports = fitness_reports
+            restart_population: Optional[List[List[ScheduledItem]]] = None
+
+            # Evaluate population with detailed fitness; stops early once the deadline passes
+            with self._measure("evaluation"):
+                fitness_scores, generation_best_report = self._evaluate_population(
+                    population, deadline
+                )
+            evaluation_complete = len(fitness_scores) == len(population)
+            evaluated_population = population
+            archived = False
+            self.generations_completed += 1
 
             # Update diversity-guided mutation probability
-            self._update_heuristic_mutation_probability(fitness_scores)
+            diversity = self._calculate_population_diversity(encoded_population)
+            self._update_heuristic_mutation_probability(diversity)
 
             # Find current best in this generation
             min_fitness_current_gen = min(fitness_scores)
             idx_min_fitness_current_gen = fitness_scores.index(min_fitness_current_gen)
 
-            elapsed_time = time.time() - start_time
+            now = time.perf_counter()
+            elapsed_time = now - start_time
+            latest_cost = now - last_checkpoint
+            last_checkpoint = now
+            if generation_cost is None:
+                generation_cost = latest_cost
+            else:
+                generation_cost += GENERATION_COST_SMOOTHING * (latest_cost - generation_cost)
 
             # Check for improvement and handle stagnation
             if min_fitness_current_gen < best_fitness_overall:
@@ -130,7 +282,13 @@ class GeneticScheduler:
                     item.model_copy()
                     for item in population[idx_min_fitness_current_gen]
                 ]
-                best_report_overall = fitness_reports[idx_min_fitness_current_gen]
+                best_report_overall = generation_best_report
+                if (
+                    self.time_to_feasible is None
+                    and best_report_overall is not None
+                    and best_report_overall.is_feasible
+                ):
+                    self.time_to_feasible = elapsed_time
 
                 # Reset stagnation tracking on improvement
                 self.stagnation_counter = 0
@@ -144,7 +302,7 @@ class GeneticScheduler:
                 print(f"Generation {generation} / {generations}", end=" ")
                 print(f"New Best Fitness: {best_fitness_overall:.2f}", end=" ")
                 print(
-                    f"Hard Violations: {best_report_overall.total_hard_violations}",
+                    f"Hard Violations: {best_report_overall.total_hard_violations if best_report_overall else 'N/A'}",
                     end=" ",
                 )
                 print(f"Time: {elapsed_time:.2f}s")
@@ -158,23 +316,30 @@ class GeneticScheduler:
                     self.is_mutation_boosted = True
                     print(f"Generation {generation}: Stagnation detected. Boosting mutation rate to {self.chromosome_mutation_rate:.3f}")
                 
-                # Early stopping if prolonged stagnation
-                if self.stagnation_counter >= EARLY_STOP_THRESHOLD:
-                    print(f"Early stopping at generation {generation} due to prolonged stagnation ({self.stagnation_counter} generations)")
-                    break
+                # Early stopping (or restart) if prolonged stagnation. A partially evaluated
+                # population means the time limit is up; the check below stops the run
+                if self.stagnation_counter >= EARLY_STOP_THRESHOLD and evaluation_complete:
+                    if self.stagnation_strategy == StagnationStrategy.EARLY_STOP:
+                        print(f"Early stopping at generation {generation} due to prolonged stagnation ({self.stagnation_counter} generations)")
+                        break
+                    print(f"Restarting at generation {generation} after {self.stagnation_counter} generations of stagnation")
+                    restart_population = self._restart_population(
+                        population, fitness_scores, best_solution_overall
+                    )
 
             if best_fitness_overall == 0:  # Check for perfect solution
                 print(f"Perfect solution found!", end=" ")
                 print(f"Generations: {generation}/{generations}", end=" ")
                 print(f"Time: {elapsed_time:.2f}s")
                 break
-            elif elapsed_time > self.time_limit:
+            elif not evaluation_complete or now + generation_cost > deadline:
                 print(f"Time limit reached after {generation} generations", end=" ")
+                if not evaluation_complete:
+                    print(f"(evaluated {len(fitness_scores)}/{len(population)})", end=" ")
                 print(f"Best fitness: {best_fitness_overall}", end=" ")
                 print(f"Time: {elapsed_time:.2f}s")
                 break
             elif generation > 0 and generation % 100 == 0:
-                diversity = self._calculate_population_diversity(fitness_scores)
                 print(f"Generation {generation:>4d}", end=" ")
                 print(f"Fitness: {best_fitness_overall}", end=" ")
                 print(
@@ -186,10 +351,45 @@ class GeneticScheduler:
                 print(f"Heuristic%: {self.heuristic_mutation_probability:.2f}", end=" ")
                 print(f"Time: {elapsed_time:.2f}s")
 
-            population = self.evolve(population, fitness_scores)
+            if (
+                self.population_sizing == PopulationSizing.ADAPTIVE
+                and generation > 0
+                and generation % POPULATION_ADAPT_INTERVAL == 0
+            ):
+                previous_size = self.population_size
+                self._adapt_population_size(diversity, (deadline - now) / generation_cost)
+                # evolve() produces the new size; scale the cost estimate along with it
+                generation_cost *= self.population_size / previous_size
+
+            if restart_population is not None:
+                if self.optimization_mode == OptimizationMode.NSGA2:
+                    # Fold the stagnated generation into the archive before starting over
+                    self._nsga2_survival(population, fitness_scores)
+                    archived = True
+                population = restart_population
+            elif self.optimization_mode == OptimizationMode.NSGA2:
+                # Offspring compete with the previous survivors; evolve() then breeds from the
+                # survivors using their crowded-comparison keys as tournament scores
+                survivors, selection_keys = self._nsga2_survival(population, fitness_scores)
+                archived = True
+                population = self.evolve(survivors, selection_keys)
+            else:
+                population = self.evolve(population, fitness_scores)
+            encoded_population = self._replace_duplicates(population)
             generation += 1
 
-        final_elapsed_time = time.time() - start_time
+        if self.optimization_mode == OptimizationMode.NSGA2:
+            if not archived:
+                # The last evaluated generation never went through survival
+                self._archive_evaluated(evaluated_population, fitness_scores)
+            self.pareto_front = self._extract_pareto_front()
+
+        final_elapsed_time = time.perf_counter() - start_time
+        self.run_duration = final_elapsed_time
+
+        if self.phase_profiler is not None and best_report_overall is not None:
+            best_report_overall.validator_profile = self.validator_profiler.snapshot()
+            best_report_overall.phase_profile = self.phase_profiler.snapshot()
         if best_fitness_overall > 0:
             print(f"Optimal solution not found after {generation+1} generations.")
             print(f"Time: {final_elapsed_time:.2f}s")
@@ -199,30 +399,78 @@ class GeneticScheduler:
         return best_solution_overall, best_fitness_overall, best_report_overall
 
     def _evaluate_population(
-        self, population: List[List[ScheduledItem]]
-    ) -> Tuple[List[float], List[FitnessReport]]:
-        """Evaluate entire population and return both simple scores and detailed reports."""
+        self, population: List[List[ScheduledItem]], deadline: Optional[float] = None
+    ) -> Tuple[List[float], Optional[FitnessReport]]:
+        """
+        Evaluate entire population and return the scores and the best report of the generation.
+
+        Reports are dropped as soon as their score is known, unless the retention mode asks
+        for them. With ReportRetention.FULL all reports end up in `last_generation_reports`.
+
+        When a `deadline` (time.perf_counter() value) passes, evaluation stops and only the
+        scores of the chromosomes evaluated so far (always at least one) are returned.
+        """
         fitness_scores = []
-        fitness_reports = []
+        generation_reports = []
+        best_report = None
+        best_score = float("inf")
+        keep_best = self.report_retention != ReportRetention.NONE
+        collect_objectives = self.optimization_mode == OptimizationMode.NSGA2
+        fitness_vectors = []
 
         for chromosome in population:
             if self.use_detailed_fitness:
                 report = self.fitness_evaluator.evaluate(chromosome)
-                fitness_reports.append(report)
                 # Use calculated penalty bounds to ensure hard constraints always dominate
                 hard_penalty_weight = self.fitness_evaluator.penalty_manager.min_hard_penalty 
                 score = report.total_hard_violations * hard_penalty_weight + report.total_soft_penalty
                 fitness_scores.append(score)
+
+                if collect_objectives:
+                    fitness_vectors.append(report.fitness_vector)
+                if self.report_retention == ReportRetention.FULL:
+                    generation_reports.append(report)
+                if keep_best and score < best_score:
+                    best_score = score
+                    best_report = report
             else:
                 # Fallback to original fitness function
                 score = self.fitness(chromosome)  # Keep original method
                 fitness_scores.append(score)
-                fitness_reports.append(None)
 
-        return fitness_scores, fitness_reports
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+
+        self.evaluations_count += len(fitness_scores)
+        if collect_objectives:
+            self.generation_objectives = objective_matrix(fitness_vectors, self.objectives)
+        if self.report_retention == ReportRetention.FULL:
+            self.last_generation_reports = generation_reports
+
+        return fitness_scores, best_report
+
+    def _measure(self, phase: str):
+        """Time a GA phase when profiling is enabled, no-op otherwise."""
+        if self.phase_profiler is None:
+            return self._no_profile
+        return self.phase_profiler.measure(phase)
+
+    def get_profile(self) -> Optional[Dict[str, Dict[str, Dict[str, float]]]]:
+        """Cumulative validator and GA phase timings, or None when profiling is disabled."""
+        if self.phase_profiler is None:
+            return None
+        return {
+            "validators": self.validator_profiler.snapshot(),
+            "phases": self.phase_profiler.snapshot(),
+        }
 
     def get_best_solution_report(self, schedule: List[ScheduledItem]) -> FitnessReport:
-        """Get detailed fitness report for any schedule (for external evaluation)."""
+        """
+        Get detailed fitness report for any schedule (for external evaluation).
+
+        This is the way to obtain a full report when the scheduler runs with
+        ReportRetention.NONE.
+        """
         return self.fitness_evaluator.evaluate(schedule)
 
     # Keep all existing methods (initialize_population, selection, crossover, mutate, evolve, fitness)
@@ -247,9 +495,9 @@ class GeneticScheduler:
                     sessionType=course.sessionType,
                     teacherId=course.teacherId,
                     studentGroupIds=course.studentGroupIds,
-                    classroomId=random.choice(self.rooms).classroomId,
-                    timeslot=random.choice(self.timeslots).code,
-                    day=random.choice(self.days),
+                    classroomId=self.rng.choice(self.rooms).classroomId,
+                    timeslot=self.rng.choice(self.timeslots).code,
+                    day=self.rng.choice(self.days),
                 )
             )
 
@@ -267,21 +515,19 @@ class GeneticScheduler:
             new_gene = base_gene.model_copy()
 
             # Heuristic for room selection: try to match room type
-            suitable_rooms_for_type = [
-                room for room in self.rooms if room.type == new_gene.sessionType
-            ]
+            suitable_rooms_for_type = self.problem.rooms_by_type.get(new_gene.sessionType)
 
             chosen_room = None
             if suitable_rooms_for_type:
-                chosen_room = random.choice(suitable_rooms_for_type)
+                chosen_room = self.rng.choice(suitable_rooms_for_type)
             else:
                 if not self.rooms:
                     raise ValueError("No rooms available in the system to assign.")
-                chosen_room = random.choice(self.rooms)
+                chosen_room = self.rng.choice(self.rooms)
 
             new_gene.classroomId = chosen_room.classroomId
-            new_gene.timeslot = random.choice(self.timeslots).code
-            new_gene.day = random.choice(self.days)
+            new_gene.timeslot = self.rng.choice(self.timeslots).code
+            new_gene.day = self.rng.choice(self.days)
             chromosome.append(new_gene)
         return chromosome
 
@@ -290,8 +536,10 @@ class GeneticScheduler:
     ) -> List[List[ScheduledItem]]:
         selected_parents: List[List[ScheduledItem]] = []
         for _ in range(len(population)):
-            tournament_indices = random.sample(
-                range(len(population)), SELECTION_TOURNAMENT_SIZE
+            # rng.sample draws k indices in O(k); np_rng.choice without replacement would
+            # permute the whole population for every tournament
+            tournament_indices = self.rng.sample(
+                range(len(population)), min(self.tournament_size, len(population))
             )
             tournament_fitnesses = [fitness_scores[i] for i in tournament_indices]
             winner_local_idx = tournament_fitnesses.index(min(tournament_fitnesses))
@@ -312,9 +560,10 @@ class GeneticScheduler:
         # Uniform crossover: for each gene, randomly choose parent
         child1 = []
         child2 = []
+        swap_mask = self.np_rng.random(len(parent1)) < 0.5
         
         for i in range(len(parent1)):
-            if random.random() < 0.5:
+            if swap_mask[i]:
                 # Child1 gets gene from parent1, child2 gets gene from parent2
                 child1.append(parent1[i].model_copy())
                 child2.append(parent2[i].model_copy())
@@ -326,23 +575,24 @@ class GeneticScheduler:
         return child1, child2
 
     def mutate(self, chromosome: List[ScheduledItem]) -> List[ScheduledItem]:
-        mutated_chromosome: List[ScheduledItem] = [
-            item.model_copy() for item in chromosome
-        ]
+        with self._measure("mutation"):
+            mutated_chromosome: List[ScheduledItem] = [
+                item.model_copy() for item in chromosome
+            ]
 
-        for i in range(len(mutated_chromosome)):
-            if random.random() < self.gene_mutation_rate:
-                item_to_mutate = mutated_chromosome[i]
-                mutation_type = random.choice(["room", "time", "day", "all"])
+            for i in range(len(mutated_chromosome)):
+                if self.rng.random() < self.gene_mutation_rate:
+                    item_to_mutate = mutated_chromosome[i]
+                    mutation_type = self.rng.choice(["room", "time", "day", "all"])
+
+                    # Use diversity-guided hybrid mutation
+                    if self.rng.random() < self.heuristic_mutation_probability:
+                        # Apply heuristic-guided mutation (exploitation)
+                        mutated_chromosome[i] = self._heuristic_mutate_gene(item_to_mutate, mutation_type)
+                    else:
+                        # Apply purely random mutation (exploration)
+                        mutated_chromosome[i] = self._random_mutate_gene(item_to_mutate, mutation_type)
 
-                # Use diversity-guided hybrid mutation
-                if random.random() < self.heuristic_mutation_probability:
-                    # Apply heuristic-guided mutation (exploitation)
-                    mutated_chromosome[i] = self._heuristic_mutate_gene(item_to_mutate, mutation_type)
-                else:
-                    # Apply purely random mutation (exploration)
-                    mutated_chromosome[i] = self._random_mutate_gene(item_to_mutate, mutation_type)
-                    
         return mutated_chromosome
 
     def evolve(
@@ -354,14 +604,17 @@ class GeneticScheduler:
         sorted_population_indices = sorted(
             range(len(population)), key=lambda k: fitness_scores[k]
         )
-        for i in range(ELITISM_COUNT):
+        # NSGA-II carries its survivors over through the archive instead
+        elitism_count = 0 if self.optimization_mode == OptimizationMode.NSGA2 else ELITISM_COUNT
+        for i in range(elitism_count):
             if i < len(sorted_population_indices):
                 elite = population[sorted_population_indices[i]]
                 new_population.append([item.model_copy() for item in elite])
 
         # Generate offspring
-        parents = self.selection(population, fitness_scores)
-        num_offspring_needed = self.population_size - ELITISM_COUNT
+        with self._measure("selection"):
+            parents = self.selection(population, fitness_scores)
+        num_offspring_needed = self.population_size - elitism_count
         offspring_generated = 0
         parent_idx = 0
 
@@ -369,17 +622,18 @@ class GeneticScheduler:
             if parent_idx + 1 < len(parents):
                 p1 = parents[parent_idx]
                 p2 = parents[parent_idx + 1]
-                child1, child2 = self.crossover(p1, p2)
+                with self._measure("crossover"):
+                    child1, child2 = self.crossover(p1, p2)
                 parent_idx += 2
 
-                if random.random() < self.chromosome_mutation_rate:
+                if self.rng.random() < self.chromosome_mutation_rate:
                     new_population.append(self.mutate(child1))
                 else:
                     new_population.append(child1)
                 offspring_generated += 1
 
                 if offspring_generated < num_offspring_needed:
-                    if random.random() < self.chromosome_mutation_rate:
+                    if self.rng.random() < self.chromosome_mutation_rate:
                         new_population.append(self.mutate(child2))
                     else:
                         new_population.append(child2)
@@ -387,7 +641,7 @@ class GeneticScheduler:
             else:
                 if parent_idx < len(parents):
                     p_last = parents[parent_idx]
-                    if random.random() < self.chromosome_mutation_rate:
+                    if self.rng.random() < self.chromosome_mutation_rate:
                         new_population.append(self.mutate(p_last))
                     else:
                         new_population.append([item.model_copy() for item in p_last])
@@ -405,30 +659,240 @@ class GeneticScheduler:
         hard_penalty_weight = self.fitness_evaluator.penalty_manager.min_hard_penalty
         return report.total_hard_violations * hard_penalty_weight + report.total_soft_penalty
 
-    def _calculate_population_diversity(self, fitness_scores: List[float]) -> float:
-        """Calculate population diversity using standard deviation of fitness scores."""
-        if len(fitness_scores) < 2:
+    def _archive_evaluated(
+        self, population: List[List[ScheduledItem]], fitness_scores: List[float]
+    ) -> Tuple[List[List[ScheduledItem]], List[float], np.ndarray]:
+        """Merge the evaluated prefix of `population` into the NSGA-II archive and return it."""
+        evaluated = population[: len(fitness_scores)]
+        objectives = self.generation_objectives[: len(fitness_scores)]
+        if self._nsga2_archive is not None:
+            archive_population, archive_scores, archive_objectives = self._nsga2_archive
+            evaluated = archive_population + evaluated
+            fitness_scores = archive_scores + fitness_scores
+            objectives = np.vstack([archive_objectives, objectives])
+        self._nsga2_archive = (evaluated, list(fitness_scores), objectives)
+        return self._nsga2_archive
+
+    def _nsga2_survival(
+        self, population: List[List[ScheduledItem]], fitness_scores: List[float]
+    ) -> Tuple[List[List[ScheduledItem]], List[float]]:
+        """
+        (mu + lambda) environmental selection over the previous survivors and the new offspring.
+        Returns the survivors, best first, with their crowded-comparison keys.
+        """
+        with self._measure("nsga2"):
+            candidates, scores, objectives = self._archive_evaluated(population, fitness_scores)
+            indices, keys = select_survivors(objectives, self.population_size)
+            survivors = [candidates[i] for i in indices]
+            self._nsga2_archive = (survivors, [scores[i] for i in indices], objectives[indices])
+        return survivors, keys.tolist()
+
+    def _extract_pareto_front(self) -> List[ParetoSolution]:
+        """Non-dominated schedules of the archive, one per distinct objective vector."""
+        if self._nsga2_archive is None:
+            return []
+        population, scores, objectives = self._nsga2_archive
+        front = np.flatnonzero(non_dominated_ranks(objectives) == 0)
+        _, first_occurrences = np.unique(objectives[front], axis=0, return_index=True)
+        front = sorted(front[first_occurrences], key=lambda i: scores[i])
+        return [
+            ParetoSolution(
+                schedule=population[i],
+                objectives=dict(zip(self.objectives, objectives[i].tolist())),
+                fitness=scores[i],
+            )
+            for i in front
+        ]
+
+    def _restart_population(
+        self,
+        population: List[List[ScheduledItem]],
+        fitness_scores: List[float],
+        best_solution: List[ScheduledItem],
+    ) -> List[List[ScheduledItem]]:
+        """
+        Build a fresh population around the elites: part perturbed copies of the best solution,
+        the rest new constructive chromosomes. Resets the stagnation and mutation-boost state.
+        The NSGA-II archive is kept, so the restarted population competes with the front found
+        so far in the next survivor selection.
+        """
+        self.restarts += 1
+        self.stagnation_counter = 0
+        self.diversity_history = []
+        if self.is_mutation_boosted:
+            self.chromosome_mutation_rate = self.original_chromosome_mutation_rate
+            self.is_mutation_boosted = False
+
+        elite_indices = sorted(range(len(population)), key=lambda k: fitness_scores[k])
+        new_population = [
+            [item.model_copy() for item in population[i]]
+            for i in elite_indices[:ELITISM_COUNT]
+        ]
+
+        num_perturbed = int((self.population_size - len(new_population)) * RESTART_PERTURBED_FRACTION)
+        for _ in range(num_perturbed):
+            new_population.append(
+                [
+                    self._heuristic_mutate_gene(item, "all")
+                    if self.rng.random() < RESTART_PERTURBATION_RATE
+                    else item.model_copy()
+                    for item in best_solution
+                ]
+            )
+
+        while len(new_population) < self.population_size:
+            new_population.append(self.initialize_chromosome())
+        return new_population
+
+    def _calibrate_population_size(
+        self, population: List[List[ScheduledItem]], deadline: float
+    ) -> List[List[ScheduledItem]]:
+        """
+        Measure the cost of producing and evaluating one individual and pick the population
+        (and tournament) size that fits AUTO_TARGET_GENERATIONS into the remaining budget.
+        Returns the initial population trimmed or topped up to that size.
+        """
+        calibration_start = time.perf_counter()
+        calibration_deadline = calibration_start + CALIBRATION_BUDGET_FRACTION * self.time_limit
+        sample_size = min(CALIBRATION_SAMPLE_SIZE, len(population))
+        calibrated = 0
+        for i in range(sample_size):
+            # One crossover and one evaluation approximate the per-individual generation cost
+            self.crossover(population[i], population[i - 1])
+            self.fitness_evaluator.evaluate(population[i])
+            calibrated += 1
+            if time.perf_counter() > calibration_deadline:
+                break
+        self.evaluations_count += calibrated
+        if calibrated == 0:
+            # Nothing to measure (no courses, so no individuals); keep the configured size
+            return population
+
+        now = time.perf_counter()
+        cost_per_individual = (now - calibration_start) / calibrated
+        if cost_per_individual > 0:
+            affordable_size = (deadline - now) / (AUTO_TARGET_GENERATIONS * cost_per_individual)
+            self._set_population_size(int(affordable_size))
+        else:
+            # Below the clock's resolution: any size is affordable
+            self._set_population_size(MAX_AUTO_POPULATION_SIZE)
+        print(
+            f"Calibrated {cost_per_individual * 1000:.2f}ms per individual: population size "
+            f"{self.population_size}, tournament size {self.tournament_size}"
+        )
+
+        population = population[: self.population_size]
+        while len(population) < self.population_size:
+            population.append(self.initialize_chromosome())
+        return population
+
+    def _adapt_population_size(self, diversity: float, remaining_generations: float) -> None:
+        """
+        Grow the population when diversity has collapsed and the search stagnates, shrink it
+        while diversity is high to get more generations. Growth only happens while enough
+        generations remain at the larger size to benefit from it.
+        """
+        if (
+            diversity < LOW_DIVERSITY
+            and self.stagnation_counter >= POPULATION_ADAPT_INTERVAL
+            and remaining_generations / POPULATION_RESIZE_FACTOR >= POPULATION_ADAPT_INTERVAL
+        ):
+            new_size = int(self.population_size * POPULATION_RESIZE_FACTOR)
+        elif diversity > HIGH_DIVERSITY:
+            new_size = int(self.population_size / POPULATION_RESIZE_FACTOR)
+        else:
+            return
+
+        previous_size = self.population_size
+        self._set_population_size(new_size)
+        if self.population_size != previous_size:
+            print(
+                f"Population resized {previous_size} -> {self.population_size} "
+                f"(diversity {diversity:.3f})"
+            )
+
+    def _set_population_size(self, size: int) -> None:
+        """Clamp to the AUTO bounds and derive the matching tournament size."""
+        self.population_size = max(MIN_AUTO_POPULATION_SIZE, min(MAX_AUTO_POPULATION_SIZE, size))
+        self.tournament_size = max(
+            2, min(MAX_TOURNAMENT_SIZE, round(self.population_size * TOURNAMENT_SIZE_FRACTION) + 1)
+        )
+
+    def _encode_chromosome(self, chromosome: List[ScheduledItem]) -> List[int]:
+        """One integer per gene combining its room, timeslot and day assignment."""
+        room_index = self.problem.room_index
+        timeslot_index = self.problem.timeslot_index
+        day_index = self.problem.day_index
+        num_timeslots = len(timeslot_index)
+        num_days = len(day_index)
+        return [
+            (room_index[gene.classroomId] * num_timeslots + timeslot_index[gene.timeslot])
+            * num_days
+            + day_index[gene.day]
+            for gene in chromosome
+        ]
+
+    def _encode_population(self, population: List[List[ScheduledItem]]) -> np.ndarray:
+        return np.array([self._encode_chromosome(c) for c in population], dtype=np.int64)
+
+    def _replace_duplicates(self, population: List[List[ScheduledItem]]) -> np.ndarray:
+        """
+        Mutate chromosomes that are exact copies of an earlier one (in place), so no evaluation
+        is spent on a genotype twice in a generation. Returns the encoded population.
+        A duplicate only counts as replaced when its mutant is a genotype not seen before.
+        """
+        with self._measure("deduplication"):
+            encoded = self._encode_population(population)
+            keys = [row.tobytes() for row in encoded]
+        seen = set()
+        for i, key in enumerate(keys):
+            # Elites come first, so they are always the kept copy
+            if key in seen:
+                # Timed as "mutation" by mutate() itself, outside the deduplication phase
+                population[i] = self.mutate(population[i])
+                with self._measure("deduplication"):
+                    encoded[i] = self._encode_chromosome(population[i])
+                    key = encoded[i].tobytes()
+                if key not in seen:
+                    self.duplicates_replaced += 1
+            seen.add(key)
+        return encoded
+
+    def _calculate_population_diversity(self, encoded_population: np.ndarray) -> float:
+        """
+        Genotype diversity: mean normalized Hamming distance between chromosomes, in [0, 1].
+        Uses every pair for small populations and DIVERSITY_SAMPLE_PAIRS random pairs otherwise.
+        """
+        size = len(encoded_population)
+        if size < 2 or encoded_population.shape[1] == 0:
             return 0.0
-        return float(np.std(fitness_scores))
 
-    def _update_heuristic_mutation_probability(self, fitness_scores: List[float]):
+        if size * (size - 1) // 2 <= DIVERSITY_SAMPLE_PAIRS:
+            first, second = np.triu_indices(size, k=1)
+        else:
+            first = self.np_rng.integers(0, size, DIVERSITY_SAMPLE_PAIRS)
+            # Offset in [1, size) so a chromosome is never paired with itself
+            second = (first + self.np_rng.integers(1, size, DIVERSITY_SAMPLE_PAIRS)) % size
+
+        return float(np.mean(encoded_population[first] != encoded_population[second]))
+
+    def _update_heuristic_mutation_probability(self, diversity: float):
         """Update heuristic mutation probability based on population diversity."""
-        diversity = self._calculate_population_diversity(fitness_scores)
-        self.fitness_diversity_history.append(diversity)
+        self.diversity_history.append(diversity)
         
         # Keep only last 10 generations for moving average
-        if len(self.fitness_diversity_history) > 10:
-            self.fitness_diversity_history.pop(0)
+        if len(self.diversity_history) > 10:
+            self.diversity_history.pop(0)
         
         # Calculate average diversity over recent generations
-        avg_diversity = float(np.mean(self.fitness_diversity_history))
+        avg_diversity = float(np.mean(self.diversity_history))
         
         # Normalize diversity to [0, 1] range for probability calculation
         # Higher diversity = more exploitation (higher heuristic probability)
         # Lower diversity = more exploration (lower heuristic probability)
         if avg_diversity > 0:
             # Scale based on observed diversity patterns
-            max_observed_diversity = max(self.fitness_diversity_history) if self.fitness_diversity_history else 1.0
+            max_observed_diversity = max(self.diversity_history) if self.diversity_history else 1.0
             normalized_diversity = min(float(avg_diversity / max_observed_diversity), 1.0)
         else:
             normalized_diversity = 0.0
@@ -441,35 +905,24 @@ class GeneticScheduler:
 
     def _get_suitable_rooms(self, item: ScheduledItem) -> List[Classroom]:
         """Get rooms suitable for a scheduled item based on capacity and type."""
-        suitable_rooms = []
-        
-        # Calculate required capacity
-        required_capacity = 0
-        for sg_id in item.studentGroupIds:
-            if sg_id in self.student_group_map:
-                required_capacity += self.student_group_map[sg_id].size
-        
-        for room in self.rooms:
-            # Check capacity
-            if room.capacity >= required_capacity:
-                # Prefer matching session type, but allow any room if capacity fits
-                suitable_rooms.append(room)
-        
-        # If no rooms found with capacity, fall back to all rooms
-        return suitable_rooms if suitable_rooms else self.rooms
+        # Genes keep their course's student groups, so the precomputed domain applies
+        suitable_rooms = self.problem.suitable_rooms_by_course.get(item.courseId)
+        if suitable_rooms is None:
+            suitable_rooms = self.problem.get_rooms_for_groups(item.studentGroupIds)
+        return suitable_rooms
 
     def _get_available_timeslots_and_days(self, item: ScheduledItem) -> Tuple[List[str], List[str]]:
         """Get available timeslots and days for a teacher based on constraints."""
         # Get teacher availability constraints from registry
         teacher_id = item.teacherId
-        available_timeslots = list(self.timeslots)  # Start with all timeslots
-        available_days = list(self.days)  # Start with all days
+        available_timeslots = self.problem.timeslot_codes  # Start with all timeslots
+        available_days = self.days  # Start with all days
         
         # Filter based on teacher availability constraints if available
         # This is a simplified version - in a full implementation, 
         # you'd check the constraint registry for teacher availability
         
-        return [ts.code for ts in available_timeslots], available_days
+        return available_timeslots, available_days
 
     def _heuristic_mutate_gene(self, item: ScheduledItem, mutation_type: str) -> ScheduledItem:
         """Apply heuristic-guided mutation to a single gene."""
@@ -478,18 +931,18 @@ class GeneticScheduler:
         if mutation_type == "room" or mutation_type == "all":
             suitable_rooms = self._get_suitable_rooms(item)
             if suitable_rooms:
-                new_room = random.choice(suitable_rooms)
+                new_room = self.rng.choice(suitable_rooms)
                 mutated_item.classroomId = new_room.classroomId
 
         if mutation_type == "time" or mutation_type == "all":
             available_timeslots, available_days = self._get_available_timeslots_and_days(item)
             if available_timeslots:
-                mutated_item.timeslot = random.choice(available_timeslots)
+                mutated_item.timeslot = self.rng.choice(available_timeslots)
 
         if mutation_type == "day" or mutation_type == "all":
             available_timeslots, available_days = self._get_available_timeslots_and_days(item)
             if available_days:
-                mutated_item.day = random.choice(available_days)
+                mutated_item.day = self.rng.choice(available_days)
                 
         return mutated_item
 
@@ -499,13 +952,13 @@ class GeneticScheduler:
         
         if mutation_type == "room" or mutation_type == "all":
             if self.rooms:
-                new_room = random.choice(self.rooms)
+                new_room = self.rng.choice(self.rooms)
                 mutated_item.classroomId = new_room.classroomId
 
         if mutation_type == "time" or mutation_type == "all":
-            mutated_item.timeslot = random.choice(self.timeslots).code
+            mutated_item.timeslot = self.rng.choice(self.timeslots).code
 
         if mutation_type == "day" or mutation_type == "all":
-            mutated_item.day = random.choice(self.days)
+            mutated_item.day = self.rng.choice(self.days)
                 
         return mutated_item
@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.models import ScheduledItem
+from app.services.SchedulingConstraint import SchedulingConstraintCategory
+
+# Positions in FitnessReport.fitness_vector: [total_hard, total_soft, one entry per category]
+_CATEGORY_OFFSET = 2
+_CATEGORY_POSITIONS = {
+    category: _CATEGORY_OFFSET + i for i, category in enumerate(SchedulingConstraintCategory)
+}
+
+# Objective name -> fitness_vector positions summed into it (all minimized)
+OBJECTIVES: Dict[str, Tuple[int, ...]] = {
+    "hard_violations": (0,),
+    "soft_penalty": (1,),
+    "teacher_preferences": (
+        _CATEGORY_POSITIONS[SchedulingConstraintCategory.TEACHER_TIME_PREFERENCE],
+        _CATEGORY_POSITIONS[SchedulingConstraintCategory.TEACHER_ROOM_PREFERENCE],
+    ),
+    "room_utilization": (
+        _CATEGORY_POSITIONS[SchedulingConstraintCategory.ROOM_CAPACITY_OVERFLOW],
+    ),
+    "movement": (
+        _CATEGORY_POSITIONS[SchedulingConstraintCategory.TEACHER_CONSECUTIVE_MOVEMENT],
+    ),
+    "compactness": (
+        _CATEGORY_POSITIONS[SchedulingConstraintCategory.TEACHER_SCHEDULE_COMPACTNESS],
+    ),
+    "ects_priority": (
+        _CATEGORY_POSITIONS[SchedulingConstraintCategory.ECTS_PRIORITY_VIOLATION],
+    ),
+}
+
+DEFAULT_OBJECTIVES = ("hard_violations", "teacher_preferences", "room_utilization", "movement")
+
+
+@dataclass(slots=True)
+class ParetoSolution:
+    """One non-dominated schedule of an NSGA-II run."""
+
+    schedule: List[ScheduledItem]
+    objectives: Dict[str, float]
+    fitness: float  # Weighted scalar fitness, for reference and ordering
+
+
+def objective_matrix(
+    fitness_vectors: Sequence[List[float]], objectives: Sequence[str]
+) -> np.ndarray:
+    """Project fitness vectors onto the selected objectives, one row per vector."""
+    vectors = np.asarray(fitness_vectors, dtype=float)
+    if vectors.size == 0:
+        return np.empty((0, len(objectives)))
+    return np.stack(
+        [vectors[:, list(OBJECTIVES[name])].sum(axis=1) for name in objectives], axis=1
+    )
+
+
+def non_dominated_ranks(objectives: np.ndarray) -> np.ndarray:
+    """
+    Fast non-dominated sort (minimization). Returns the front index of every row, 0 being the
+    Pareto front. The dominance relation is computed for all pairs at once, then fronts are
+    peeled off by decrementing domination counts one front at a time.
+    """
+    size = len(objectives)
+    ranks = np.full(size, -1, dtype=np.int64)
+    if size == 0:
+        return ranks
+
+    left = objectives[:, None, :]
+    right = objectives[None, :, :]
+    # dominates[i, j]: row i is no worse than row j everywhere and better somewhere
+    dominates = np.all(left <= right, axis=2) & np.any(left < right, axis=2)
+    domination_count = dominates.sum(axis=0)
+
+    front = np.flatnonzero(domination_count == 0)
+    rank = 0
+    while front.size:
+        ranks[front] = rank
+        domination_count[front] = -1  # Never selected again
+        domination_count -= dominates[front].sum(axis=0)
+        front = np.flatnonzero(domination_count == 0)
+        rank += 1
+    return ranks
+
+
+def crowding_distances(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Crowding distance of every row within its front; boundary rows get infinity."""
+    distances = np.zeros(len(objectives))
+    for rank in np.unique(ranks):
+        members = np.flatnonzero(ranks == rank)
+        if members.size <= 2:
+            distances[members] = np.inf
+            continue
+
+        front = objectives[members]
+        order = np.argsort(front, axis=0, kind="stable")
+        sorted_values = np.take_along_axis(front, order, axis=0)
+        spread = sorted_values[-1] - sorted_values[0]
+        spread[spread == 0] = 1.0
+
+        # Normalized gap between each row's neighbours, per objective
+        gaps = np.zeros_like(front)
+        gaps[1:-1] = (sorted_values[2:] - sorted_values[:-2]) / spread
+        gaps[0] = gaps[-1] = np.inf
+
+        front_distances = np.zeros_like(front)
+        np.put_along_axis(front_distances, order, gaps, axis=0)
+        distances[members] = front_distances.sum(axis=1)
+    return distances
+
+
+def crowded_comparison_keys(ranks: np.ndarray, distances: np.ndarray) -> np.ndarray:
+    """
+    Scalar keys (lower is better) that order rows like NSGA-II's crowded comparison: by front
+    first, then by larger crowding distance. Lets the scalar tournament selection drive NSGA-II.
+    """
+    return ranks + 1.0 / (1.0 + distances)
+
+
+def select_survivors(objectives: np.ndarray, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    NSGA-II environmental selection: indices of the `count` best rows by crowded comparison,
+    best first, together with their crowded-comparison keys.
+    """
+    ranks = non_dominated_ranks(objectives)
+    keys = crowded_comparison_keys(ranks, crowding_distances(objectives, ranks))
+    survivors = np.argsort(keys, kind="stable")[:count]
+    return survivors, keys[survivors]
@@ -0,0 +1,142 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
+
+from pydantic import BaseModel
+
+from app.models import Classroom, Constraint, Course, StudentGroup, Teacher, Timeslot
+from app.services.Fitness import ScheduleFitnessEvaluator
+from app.services.SchedulingConstraintRegistry import SchedulingConstraintRegistry
+
+# Request fields that make up the static problem data
+PROBLEM_FIELDS = {"teachers", "rooms", "studentGroups", "courses", "timeslots", "constraints"}
+
+
+def compute_problem_key(problem: BaseModel, days: List[str]) -> str:
+    """
+    Hash the static problem data of a request.
+
+    Works for any request model exposing the PROBLEM_FIELDS (ScheduleApiRequest and the
+    evaluation requests), so generation and evaluation share cache entries.
+    """
+    digest = hashlib.sha256()
+    # Hash field by field in a fixed order; the request models declare these fields in
+    # different orders
+    for field in sorted(PROBLEM_FIELDS):
+        digest.update(problem.model_dump_json(include={field}).encode())
+    digest.update("|".join(days).encode())
+    return digest.hexdigest()
+
+
+class CompiledProblem:
+    """
+    Everything derived from static problem data that can be shared between requests:
+    the constraint registry, penalty bounds, validators, lookup maps and precomputed
+    assignment domains. Read-only once built, so it is safe to share between jobs.
+    """
+
+    def __init__(
+        self,
+        teachers: List[Teacher],
+        rooms: List[Classroom],
+        student_groups: List[StudentGroup],
+        courses: List[Course],
+        timeslots: List[Timeslot],
+        days: List[str],
+        constraints: List[Constraint],
+    ):
+        self.teachers = teachers
+        self.rooms = rooms
+        self.student_groups = student_groups
+        self.courses = courses
+        self.timeslots = timeslots
+        self.days = days
+
+        self.constraint_registry = SchedulingConstraintRegistry(constraints)
+        self.constraint_registry.print_summary()
+
+        # Builds the penalty manager (including its bound calculations), ECTS threshold,
+        # lookup maps and validators
+        self.fitness_evaluator = ScheduleFitnessEvaluator(
+            teachers,
+            rooms,
+            student_groups,
+            courses,
+            timeslots,
+            days,
+            constraint_registry=self.constraint_registry,
+        )
+        self.penalty_manager = self.fitness_evaluator.penalty_manager
+
+        self.teacher_map = self.fitness_evaluator.teacher_map
+        self.room_map = self.fitness_evaluator.room_map
+        self.course_map = self.fitness_evaluator.course_map
+        self.student_group_map = self.fitness_evaluator.student_group_map
+        self.timeslot_map = self.fitness_evaluator.timeslot_map
+
+        # Precomputed domains used by initialization and mutation
+        self.timeslot_codes = [ts.code for ts in timeslots]
+        self.rooms_by_type: Dict[str, List[Classroom]] = {}
+        for room in rooms:
+            self.rooms_by_type.setdefault(room.type, []).append(room)
+
+        # Integer codes of the mutable gene fields, used to encode chromosomes as arrays
+        self.room_index = {room.classroomId: i for i, room in enumerate(rooms)}
+        self.timeslot_index = {code: i for i, code in enumerate(self.timeslot_codes)}
+        self.day_index = {day: i for i, day in enumerate(days)}
+
+        self.suitable_rooms_by_course: Dict[str, List[Classroom]] = {
+            course.courseId: self.get_rooms_for_groups(course.studentGroupIds)
+            for course in courses
+        }
+
+    def get_rooms_for_groups(self, student_group_ids: List[str]) -> List[Classroom]:
+        """Rooms large enough for the given student groups, or all rooms if none fit."""
+        required_capacity = sum(
+            self.student_group_map[sg_id].size
+            for sg_id in student_group_ids
+            if sg_id in self.student_group_map
+        )
+        suitable_rooms = [room for room in self.rooms if room.capacity >= required_capacity]
+        return suitable_rooms if suitable_rooms else self.rooms
+
+
+class ProblemCache:
+    """Thread-safe LRU cache of CompiledProblem instances keyed by compute_problem_key."""
+
+    def __init__(self, maxsize: int = 8):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CompiledProblem]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compile(
+        self, key: str, compile_problem: Callable[[], CompiledProblem]
+    ) -> Tuple[CompiledProblem, bool]:
+        """Return the cached problem for `key` (and whether it was a hit), compiling it on a miss."""
+        with self._lock:
+            problem = self._entries.get(key)
+            if problem is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return problem, True
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent miss for the same key just compiles twice
+        problem = compile_problem()
+
+        with self._lock:
+            self._entries[key] = problem
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return problem, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
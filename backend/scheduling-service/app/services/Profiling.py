@@ -0,0 +1,105 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+
+
+@dataclass(slots=True)
+class TimingStats:
+    """Cumulative timing for one validator class or GA phase."""
+
+    total_time: float = 0.0
+    calls: int = 0
+    violations: int = 0
+
+    def add(self, elapsed: float, violations: int = 0, calls: int = 1) -> None:
+        self.total_time += elapsed
+        self.calls += calls
+        self.violations += violations
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "total_time": self.total_time,
+            "calls": self.calls,
+            "violations": self.violations,
+            "avg_time": self.total_time / self.calls if self.calls else 0.0,
+        }
+
+
+class Profiler:
+    """
+    Opt-in profiler that accumulates TimingStats by name.
+
+    Used by ScheduleFitnessEvaluator (keyed by validator class) and by GeneticScheduler
+    (keyed by GA phase). Nothing is recorded unless a Profiler is passed in, so the
+    default evaluation path stays free of timing calls.
+    """
+
+    def __init__(self):
+        self.stats: Dict[str, TimingStats] = {}
+
+    def record(self, name: str, elapsed: float, violations: int = 0, calls: int = 1) -> None:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = TimingStats()
+        stats.add(elapsed, violations, calls)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def merge(self, other: "Profiler") -> None:
+        for name, stats in other.stats.items():
+            self.record(name, stats.total_time, stats.violations, stats.calls)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Stats as plain dicts, slowest first."""
+        ordered = sorted(self.stats.items(), key=lambda item: item[1].total_time, reverse=True)
+        return {name: stats.to_dict() for name, stats in ordered}
+
+
+class ProfileStore:
+    """
+    Process-wide aggregate of profiled scheduling runs, served by /api/scheduler/metrics.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._validators = Profiler()
+        self._phases = Profiler()
+        self._runs = 0
+        self._last_run: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None
+
+    def record_run(self, validators: Profiler, phases: Profiler) -> None:
+        with self._lock:
+            self._validators.merge(validators)
+            self._phases.merge(phases)
+            self._runs += 1
+            self._last_run = {
+                "validators": validators.snapshot(),
+                "phases": phases.snapshot(),
+            }
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "profiled_runs": self._runs,
+                "validators": self._validators.snapshot(),
+                "phases": self._phases.snapshot(),
+                "last_run": self._last_run,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._validators = Profiler()
+            self._phases = Profiler()
+            self._runs = 0
+            self._last_run = None
+
+
+profile_store = ProfileStore()
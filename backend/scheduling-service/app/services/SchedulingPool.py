@@ -0,0 +1,268 @@
+import asyncio
+import logging
+import multiprocessing
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from app.models import (
+    Classroom,
+    Constraint,
+    Course,
+    ScheduledItem,
+    StudentGroup,
+    Teacher,
+    Timeslot,
+)
+from app.services.FitnessReport import FitnessReport
+from app.services.GeneticScheduler import (
+    MAX_DURATION_SECONDS,
+    GeneticScheduler,
+    OptimizationMode,
+    PopulationSizing,
+    StagnationStrategy,
+)
+from app.services.MultiObjective import ParetoSolution
+from app.services.ProblemCache import CompiledProblem, ProblemCache
+from app.services.Profiling import Profiler
+
+
+class SchedulingPoolSaturatedError(Exception):
+    """Raised when every worker is busy and the pending queue is full."""
+
+
+class SchedulingPoolShutdownError(Exception):
+    """Raised when a job is submitted while the pool is draining or stopped."""
+
+
+@dataclass(slots=True)
+class SchedulingJob:
+    """Everything a worker process needs to run the GA. Must stay picklable."""
+
+    problem_key: str
+    courses: List[Course]
+    teachers: List[Teacher]
+    rooms: List[Classroom]
+    student_groups: List[StudentGroup]
+    constraints: List[Constraint]
+    timeslots: List[Timeslot]
+    days: List[str]
+    population_size: int
+    time_limit: Optional[float]  # Seconds; None uses the scheduler's MAX_DURATION_SECONDS
+    population_sizing: PopulationSizing = PopulationSizing.FIXED
+    stagnation_strategy: StagnationStrategy = StagnationStrategy.EARLY_STOP
+    optimization_mode: OptimizationMode = OptimizationMode.SCALAR
+    seed: Optional[int] = None
+    profile: bool = False
+
+
+@dataclass(slots=True)
+class SchedulingJobResult:
+    best_schedule: List[ScheduledItem]
+    best_fitness: float
+    report: Optional[FitnessReport]
+    seed: int
+    run_duration: float
+    generations_completed: int
+    evaluations_count: int
+    population_size: int
+    problem_cache_hit: bool
+    validator_profile: Optional[Profiler] = None
+    phase_profile: Optional[Profiler] = None
+    pareto_front: Optional[List[ParetoSolution]] = None
+
+
+# Per-worker-process cache; each worker compiles a given problem at most once
+_worker_problem_cache: Optional[ProblemCache] = None
+
+
+def _init_worker(problem_cache_size: int) -> None:
+    global _worker_problem_cache
+    _worker_problem_cache = ProblemCache(maxsize=problem_cache_size)
+    # Shutdown is driven by the parent (it drains the pool), so workers must not die on the
+    # signals the container or terminal delivers to the whole process group
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+
+def _warm_up() -> None:
+    """No-op job; running it means the worker has started and imported the scheduler."""
+
+
+def run_scheduling_job(job: SchedulingJob) -> SchedulingJobResult:
+    """Worker process entry point."""
+    # The budget starts when a worker picks the job up; problem compilation counts against it
+    started = time.perf_counter()
+    compiled_problem, hit = _worker_problem_cache.get_or_compile(
+        job.problem_key,
+        lambda: CompiledProblem(
+            teachers=job.teachers,
+            rooms=job.rooms,
+            student_groups=job.student_groups,
+            courses=job.courses,
+            timeslots=job.timeslots,
+            days=job.days,
+            constraints=job.constraints,
+        ),
+    )
+    time_limit = job.time_limit if job.time_limit is not None else MAX_DURATION_SECONDS
+    time_limit = max(0.0, time_limit - (time.perf_counter() - started))
+
+    scheduler = GeneticScheduler(
+        courses=job.courses,
+        teachers=job.teachers,
+        rooms=job.rooms,
+        student_groups=job.student_groups,
+        constraints=job.constraints,
+        timeslots=job.timeslots,
+        days=job.days,
+        population_size=job.population_size,
+        time_limit=time_limit,
+        seed=job.seed,
+        profile=job.profile,
+        compiled_problem=compiled_problem,
+        population_sizing=job.population_sizing,
+        stagnation_strategy=job.stagnation_strategy,
+        optimization_mode=job.optimization_mode,
+    )
+    best_schedule, best_fitness, report = scheduler.run()
+    if report:
+        report.print_detailed_report()
+
+    return SchedulingJobResult(
+        best_schedule=best_schedule,
+        best_fitness=best_fitness,
+        report=report,
+        seed=scheduler.seed,
+        run_duration=scheduler.run_duration,
+        generations_completed=scheduler.generations_completed,
+        evaluations_count=scheduler.evaluations_count,
+        population_size=scheduler.population_size,
+        problem_cache_hit=hit,
+        validator_profile=scheduler.validator_profiler,
+        phase_profile=scheduler.phase_profiler,
+        pareto_front=scheduler.pareto_front,
+    )
+
+
+class SchedulingPool:
+    """
+    Process pool for GA runs with admission control.
+
+    The GA is pure Python, so running it in threads makes concurrent jobs share one GIL and
+    starves the event loop. Jobs run in `max_workers` spawned processes instead; up to
+    `max_pending` further jobs may wait for a free worker, anything beyond that is rejected
+    with SchedulingPoolSaturatedError. All bookkeeping happens on the event loop thread.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        problem_cache_size: int = 8,
+        on_change: Optional[Callable[["SchedulingPool"], None]] = None,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.problem_cache_size = problem_cache_size
+        self.on_change = on_change  # Called whenever the number of jobs in flight changes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._draining = False
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def active(self) -> int:
+        return min(self._in_flight, self.max_workers)
+
+    @property
+    def pending(self) -> int:
+        return max(0, self._in_flight - self.max_workers)
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        # spawn, not fork: the parent runs the event loop and Sentry threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.problem_cache_size,),
+        )
+        self._draining = False
+        logging.info(
+            f"Scheduling pool started with {self.max_workers} workers "
+            f"and {self.max_pending} pending slots"
+        )
+
+    async def warm_up(self) -> None:
+        """
+        Start every worker now so the first jobs don't wait for interpreter start-up and
+        imports. The no-op jobs are submitted together, so each one spawns a worker.
+        """
+        if self._executor is None:
+            return
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(loop.run_in_executor(self._executor, _warm_up) for _ in range(self.max_workers))
+        )
+        logging.info(f"Scheduling workers warmed up in {time.perf_counter() - started:.2f}s")
+
+    async def submit(self, job: SchedulingJob) -> SchedulingJobResult:
+        if self._draining or self._executor is None:
+            raise SchedulingPoolShutdownError("Scheduling service is shutting down")
+        if self._in_flight >= self.max_workers + self.max_pending:
+            raise SchedulingPoolSaturatedError(
+                f"All {self.max_workers} scheduling workers are busy "
+                f"and {self.max_pending} jobs are already waiting"
+            )
+
+        self._set_in_flight(self._in_flight + 1)
+        executor = self._executor
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, run_scheduling_job, job)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); the executor is unusable from now on. Every job
+            # it held fails, but only the first one to notice replaces it
+            if executor is self._executor:
+                logging.error("Scheduling worker died, restarting the pool")
+                self._restart()
+            raise
+        finally:
+            self._set_in_flight(self._in_flight - 1)
+
+    def _set_in_flight(self, value: int) -> None:
+        self._in_flight = value
+        if self.on_change is not None:
+            self.on_change(self)
+
+    def _restart(self) -> None:
+        if self._draining or self._executor is None:
+            return
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self.start()
+
+    def begin_shutdown(self) -> None:
+        """Stop admitting jobs; jobs already admitted still run to completion."""
+        if not self._draining:
+            logging.info(f"Scheduling pool draining with {self._in_flight} jobs in flight")
+        self._draining = True
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.begin_shutdown()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
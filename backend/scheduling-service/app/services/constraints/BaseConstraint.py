@@ -36,10 +36,11 @@ class ConstraintContext:
         self.timeslots = timeslots
         self.timeslot_order = timeslot_order
 
-        # State trackers for conflict detection (shared across all constraint instances)
-        self.room_tracker: Dict[Tuple[str, str, str], ScheduledItem] = {}
-        self.teacher_tracker: Dict[Tuple[str, str, str], ScheduledItem] = {}
-        self.student_group_tracker: Dict[Tuple[str, str, str], ScheduledItem] = {}
+        # State trackers for conflict detection (shared across all constraint instances).
+        # Values are the gene index of the item that first occupied the slot.
+        self.room_tracker: Dict[Tuple[str, str, str], int] = {}
+        self.teacher_tracker: Dict[Tuple[str, str, str], int] = {}
+        self.student_group_tracker: Dict[Tuple[str, str, str], int] = {}
 
         # Current gene being validated (updated for each gene)
         self.scheduled_item: Optional[ScheduledItem] = None
@@ -85,7 +86,7 @@ class BaseConstraintValidator(ABC):
         description: str,
         severity_factor: float = 1.0,
         violation_count: int = 1,
-        conflicting_item: Optional[ScheduledItem] = None,
+        conflicting_gene_index: Optional[int] = None,
     ) -> ConstraintViolation:
         """Helper method to create consistent violation objects."""
         if context.scheduled_item is None:
@@ -99,9 +100,9 @@ class BaseConstraintValidator(ABC):
             constraint_category=self.category,
             constraint_type=self.constraint_type,
             severity=penalty,
-            scheduled_item=context.scheduled_item,
+            gene_index=context.gene_index,
             description=description,
-            conflicting_item=conflicting_item,
+            conflicting_gene_index=conflicting_gene_index,
         )
 
     def _get_max_penalty_for_violation(self) -> float:
@@ -154,13 +155,13 @@ class WholeScheduleConstraintValidator(BaseConstraintValidator):
     def _create_schedule_violation(
         self,
         context: ConstraintContext,
-        scheduled_item: ScheduledItem,
+        gene_index: int,
         description: str,
         severity_factor: float = 1.0,
         violation_count: int = 1,
-        conflicting_item: Optional[ScheduledItem] = None,
+        conflicting_gene_index: Optional[int] = None,
     ) -> ConstraintViolation:
-        """Helper method to create violations for specific scheduled items in whole-schedule constraints."""
+        """Helper method to create violations for specific genes in whole-schedule constraints."""
         penalty = self.penalty_manager.get_penalty(
             self.category, violation_count=violation_count, severity_factor=severity_factor
         )
@@ -169,9 +170,9 @@ class WholeScheduleConstraintValidator(BaseConstraintValidator):
             constraint_category=self.category,
             constraint_type=self.constraint_type,
             severity=penalty,
-            scheduled_item=scheduled_item,
+            gene_index=gene_index,
             description=description,
-            conflicting_item=conflicting_item,
+            conflicting_gene_index=conflicting_gene_index,
         )
 
 
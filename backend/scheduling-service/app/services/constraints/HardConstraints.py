@@ -134,7 +134,7 @@ class WheelchairAccessibilityConstraint(StatelessConstraintValidator):
                     SchedulingConstraintCategory.STUDENT_GROUP_WHEELCHAIR_ACCESS,
                     self.constraint_type,
                     self.penalty_manager.get_penalty(SchedulingConstraintCategory.STUDENT_GROUP_WHEELCHAIR_ACCESS),
-                    item,
+                    context.gene_index,
                     f"Student group {student_group.name} needs wheelchair accessible room, but {room.name} is not accessible"
                 ))
         
@@ -166,15 +166,14 @@ class RoomConflictConstraint(StatefulConstraintValidator):
         
         # Check if room is already occupied
         if time_key in context.room_tracker:
-            conflicting_item = context.room_tracker[time_key]
             violations.append(self._create_violation(
                 context,
                 f"Room {room.name} already occupied at {item.day} {item.timeslot}",
-                conflicting_item=conflicting_item
+                conflicting_gene_index=context.room_tracker[time_key]
             ))
         else:
-            # Update tracker with current item
-            context.room_tracker[time_key] = item
+            # Update tracker with current gene
+            context.room_tracker[time_key] = context.gene_index
         
         return violations
 
@@ -199,14 +198,13 @@ class TeacherConflictConstraint(StatefulConstraintValidator):
         time_key = (item.teacherId, item.day, item.timeslot)
         
         if time_key in context.teacher_tracker:
-            conflicting_item = context.teacher_tracker[time_key]
             violations.append(self._create_violation(
                 context,
                 f"Teacher {teacher.name} already teaching at {item.day} {item.timeslot}",
-                conflicting_item=conflicting_item
+                conflicting_gene_index=context.teacher_tracker[time_key]
             ))
         else:
-            context.teacher_tracker[time_key] = item
+            context.teacher_tracker[time_key] = context.gene_index
         
         return violations
 
@@ -227,16 +225,15 @@ class StudentGroupConflictConstraint(StatefulConstraintValidator):
             time_key = (sg_id, item.day, item.timeslot)
             
             if time_key in context.student_group_tracker:
-                conflicting_item = context.student_group_tracker[time_key]
                 student_group = context.student_groups.get(sg_id)
                 sg_name = student_group.name if student_group else sg_id
                 
                 violations.append(self._create_violation(
                     context,
                     f"Student group {sg_name} already has class at {item.day} {item.timeslot}",
-                    conflicting_item=conflicting_item
+                    conflicting_gene_index=context.student_group_tracker[time_key]
                 ))
             else:
-                context.student_group_tracker[time_key] = item
+                context.student_group_tracker[time_key] = context.gene_index
         
         return violations 
\ No newline at end of file
@@ -305,15 +305,18 @@ class TeacherConsecutiveMovementConstraint(WholeScheduleConstraintValidator):
             teacher = context.teachers.get(teacher_id)
             teacher_name = teacher.name if teacher else teacher_id
             
-            for day, day_items in daily_schedule.items():
-                sorted_items = sorted(
-                    day_items, key=lambda x: context.timeslot_order.get(x.timeslot, 0)
+            for day, day_indices in daily_schedule.items():
+                sorted_indices = sorted(
+                    day_indices,
+                    key=lambda idx: context.timeslot_order.get(context.chromosome[idx].timeslot, 0),
                 )
 
                 # Check consecutive pairs
-                for i in range(len(sorted_items) - 1):
-                    current = sorted_items[i]
-                    next_item = sorted_items[i + 1]
+                for i in range(len(sorted_indices) - 1):
+                    current_index = sorted_indices[i]
+                    next_index = sorted_indices[i + 1]
+                    current = context.chromosome[current_index]
+                    next_item = context.chromosome[next_index]
 
                     # Only check if truly consecutive (no gap) and different rooms
                     are_consecutive = self._are_consecutive_timeslots(
@@ -332,12 +335,12 @@ class TeacherConsecutiveMovementConstraint(WholeScheduleConstraintValidator):
                         violations.append(
                             self._create_schedule_violation(
                                 context,
-                                next_item,
+                                next_index,
                                 f"Teacher {teacher_name} must move between consecutive classes on {day}: "
                                 f"'{current_course.name if current_course else current.courseId}' in {current_room.name if current_room else current.classroomId} "
                                 f"at {current.timeslot} → '{next_course.name if next_course else next_item.courseId}' in {next_room.name if next_room else next_item.classroomId} "
                                 f"at {next_item.timeslot}. Penalty: {penalty:.2f}",
-                                conflicting_item=current,
+                                conflicting_gene_index=current_index,
                             )
                         )
 
@@ -345,11 +348,11 @@ class TeacherConsecutiveMovementConstraint(WholeScheduleConstraintValidator):
 
     def _group_by_entity_and_day(
         self, schedule: List[ScheduledItem], entity_type: str
-    ) -> Dict[str, Dict[str, List[ScheduledItem]]]:
-        """Group schedule items by entity (teacher/student_group) and day."""
-        grouped: Dict[str, Dict[str, List[ScheduledItem]]] = {}
+    ) -> Dict[str, Dict[str, List[int]]]:
+        """Group gene indices by entity (teacher/student_group) and day."""
+        grouped: Dict[str, Dict[str, List[int]]] = {}
 
-        for item in schedule:
+        for gene_index, item in enumerate(schedule):
             entities = []
             if entity_type == "teacher":
                 entities = [item.teacherId]
@@ -361,7 +364,7 @@ class TeacherConsecutiveMovementConstraint(WholeScheduleConstraintValidator):
                     grouped[entity_id] = {}
                 if item.day not in grouped[entity_id]:
                     grouped[entity_id][item.day] = []
-                grouped[entity_id][item.day].append(item)
+                grouped[entity_id][item.day].append(gene_index)
 
         return grouped
 
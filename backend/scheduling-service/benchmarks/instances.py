@@ -0,0 +1,302 @@
+"""
+Synthetic scheduling instances for benchmarking the GA.
+
+Instances are generated as plain dicts with the same shape as `test_data.json`
+(timeslots, rooms, teachers, studentGroups, courses, constraints) so they can be
+dumped next to real extracts and loaded through the same code path.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.models import Classroom, Constraint, Course, StudentGroup, Teacher, Timeslot
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+
+SESSION_TYPES = ["LECTURE", "LAB"]
+
+
+@dataclass
+class InstanceSpec:
+    """Size parameters of a synthetic instance. Zero means "derive from num_courses"."""
+
+    num_courses: int
+    num_rooms: int = 0
+    num_student_groups: int = 0
+    num_teachers: int = 0
+    num_timeslots: int = 10
+    constraint_density: float = 0.5  # Fraction of teachers with preference constraints
+    seed: int = 0
+
+    def resolved(self) -> "InstanceSpec":
+        """Fill in derived sizes so that the instance is tight but usually feasible."""
+        slots_per_week = self.num_timeslots * len(DAYS)
+        return InstanceSpec(
+            num_courses=self.num_courses,
+            num_rooms=self.num_rooms or max(3, -(-self.num_courses * 2 // slots_per_week)),
+            num_student_groups=self.num_student_groups or max(2, self.num_courses // 4),
+            num_teachers=self.num_teachers or max(2, self.num_courses // 3),
+            num_timeslots=self.num_timeslots,
+            constraint_density=self.constraint_density,
+            seed=self.seed,
+        )
+
+
+@dataclass
+class Instance:
+    """A synthetic instance converted to the API models, ready for GeneticScheduler."""
+
+    spec: InstanceSpec
+    timeslots: List[Timeslot]
+    rooms: List[Classroom]
+    teachers: List[Teacher]
+    student_groups: List[StudentGroup]
+    courses: List[Course]
+    constraints: List[Constraint]
+    days: List[str]
+
+    @property
+    def num_genes(self) -> int:
+        return len(self.courses)
+
+
+def generate_instance_data(spec: InstanceSpec) -> Dict[str, List[Dict[str, Any]]]:
+    """Generate a synthetic instance in the `test_data.json` format."""
+    spec = spec.resolved()
+    rng = random.Random(spec.seed)
+
+    timeslots = [
+        {
+            "timeslotId": f"ts-{i + 1:02d}",
+            "code": f"{8 + i:02d}00_{9 + i:02d}00",
+            "label": f"{8 + i:02d}:00-{9 + i:02d}:00",
+            "startTime": f"{8 + i:02d}:00",
+            "endTime": f"{9 + i:02d}:00",
+            "order": i + 1,
+        }
+        for i in range(spec.num_timeslots)
+    ]
+
+    rooms = []
+    for i in range(spec.num_rooms):
+        room_type = SESSION_TYPES[i % len(SESSION_TYPES)]
+        rooms.append(
+            {
+                "classroomId": f"classroom-{i + 1:04d}",
+                "name": f"R{i + 1:04d}",
+                "capacity": rng.choice([40, 60, 80, 120, 200]) if room_type == "LECTURE" else 40,
+                "type": room_type,
+                "isWheelchairAccessible": rng.random() < 0.7,
+                "floor": rng.randint(0, 4),
+                "buildingName": f"building-{i % 5 + 1:03d}",
+            }
+        )
+
+    teachers = [
+        {
+            "teacherId": f"teacher-{i + 1}",
+            "name": f"Teacher {i + 1}",
+            "email": f"teacher{i + 1}@email.email",
+            "phone": "01234567890",
+            "needsWheelchairAccessible": rng.random() < 0.05,
+            "departmentName": f"Department {i % 4 + 1}",
+        }
+        for i in range(spec.num_teachers)
+    ]
+
+    student_groups = [
+        {
+            "studentGroupId": f"sg-{i + 1:04d}",
+            "name": f"Student Group {i + 1}",
+            "size": rng.randint(20, 60),
+            "accessibilityRequirement": rng.random() < 0.05,
+            "departmentName": f"Department {i % 4 + 1}",
+        }
+        for i in range(spec.num_student_groups)
+    ]
+
+    courses = []
+    for i in range(spec.num_courses):
+        session_type = "LAB" if rng.random() < 0.3 else "LECTURE"
+        num_groups = 1 if session_type == "LAB" else rng.randint(1, 2)
+        groups = rng.sample(student_groups, k=min(num_groups, len(student_groups)))
+        teacher = teachers[i % len(teachers)]
+        courses.append(
+            {
+                "courseId": f"course-{i + 1:05d}",
+                "name": f"Course {i + 1}",
+                "code": f"C{i + 1:05d}",
+                "description": f"Synthetic course {i + 1}",
+                "ectsCredits": rng.choice([3, 4, 5, 6, 7]),
+                "sessionType": session_type,
+                "sessionsPerWeek": 1,
+                "teacherId": teacher["teacherId"],
+                "studentGroups": [
+                    {"studentGroupId": sg["studentGroupId"], "name": sg["name"]} for sg in groups
+                ],
+            }
+        )
+
+    constraints: List[Dict[str, Any]] = [
+        {
+            "constraintTypeId": "CAMPUS_ECTS_PRIORITY",
+            "name": "ECTS Course Priority",
+            "value": {"enabled": True, "threshold": 6},
+            "priority": 8.0,
+            "teacherId": None,
+        },
+        {
+            "constraintTypeId": "CAMPUS_CONSECUTIVE_MOVEMENT",
+            "name": "Minimize Consecutive Room Movement",
+            "value": {"enabled": True, "studentPriority": 5, "teacherPriority": 7},
+            "priority": 6.0,
+            "teacherId": None,
+        },
+    ]
+    codes = [ts["code"] for ts in timeslots]
+    for teacher in teachers:
+        if rng.random() >= spec.constraint_density:
+            continue
+        constraints.append(
+            {
+                "constraintTypeId": "TEACHER_TIME_PREFERENCE",
+                "name": "Teacher Time Preference",
+                "value": {
+                    "preference": rng.choice(["PREFER", "AVOID"]),
+                    "days": rng.sample(DAYS, k=2),
+                    "timeslotCodes": rng.sample(codes, k=min(3, len(codes))),
+                },
+                "priority": round(rng.uniform(1, 10), 2),
+                "teacherId": teacher["teacherId"],
+            }
+        )
+        constraints.append(
+            {
+                "constraintTypeId": "TEACHER_ROOM_PREFERENCE",
+                "name": "Teacher Room Preference",
+                "value": {
+                    "preference": rng.choice(["PREFER", "AVOID"]),
+                    "roomIds": [r["classroomId"] for r in rng.sample(rooms, k=min(2, len(rooms)))],
+                },
+                "priority": round(rng.uniform(1, 10), 2),
+                "teacherId": teacher["teacherId"],
+            }
+        )
+
+    return {
+        "timeslots": timeslots,
+        "rooms": rooms,
+        "teachers": teachers,
+        "studentGroups": student_groups,
+        "courses": courses,
+        "constraints": constraints,
+    }
+
+
+def build_instance(
+    data: Dict[str, List[Dict[str, Any]]], spec: Optional[InstanceSpec] = None
+) -> Instance:
+    """Convert `test_data.json`-shaped data into API models."""
+    timeslots = [
+        Timeslot(
+            timeslotId=ts["timeslotId"],
+            code=ts["code"],
+            label=ts["label"],
+            startTime=ts["startTime"],
+            endTime=ts["endTime"],
+            order=ts["order"],
+        )
+        for ts in data["timeslots"]
+    ]
+    rooms = [
+        Classroom(
+            classroomId=r["classroomId"],
+            name=r["name"],
+            capacity=r["capacity"],
+            type=r["type"],
+            buildingId=r.get("buildingName", "Unknown"),
+            floor=r.get("floor", 1),
+            isWheelchairAccessible=r.get("isWheelchairAccessible", False),
+        )
+        for r in data["rooms"]
+    ]
+    teachers = [
+        Teacher(
+            teacherId=t["teacherId"],
+            name=t["name"],
+            email=t["email"],
+            phone=t.get("phone", "000-000-0000"),
+            department=t.get("departmentName", "Unknown"),
+            needsWheelchairAccessibleRoom=t.get("needsWheelchairAccessible", False),
+        )
+        for t in data["teachers"]
+    ]
+    student_groups = [
+        StudentGroup(
+            studentGroupId=sg["studentGroupId"],
+            name=sg["name"],
+            size=sg["size"],
+            department=sg.get("departmentName", "Unknown"),
+            accessibilityRequirement=sg.get("accessibilityRequirement", False),
+        )
+        for sg in data["studentGroups"]
+    ]
+
+    courses = []
+    for c in data["courses"]:
+        if "studentGroups" in c:
+            student_group_ids = [sg["studentGroupId"] for sg in c["studentGroups"]]
+        else:
+            student_group_ids = c.get("studentGroupIds", [])
+        if not c.get("teacherId") or not student_group_ids:
+            continue
+        courses.append(
+            Course(
+                courseId=c["courseId"],
+                name=c["name"],
+                description=c.get("description", ""),
+                ectsCredits=c.get("ectsCredits", 3),
+                department=c.get("department", "Unknown"),
+                teacherId=c["teacherId"],
+                sessionType=c.get("sessionType", "LECTURE"),
+                sessionsPerWeek=c.get("sessionsPerWeek", 1),
+                studentGroupIds=student_group_ids,
+            )
+        )
+
+    constraints = []
+    for i, const in enumerate(data.get("constraints", [])):
+        try:
+            constraints.append(
+                Constraint(
+                    constraintId=f"{const.get('constraintTypeId', 'unknown')}-{i}",
+                    constraintType=const["name"],
+                    teacherId=const.get("teacherId"),
+                    value=const.get("value", {}),
+                    priority=const.get("priority", 5.0),
+                    category="GENERAL",
+                )
+            )
+        except ValueError:
+            # Same as the API: constraints with invalid values are rejected, not fatal here
+            continue
+
+    if spec is None:
+        spec = InstanceSpec(num_courses=len(courses), num_timeslots=len(timeslots))
+
+    return Instance(
+        spec=spec,
+        timeslots=timeslots,
+        rooms=rooms,
+        teachers=teachers,
+        student_groups=student_groups,
+        courses=courses,
+        constraints=constraints,
+        days=DAYS,
+    )
+
+
+def generate_instance(spec: InstanceSpec) -> Instance:
+    """Generate a synthetic instance and convert it to API models."""
+    return build_instance(generate_instance_data(spec), spec.resolved())
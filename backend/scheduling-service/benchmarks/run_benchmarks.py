@@ -0,0 +1,261 @@
+"""
+Benchmark harness for the scheduling engine.
+
+Runs GeneticScheduler over synthetic instances of increasing size and several seeds,
+and writes machine-readable results that can be compared between engine versions.
+
+Usage (from backend/scheduling-service):
+
+    python -m benchmarks.run_benchmarks run --sizes 50 500 5000 --seeds 1 2 3 \\
+        --time-limit 30 --output results/current.json
+    python -m benchmarks.run_benchmarks run --instance test_data.json --seeds 1 2 3
+    python -m benchmarks.run_benchmarks compare results/baseline.json results/current.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.services.GeneticScheduler import GeneticScheduler, PopulationSizing, StagnationStrategy
+from benchmarks.instances import Instance, InstanceSpec, build_instance, generate_instance
+
+DEFAULT_SIZES = [50, 200, 1000, 5000]
+DEFAULT_SEEDS = [1, 2, 3]
+
+# Metric name -> True if higher is better. Used for the summary and for regression checks.
+METRICS = {
+    "evaluations_per_second": True,
+    "generations_per_second": True,
+    "time_to_feasible": False,
+    "final_soft_penalty": False,
+    "final_hard_violations": False,
+}
+
+
+def run_single(
+    instance: Instance, seed: int, time_limit: int, population_size: int, max_generations: int,
+    population_sizing: str = "fixed", stagnation_strategy: str = "early_stop",
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """Run the GA once and collect throughput and quality metrics."""
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        setup_start = time.perf_counter()
+        scheduler = GeneticScheduler(
+            courses=instance.courses,
+            teachers=instance.teachers,
+            rooms=instance.rooms,
+            student_groups=instance.student_groups,
+            timeslots=instance.timeslots,
+            days=instance.days,
+            constraints=instance.constraints,
+            population_size=population_size,
+            time_limit=time_limit,
+            seed=seed,
+            population_sizing=PopulationSizing(population_sizing),
+            stagnation_strategy=StagnationStrategy(stagnation_strategy),
+        )
+        setup_time = time.perf_counter() - setup_start
+        _, best_fitness, report = scheduler.run(generations=max_generations)
+
+    duration = scheduler.run_duration or 1e-9
+    return {
+        "num_genes": instance.num_genes,
+        "seed": scheduler.seed,
+        "population_size": scheduler.population_size,
+        "restarts": scheduler.restarts,
+        "setup_time": setup_time,
+        "run_duration": scheduler.run_duration,
+        "generations": scheduler.generations_completed,
+        "evaluations": scheduler.evaluations_count,
+        "evaluations_per_second": scheduler.evaluations_count / duration,
+        "generations_per_second": scheduler.generations_completed / duration,
+        "time_to_feasible": scheduler.time_to_feasible,
+        "best_fitness": best_fitness,
+        "final_hard_violations": report.total_hard_violations if report else None,
+        "final_soft_penalty": report.total_soft_penalty if report else None,
+    }
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Median of every metric across seeds. Missing values (e.g. never feasible) are skipped."""
+    summary: Dict[str, Any] = {"runs": len(runs)}
+    for metric in METRICS:
+        values = [r[metric] for r in runs if r.get(metric) is not None]
+        summary[metric] = statistics.median(values) if values else None
+    summary["feasible_runs"] = sum(1 for r in runs if r.get("time_to_feasible") is not None)
+    return summary
+
+
+def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    instances: List[Instance] = []
+    if args.instance:
+        with open(args.instance, "r") as f:
+            instances.append(build_instance(json.load(f)))
+    else:
+        for size in args.sizes:
+            instances.append(
+                generate_instance(
+                    InstanceSpec(
+                        num_courses=size,
+                        num_timeslots=args.timeslots,
+                        constraint_density=args.constraint_density,
+                        seed=args.instance_seed,
+                    )
+                )
+            )
+
+    cases = []
+    for instance in instances:
+        runs = []
+        for seed in args.seeds:
+            result = run_single(
+                instance,
+                seed=seed,
+                time_limit=args.time_limit,
+                population_size=args.population_size,
+                max_generations=args.max_generations,
+                population_sizing=args.population_sizing,
+                stagnation_strategy=args.stagnation_strategy,
+                verbose=args.verbose,
+            )
+            runs.append(result)
+            print(
+                f"genes={result['num_genes']:>5d} seed={seed:<4d} "
+                f"evals/s={result['evaluations_per_second']:8.1f} "
+                f"gens/s={result['generations_per_second']:7.2f} "
+                f"feasible@={result['time_to_feasible'] if result['time_to_feasible'] is not None else '-'} "
+                f"hard={result['final_hard_violations']} soft={result['final_soft_penalty']}"
+            )
+        cases.append(
+            {
+                "name": f"genes-{instance.num_genes}",
+                "num_genes": instance.num_genes,
+                "spec": vars(instance.spec),
+                "runs": runs,
+                "summary": summarize(runs),
+            }
+        )
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time_limit": args.time_limit,
+            "population_size": args.population_size,
+            "population_sizing": args.population_sizing,
+            "stagnation_strategy": args.stagnation_strategy,
+            "max_generations": args.max_generations,
+            "seeds": args.seeds,
+        },
+        "cases": cases,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    Compare the per-case summaries of two result files.
+
+    Returns one row per (case, metric) present in both files, with `regression` set when
+    the current value is worse than the baseline by more than `threshold` (relative).
+    """
+    baseline_cases = {case["name"]: case["summary"] for case in baseline["cases"]}
+    rows = []
+    for case in current["cases"]:
+        base_summary = baseline_cases.get(case["name"])
+        if base_summary is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old = base_summary.get(metric)
+            new = case["summary"].get(metric)
+            if old is None or new is None:
+                rows.append(
+                    {"case": case["name"], "metric": metric, "baseline": old, "current": new,
+                     "change": None, "regression": old is not None and new is None}
+                )
+                continue
+            if old:
+                change = (new - old) / abs(old)
+            else:
+                change = 0.0 if new == old else math.copysign(math.inf, new - old)
+            worse = -change if higher_is_better else change
+            rows.append(
+                {"case": case["name"], "metric": metric, "baseline": old, "current": new,
+                 "change": change, "regression": worse > threshold}
+            )
+    return rows
+
+
+def _format_value(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scheduling engine benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark suite")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                            help="Number of courses (genes) per synthetic instance")
+    run_parser.add_argument("--instance", help="Benchmark a test_data.json-style file instead")
+    run_parser.add_argument("--seeds", type=int, nargs="+", default=DEFAULT_SEEDS)
+    run_parser.add_argument("--instance-seed", type=int, default=0)
+    run_parser.add_argument("--timeslots", type=int, default=10)
+    run_parser.add_argument("--constraint-density", type=float, default=0.5)
+    run_parser.add_argument("--time-limit", type=int, default=30)
+    run_parser.add_argument("--population-size", type=int, default=100)
+    run_parser.add_argument("--population-sizing", choices=[m.value for m in PopulationSizing],
+                            default="fixed", help="auto/adaptive ignore --population-size")
+    run_parser.add_argument("--stagnation-strategy", choices=[m.value for m in StagnationStrategy],
+                            default="early_stop")
+    run_parser.add_argument("--max-generations", type=int, default=10000)
+    run_parser.add_argument("--output", help="Write results as JSON to this path")
+    run_parser.add_argument("--verbose", action="store_true", help="Show GA progress output")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="Relative change counted as a regression (default 10%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_benchmarks(args)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+            print(f"Results written to {args.output}")
+        return 0
+
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+    with open(args.current, "r") as f:
+        current = json.load(f)
+
+    rows = compare_results(baseline, current, args.threshold)
+    regressions = [row for row in rows if row["regression"]]
+    for row in rows:
+        change = "-" if row["change"] is None else f"{row['change'] * 100:+.1f}%"
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['case']:<14} {row['metric']:<24} {_format_value(row['baseline']):>12} "
+            f"{_format_value(row['current']):>12} {change:>9} {flag}"
+        )
+    print(f"{len(regressions)} regression(s) above {args.threshold * 100:.0f}%")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())